@@ -7,9 +7,21 @@ import logging
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
-
-from .const import CONF_HOST, CONF_PASSWORD, CONF_USERNAME, DOMAIN
+from homeassistant.helpers.storage import Store
+
+from .const import (
+    CONF_HOST,
+    CONF_PASSWORD,
+    CONF_USERNAME,
+    DOMAIN,
+    ENERGY_STORAGE_KEY,
+    ENERGY_STORAGE_VERSION,
+    PROFILE_STORAGE_KEY,
+    PROFILE_STORAGE_VERSION,
+)
 from .coordinator import WattboxDataUpdateCoordinator
+from .scheduler import async_get_scheduler
+from .services import async_setup_services, async_unload_services
 from .telnet_client import WattboxTelnetClient
 
 _LOGGER = logging.getLogger(__name__)
@@ -32,14 +44,26 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         password=entry.data[CONF_PASSWORD],
     )
 
-    # Create coordinator
-    coordinator = WattboxDataUpdateCoordinator(hass, entry, telnet_client)
+    # Create coordinator, polling in a slot of the shared fleet scheduler
+    scheduler = async_get_scheduler(hass)
+    scheduler.register(entry.entry_id)
+    coordinator = WattboxDataUpdateCoordinator(
+        hass, entry, telnet_client, scheduler=scheduler
+    )
 
-    # Fetch initial data
-    await coordinator.async_config_entry_first_refresh()
+    # Create entities from the stored device profile right away and revalidate
+    # in the background; without one, fetch initial data before continuing
+    await coordinator.async_load_energy()
+    if await coordinator.async_load_profile():
+        entry.async_create_background_task(
+            hass, coordinator.async_refresh(), f"{DOMAIN}_refresh_{entry.entry_id}"
+        )
+    else:
+        await coordinator.async_config_entry_first_refresh()
 
     # Store coordinator
     hass.data[DOMAIN][entry.entry_id] = coordinator
+    async_setup_services(hass)
 
     # Set up platforms
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
@@ -47,6 +71,16 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return True
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the stored device profile and energy when an entry is deleted."""
+    for version, key in (
+        (PROFILE_STORAGE_VERSION, PROFILE_STORAGE_KEY),
+        (ENERGY_STORAGE_VERSION, ENERGY_STORAGE_KEY),
+    ):
+        store: Store = Store(hass, version, f"{key}.{entry.entry_id}")
+        await store.async_remove()
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     # Unload platforms
@@ -57,5 +91,7 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         coordinator = hass.data[DOMAIN][entry.entry_id]
         await coordinator.async_disconnect()
         del hass.data[DOMAIN][entry.entry_id]
+    async_get_scheduler(hass).unregister(entry.entry_id)
+    async_unload_services(hass)
 
     return unload_ok
@@ -42,6 +42,15 @@ async def async_setup_entry(
         WattboxSafeVoltageBinarySensor(coordinator, config_entry.entry_id),
         WattboxUPSConnectedBinarySensor(coordinator, config_entry.entry_id),
         WattboxUPSPowerLostBinarySensor(coordinator, config_entry.entry_id),
+        WattboxVoltageEventBinarySensor(
+            coordinator, config_entry.entry_id, "sag", "Voltage Sag"
+        ),
+        WattboxVoltageEventBinarySensor(
+            coordinator, config_entry.entry_id, "swell", "Voltage Swell"
+        ),
+        WattboxVoltageEventBinarySensor(
+            coordinator, config_entry.entry_id, "brownout", "Brownout"
+        ),
     ]
 
     # Filter out any None sensors and ensure we have a list
@@ -76,13 +85,14 @@ class WattboxStatusBinarySensor(WattboxDeviceEntity, BinarySensorEntity):
         super().__init__(coordinator, {}, f"{entry_id}_status")
         self._attr_name = "Device Status"
         self._attr_device_class = "connectivity"
+        self._coordinator_keys = ("connected",)
 
     @property
     def is_on(self) -> bool | None:
         """Return true if the device is online."""
         if not self.coordinator.data:
             return False
-        return self.coordinator.data.get("connected", False)
+        return self.coordinator.data.connected
 
 
 class WattboxPowerLostBinarySensor(WattboxDeviceEntity, BinarySensorEntity):
@@ -97,17 +107,16 @@ class WattboxPowerLostBinarySensor(WattboxDeviceEntity, BinarySensorEntity):
         super().__init__(coordinator, {}, f"{entry_id}_power_lost")
         self._attr_name = "Power Lost"
         self._attr_device_class = "power"
+        self._coordinator_keys = ("connected", "ups.power_lost")
 
     @property
     def is_on(self) -> bool | None:
         """Return true if power has been lost."""
         if not self.coordinator.data:
             return False
-        if not self.coordinator.data.get("connected", False):
+        if not self.coordinator.data.connected:
             return None
-        status_info = self.coordinator.data.get("status_info", {})
-        ups_status = status_info.get("ups_status", {})
-        return ups_status.get("power_lost", False)
+        return bool(self.coordinator.data.ups.power_lost)
 
 
 class WattboxSafeVoltageBinarySensor(WattboxDeviceEntity, BinarySensorEntity):
@@ -122,17 +131,19 @@ class WattboxSafeVoltageBinarySensor(WattboxDeviceEntity, BinarySensorEntity):
         super().__init__(coordinator, {}, f"{entry_id}_safe_voltage")
         self._attr_name = "Safe Voltage"
         self._attr_device_class = "voltage"
+        self._coordinator_keys = (
+            "connected",
+            "power.safe_voltage",
+        )
 
     @property
     def is_on(self) -> bool | None:
         """Return true if voltage is safe."""
         if not self.coordinator.data:
             return False
-        if not self.coordinator.data.get("connected", False):
+        if not self.coordinator.data.connected:
             return None
-        status_info = self.coordinator.data.get("status_info", {})
-        power_status = status_info.get("power_status", {})
-        safe_voltage = power_status.get("safe_voltage")
+        safe_voltage = self.coordinator.data.power.safe_voltage
         if safe_voltage is None:
             return None
         return bool(safe_voltage)
@@ -150,16 +161,16 @@ class WattboxUPSConnectedBinarySensor(WattboxDeviceEntity, BinarySensorEntity):
         super().__init__(coordinator, {}, f"{entry_id}_ups_connected")
         self._attr_name = "UPS Connected"
         self._attr_device_class = "connectivity"
+        self._coordinator_keys = ("connected", "ups.connected")
 
     @property
     def is_on(self) -> bool | None:
         """Return true if UPS is connected."""
         if not self.coordinator.data:
             return False
-        if not self.coordinator.data.get("connected", False):
+        if not self.coordinator.data.connected:
             return None
-        status_info = self.coordinator.data.get("status_info", {})
-        return status_info.get("ups_connected", False)
+        return bool(self.coordinator.data.ups.connected)
 
 
 class WattboxUPSPowerLostBinarySensor(WattboxDeviceEntity, BinarySensorEntity):
@@ -174,14 +185,40 @@ class WattboxUPSPowerLostBinarySensor(WattboxDeviceEntity, BinarySensorEntity):
         super().__init__(coordinator, {}, f"{entry_id}_ups_power_lost")
         self._attr_name = "UPS Power Lost"
         self._attr_device_class = "power"
+        self._coordinator_keys = ("connected", "ups.power_lost")
 
     @property
     def is_on(self) -> bool | None:
         """Return true if UPS power has been lost."""
         if not self.coordinator.data:
             return False
-        if not self.coordinator.data.get("connected", False):
+        if not self.coordinator.data.connected:
+            return None
+        return bool(self.coordinator.data.ups.power_lost)
+
+
+class WattboxVoltageEventBinarySensor(WattboxDeviceEntity, BinarySensorEntity):
+    """On while a voltage sag, swell or brownout is ongoing."""
+
+    def __init__(
+        self,
+        coordinator: WattboxDataUpdateCoordinator,
+        entry_id: str,
+        event: str,
+        name: str,
+    ) -> None:
+        """Initialize the voltage event binary sensor."""
+        super().__init__(coordinator, {}, f"{entry_id}_voltage_{event}")
+        self._event = event
+        self._attr_name = name
+        self._attr_device_class = "problem"
+        self._coordinator_keys = ("connected", f"quality.{event}")
+
+    @property
+    def is_on(self) -> bool | None:
+        """Return true while the event is ongoing."""
+        if not self.coordinator.data:
+            return False
+        if not self.coordinator.data.connected:
             return None
-        status_info = self.coordinator.data.get("status_info", {})
-        ups_status = status_info.get("ups_status", {})
-        return ups_status.get("power_lost", False)
+        return getattr(self.coordinator.data.quality, self._event)
@@ -12,12 +12,39 @@ from homeassistant.data_entry_flow import FlowResult
 from homeassistant.exceptions import HomeAssistantError
 
 from .const import (
+    CONF_ADAPTIVE_POLLING,
+    CONF_MAX_POLLING_INTERVAL,
+    CONF_MIN_POLLING_INTERVAL,
+    CONF_NAMES_POLLING_INTERVAL,
+    CONF_NOMINAL_VOLTAGE,
+    CONF_OUTLET_POWER_ENABLED_ONLY,
     CONF_POLLING_INTERVAL,
+    CONF_SHED_MAX_CURRENT,
+    CONF_SHED_MIN_RUNTIME,
+    CONF_SHED_ON_BATTERY,
+    CONF_SHED_PRIORITIES,
+    CONF_STATISTICS_WINDOW,
+    CONF_UPS_POLLING_INTERVAL,
+    CONF_UPS_POWER_LOST_INTERVAL,
+    DEFAULT_ADAPTIVE_POLLING,
+    DEFAULT_MAX_POLLING_INTERVAL,
+    DEFAULT_MIN_POLLING_INTERVAL,
+    DEFAULT_NAMES_POLLING_INTERVAL,
+    DEFAULT_NOMINAL_VOLTAGE,
+    DEFAULT_OUTLET_POWER_ENABLED_ONLY,
     DEFAULT_PASSWORD,
     DEFAULT_POLLING_INTERVAL,
+    DEFAULT_SHED_MAX_CURRENT,
+    DEFAULT_SHED_MIN_RUNTIME,
+    DEFAULT_SHED_ON_BATTERY,
+    DEFAULT_SHED_PRIORITIES,
+    DEFAULT_STATISTICS_WINDOW,
+    DEFAULT_UPS_POLLING_INTERVAL,
+    DEFAULT_UPS_POWER_LOST_INTERVAL,
     DEFAULT_USERNAME,
     DOMAIN,
 )
+from .load_shedding import parse_priorities
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -29,6 +56,39 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
         vol.Optional(CONF_POLLING_INTERVAL, default=DEFAULT_POLLING_INTERVAL): vol.All(
             vol.Coerce(int), vol.Range(min=5, max=300)
         ),
+        vol.Optional(
+            CONF_NAMES_POLLING_INTERVAL, default=DEFAULT_NAMES_POLLING_INTERVAL
+        ): vol.All(vol.Coerce(int), vol.Range(min=30, max=3600)),
+        vol.Optional(
+            CONF_UPS_POLLING_INTERVAL, default=DEFAULT_UPS_POLLING_INTERVAL
+        ): vol.All(vol.Coerce(int), vol.Range(min=5, max=3600)),
+        vol.Optional(
+            CONF_UPS_POWER_LOST_INTERVAL, default=DEFAULT_UPS_POWER_LOST_INTERVAL
+        ): vol.All(vol.Coerce(int), vol.Range(min=1, max=300)),
+        vol.Optional(
+            CONF_OUTLET_POWER_ENABLED_ONLY, default=DEFAULT_OUTLET_POWER_ENABLED_ONLY
+        ): bool,
+        vol.Optional(CONF_ADAPTIVE_POLLING, default=DEFAULT_ADAPTIVE_POLLING): bool,
+        vol.Optional(
+            CONF_MIN_POLLING_INTERVAL, default=DEFAULT_MIN_POLLING_INTERVAL
+        ): vol.All(vol.Coerce(int), vol.Range(min=1, max=60)),
+        vol.Optional(
+            CONF_MAX_POLLING_INTERVAL, default=DEFAULT_MAX_POLLING_INTERVAL
+        ): vol.All(vol.Coerce(int), vol.Range(min=10, max=3600)),
+        vol.Optional(
+            CONF_STATISTICS_WINDOW, default=DEFAULT_STATISTICS_WINDOW
+        ): vol.All(vol.Coerce(int), vol.Range(min=60, max=3600)),
+        vol.Optional(CONF_NOMINAL_VOLTAGE, default=DEFAULT_NOMINAL_VOLTAGE): vol.All(
+            vol.Coerce(int), vol.Range(min=100, max=250)
+        ),
+        vol.Optional(CONF_SHED_PRIORITIES, default=DEFAULT_SHED_PRIORITIES): str,
+        vol.Optional(CONF_SHED_ON_BATTERY, default=DEFAULT_SHED_ON_BATTERY): bool,
+        vol.Optional(CONF_SHED_MIN_RUNTIME, default=DEFAULT_SHED_MIN_RUNTIME): vol.All(
+            vol.Coerce(int), vol.Range(min=0, max=600)
+        ),
+        vol.Optional(CONF_SHED_MAX_CURRENT, default=DEFAULT_SHED_MAX_CURRENT): vol.All(
+            vol.Coerce(float), vol.Range(min=0, max=100)
+        ),
     }
 )
 
@@ -54,6 +114,13 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         errors = {}
 
+        error = self._validate_priorities(user_input, None)
+        if error:
+            errors[CONF_SHED_PRIORITIES] = error
+            return self.async_show_form(
+                step_id="user", data_schema=STEP_USER_DATA_SCHEMA, errors=errors
+            )
+
         try:
             await self._test_connection(user_input)
         except CannotConnect:
@@ -64,6 +131,13 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             _LOGGER.exception("Unexpected exception")
             errors["base"] = "unknown"
 
+        if not errors:
+            error = self._validate_priorities(
+                user_input, self._device_info.get("outlet_count")
+            )
+            if error:
+                errors[CONF_SHED_PRIORITIES] = error
+
         if not errors:
             # Create a better title using device information
             title = self._create_device_title(user_input[CONF_HOST])
@@ -73,6 +147,24 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             step_id="user", data_schema=STEP_USER_DATA_SCHEMA, errors=errors
         )
 
+    @staticmethod
+    def _validate_priorities(
+        user_input: dict[str, Any], outlet_count: int | None
+    ) -> str | None:
+        """Return an error key if the load shedding priority map is invalid.
+
+        Without an outlet count only the syntax is checked; once the device
+        has been read, outlets it does not have are rejected too.
+        """
+        try:
+            parse_priorities(
+                user_input.get(CONF_SHED_PRIORITIES, DEFAULT_SHED_PRIORITIES),
+                outlet_count,
+            )
+        except ValueError:
+            return "invalid_shed_priorities"
+        return None
+
     async def _test_connection(self, user_input: dict[str, Any]) -> None:
         """Test connection to the device."""
         from .telnet_client import (
@@ -90,11 +182,16 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         try:
             await telnet_client.async_connect()
             # Get device information for better naming
-            await telnet_client.async_get_device_info()
+            device = await telnet_client.async_get_device_info()
             await telnet_client.async_disconnect()
 
             # Store device info for use in entry title
-            self._device_info = telnet_client.device_data.get("device_info", {})
+            self._device_info = {
+                "hostname": device.hostname,
+                "model": device.model,
+                "serial_number": device.serial_number,
+                "outlet_count": device.outlet_count,
+            }
         except WattboxAuthenticationError as err:
             _LOGGER.error("Authentication failed: %s", err)
             raise InvalidAuth from err
@@ -13,11 +13,76 @@ CONF_HOST: Final[str] = "host"
 CONF_USERNAME: Final[str] = "username"
 CONF_PASSWORD: Final[str] = "password"
 CONF_POLLING_INTERVAL: Final[str] = "polling_interval"
+CONF_NAMES_POLLING_INTERVAL: Final[str] = "names_polling_interval"
+CONF_UPS_POLLING_INTERVAL: Final[str] = "ups_polling_interval"
+CONF_UPS_POWER_LOST_INTERVAL: Final[str] = "ups_power_lost_interval"
+CONF_OUTLET_POWER_ENABLED_ONLY: Final[str] = "outlet_power_enabled_only"
+CONF_ADAPTIVE_POLLING: Final[str] = "adaptive_polling"
+CONF_MIN_POLLING_INTERVAL: Final[str] = "min_polling_interval"
+CONF_MAX_POLLING_INTERVAL: Final[str] = "max_polling_interval"
+CONF_STATISTICS_WINDOW: Final[str] = "statistics_window"
+CONF_NOMINAL_VOLTAGE: Final[str] = "nominal_voltage"
+CONF_SHED_PRIORITIES: Final[str] = "shed_priorities"
+CONF_SHED_ON_BATTERY: Final[str] = "shed_on_battery"
+CONF_SHED_MIN_RUNTIME: Final[str] = "shed_min_runtime"
+CONF_SHED_MAX_CURRENT: Final[str] = "shed_max_current"
 
 # Default values
 DEFAULT_POLLING_INTERVAL: Final[int] = 30  # seconds
+DEFAULT_NAMES_POLLING_INTERVAL: Final[int] = 300  # seconds
+DEFAULT_UPS_POLLING_INTERVAL: Final[int] = DEFAULT_POLLING_INTERVAL
+DEFAULT_UPS_POWER_LOST_INTERVAL: Final[int] = 2  # seconds
 DEFAULT_USERNAME: Final[str] = "wattbox"
 DEFAULT_PASSWORD: Final[str] = "wattbox"
+DEFAULT_OUTLET_COUNT: Final[int] = 18  # 800 series
+DEFAULT_OUTLET_POWER_ENABLED_ONLY: Final[bool] = False
+DEFAULT_ADAPTIVE_POLLING: Final[bool] = False
+DEFAULT_MIN_POLLING_INTERVAL: Final[int] = 3  # seconds
+DEFAULT_MAX_POLLING_INTERVAL: Final[int] = 120  # seconds
+DEFAULT_STATISTICS_WINDOW: Final[int] = 300  # seconds
+DEFAULT_NOMINAL_VOLTAGE: Final[int] = 120  # volts
+DEFAULT_SHED_PRIORITIES: Final[str] = ""  # no outlets are shed
+DEFAULT_SHED_ON_BATTERY: Final[bool] = False
+DEFAULT_SHED_MIN_RUNTIME: Final[int] = 0  # minutes; 0 disables the rule
+DEFAULT_SHED_MAX_CURRENT: Final[float] = 0.0  # amps; 0 disables the rule
+
+# Adaptive polling
+ADAPTIVE_CHANGE_THRESHOLD: Final[float] = 0.05  # relative change in a reading
+ADAPTIVE_BACKOFF_FACTOR: Final[float] = 1.5
+
+# Device profile storage
+PROFILE_STORAGE_KEY: Final[str] = f"{DOMAIN}.profile"
+PROFILE_STORAGE_VERSION: Final[int] = 1
+
+# Energy integration
+ENERGY_STORAGE_KEY: Final[str] = f"{DOMAIN}.energy"
+ENERGY_STORAGE_VERSION: Final[int] = 1
+ENERGY_SAVE_DELAY: Final[int] = 60  # seconds between energy writes to storage
+ENERGY_MAX_GAP: Final[int] = 600  # seconds; longer gaps are not integrated
+ENERGY_GAP_FACTOR: Final[int] = 2  # status intervals always integrated across
+
+# Power quality, as fractions of the nominal voltage
+POWER_QUALITY_SAG_RATIO: Final[float] = 0.9
+POWER_QUALITY_SWELL_RATIO: Final[float] = 1.1
+# An undervoltage lasting longer than this is a brownout rather than a sag
+POWER_QUALITY_BROWNOUT_DURATION: Final[int] = 60  # seconds
+
+# Load shedding trigger reasons
+SHED_REASON_ON_BATTERY: Final[str] = "on_battery"
+SHED_REASON_LOW_RUNTIME: Final[str] = "low_runtime"
+SHED_REASON_OVERCURRENT: Final[str] = "overcurrent"
+
+# Telemetry history
+TELEMETRY_CAPACITY: Final[int] = 720  # samples, 6 hours at the default interval
+TELEMETRY_METRICS: Final[tuple[str, ...]] = ("voltage", "current", "power")
+# Changed key reported when a sample is recorded
+TELEMETRY_KEY: Final[str] = "telemetry"
+# Resolutions of the history included in diagnostics
+DIAGNOSTICS_WINDOWS: Final[tuple[int, ...]] = (60, 300, 900)
+
+# Fleet poll scheduling (shared by all config entries)
+DATA_SCHEDULER: Final[str] = "scheduler"
+MAX_CONCURRENT_POLLS: Final[int] = 4
 
 # Telnet configuration
 TELNET_PORT: Final[int] = 23
@@ -35,8 +100,19 @@ TELNET_CMD_AUTO_REBOOT: Final[str] = "?AutoReboot"
 TELNET_CMD_MUTE: Final[str] = "?Mute"
 TELNET_CMD_SAFE_VOLTAGE: Final[str] = "?SafeVoltage"
 TELNET_CMD_POWER_STATUS: Final[str] = "?PowerStatus"
+TELNET_CMD_OUTLET_POWER_STATUS: Final[str] = "?OutletPowerStatus"
 TELNET_CMD_UPS_STATUS: Final[str] = "?UPSStatus"
 TELNET_CMD_UPS_CONNECTION: Final[str] = "?UPSConnection"
+TELNET_CMD_NETWORK: Final[str] = "?NetworkGet"
+TELNET_CMD_ADAPTER_SENSOR_DATA: Final[str] = "?AdapterSensorData"
+
+# Polled queries some models or firmware versions answer with #Error. UPS
+# queries are left out: their answer depends on whether a UPS is attached
+# right now, not on the model or firmware.
+CAPABILITY_PROBE_COMMANDS: Final[tuple[str, ...]] = (
+    TELNET_CMD_POWER_STATUS,
+    f"{TELNET_CMD_OUTLET_POWER_STATUS}=1",
+)
 
 # HTTP endpoints (for power monitoring)
 HTTP_ENDPOINT_STATUS: Final[str] = "/status.xml"
@@ -44,16 +120,47 @@ HTTP_ENDPOINT_MAIN: Final[str] = "/"
 
 # Telnet control commands
 TELNET_CMD_OUTLET_SET: Final[str] = "!OutletSet"
+OUTLET_ACTION_ON: Final[str] = "on"
+OUTLET_ACTION_OFF: Final[str] = "off"
+OUTLET_ACTION_TOGGLE: Final[str] = "toggle"
+OUTLET_ACTION_RESET: Final[str] = "reset"
+OUTLET_ACTIONS: Final[tuple[str, ...]] = (
+    OUTLET_ACTION_ON,
+    OUTLET_ACTION_OFF,
+    OUTLET_ACTION_TOGGLE,
+    OUTLET_ACTION_RESET,
+)
+# Outlet 0 addresses every outlet, which the device only accepts for RESET
+OUTLET_ALL: Final[int] = 0
 
 # Telnet prompts
 TELNET_USERNAME_PROMPT: Final[str] = "Username: "
 TELNET_PASSWORD_PROMPT: Final[str] = "Password: "
 TELNET_LOGIN_SUCCESS: Final[str] = "Successfully Logged In!"
 
+# Telnet response framing
+TELNET_LINE_TERMINATOR: Final[str] = "\n"
+TELNET_RESPONSE_OK: Final[str] = "OK"
+TELNET_RESPONSE_ERROR: Final[str] = "#Error"
+TELNET_UNSOLICITED_PREFIX: Final[str] = "~"
+TELNET_READ_CHUNK_SIZE: Final[int] = 1024
+# Longest record kept while waiting for its line terminator; longer ones are
+# dropped up to the next terminator
+TELNET_MAX_FRAME_SIZE: Final[int] = 8192
+
+# Command channel priorities (lower runs first)
+COMMAND_PRIORITY_CONTROL: Final[int] = 0
+COMMAND_PRIORITY_TELEMETRY: Final[int] = 1
+
 # Device information
 DEVICE_MANUFACTURER: Final[str] = "SnapAV"
 DEVICE_MODEL: Final[str] = "Wattbox 800 Series"
 
+# Services
+SERVICE_SET_OUTLETS: Final[str] = "set_outlets"
+ATTR_ENTRY_ID: Final[str] = "entry_id"
+ATTR_OUTLETS: Final[str] = "outlets"
+
 # Entity attributes
 ATTR_OUTLET_NUMBER: Final[str] = "outlet_number"
 ATTR_VOLTAGE: Final[str] = "voltage"
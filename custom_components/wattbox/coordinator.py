@@ -3,20 +3,160 @@
 from __future__ import annotations
 
 import logging
+import time
+from dataclasses import fields, is_dataclass
 from datetime import timedelta
-from typing import Any
+from typing import Any, Callable, Iterable, Mapping
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .const import CONF_POLLING_INTERVAL, DEFAULT_POLLING_INTERVAL, DOMAIN
-from .telnet_client import WattboxConnectionError, WattboxTelnetClient
+from .const import (
+    ADAPTIVE_BACKOFF_FACTOR,
+    ADAPTIVE_CHANGE_THRESHOLD,
+    CAPABILITY_PROBE_COMMANDS,
+    CONF_ADAPTIVE_POLLING,
+    CONF_MAX_POLLING_INTERVAL,
+    CONF_MIN_POLLING_INTERVAL,
+    CONF_NAMES_POLLING_INTERVAL,
+    CONF_NOMINAL_VOLTAGE,
+    CONF_OUTLET_POWER_ENABLED_ONLY,
+    CONF_POLLING_INTERVAL,
+    CONF_STATISTICS_WINDOW,
+    CONF_UPS_POLLING_INTERVAL,
+    CONF_UPS_POWER_LOST_INTERVAL,
+    DEFAULT_ADAPTIVE_POLLING,
+    DEFAULT_MAX_POLLING_INTERVAL,
+    DEFAULT_MIN_POLLING_INTERVAL,
+    DEFAULT_NAMES_POLLING_INTERVAL,
+    DEFAULT_NOMINAL_VOLTAGE,
+    DEFAULT_OUTLET_COUNT,
+    DEFAULT_OUTLET_POWER_ENABLED_ONLY,
+    DEFAULT_POLLING_INTERVAL,
+    DEFAULT_STATISTICS_WINDOW,
+    DEFAULT_UPS_POLLING_INTERVAL,
+    DEFAULT_UPS_POWER_LOST_INTERVAL,
+    DOMAIN,
+    ENERGY_GAP_FACTOR,
+    ENERGY_MAX_GAP,
+    ENERGY_SAVE_DELAY,
+    ENERGY_STORAGE_KEY,
+    ENERGY_STORAGE_VERSION,
+    OUTLET_ACTION_OFF,
+    OUTLET_ACTION_ON,
+    PROFILE_STORAGE_KEY,
+    PROFILE_STORAGE_VERSION,
+    TELEMETRY_KEY,
+)
+from .energy import WattboxEnergyMeter
+from .load_shedding import LoadShedder
+from .models import (
+    DeviceIdentity,
+    EnergyTotals,
+    OutletState,
+    PowerQuality,
+    PowerStatus,
+    UPSStatus,
+    WattboxSnapshot,
+    evolve,
+    replace_outlet,
+)
+from .power_quality import PowerQualityMonitor
+from .scheduler import WattboxPollScheduler
+from .singleflight import SingleFlight
+from .telemetry import TelemetryBuffer
+from .telnet_client import (
+    WattboxConnectionError,
+    WattboxTelnetClient,
+    WattboxTelnetError,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+# Queries a stored capability probe may mark as unsupported
+_PROBED_COMMANDS = frozenset(
+    command.split("=", 1)[0] for command in CAPABILITY_PROBE_COMMANDS
+)
 
-class WattboxDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
+_MISSING = object()
+
+# Polling tiers. Device identity is fetched once per connection; the others
+# are fetched whenever their own interval has elapsed.
+TIER_STATUS = "status"  # outlet states and ?PowerStatus
+TIER_NAMES = "names"  # outlet names
+TIER_UPS = "ups"  # UPS connection and status
+
+# Device identity fields kept in the stored profile
+_PROFILE_DEVICE_FIELDS = (
+    "hardware_version",
+    "model",
+    "serial_number",
+    "hostname",
+    "outlet_count",
+)
+
+
+def _readings_moved(previous: tuple, current: tuple) -> bool:
+    """Return True if any reading changed by more than the adaptive threshold."""
+    if len(previous) != len(current):
+        return True
+    for old, new in zip(previous, current):
+        if old is None or new is None:
+            if old != new:
+                return True
+            continue
+        if abs(new - old) > ADAPTIVE_CHANGE_THRESHOLD * max(abs(old), abs(new), 1.0):
+            return True
+    return False
+
+
+def _diff(old: Any, new: Any, prefix: str, out: set[str]) -> bool:
+    """Add the dotted keys that differ between two snapshots to ``out``.
+
+    Records are compared field by field and tuples item by item, numbered
+    from 1 so outlet keys match outlet numbers, e.g. ``outlets.7.state``.
+    Shared objects are skipped without looking inside. Returns True if
+    anything under ``prefix`` changed; changed parents are added too.
+    """
+    if old is new:
+        return False
+    if is_dataclass(new) and type(old) is type(new):
+        changed = False
+        for field in fields(new):
+            key = f"{prefix}.{field.name}" if prefix else field.name
+            changed |= _diff(
+                getattr(old, field.name), getattr(new, field.name), key, out
+            )
+    elif isinstance(old, tuple) and isinstance(new, tuple):
+        changed = False
+        for index in range(max(len(old), len(new))):
+            changed |= _diff(
+                old[index] if index < len(old) else _MISSING,
+                new[index] if index < len(new) else _MISSING,
+                f"{prefix}.{index + 1}",
+                out,
+            )
+    else:
+        changed = old != new
+    if changed and prefix:
+        out.add(prefix)
+    return changed
+
+
+def _outlets_off(
+    numbers: Iterable[int], outlets: tuple[OutletState, ...]
+) -> tuple[int, ...]:
+    """Return which of the given outlets are confirmed off."""
+    return tuple(
+        number
+        for number in numbers
+        if 1 <= number <= len(outlets) and outlets[number - 1].state == 0
+    )
+
+
+class WattboxDataUpdateCoordinator(DataUpdateCoordinator[WattboxSnapshot]):
     """Class to manage fetching data from the Wattbox device."""
 
     def __init__(
@@ -24,15 +164,94 @@ class WattboxDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         hass: HomeAssistant,
         config_entry: ConfigEntry,
         telnet_client: WattboxTelnetClient,
+        scheduler: WattboxPollScheduler | None = None,
     ) -> None:
         """Initialize the coordinator."""
         self.telnet_client = telnet_client
         self.config_entry = config_entry
+        self._scheduler = scheduler
 
-        # Get polling interval from config
+        # Get polling intervals from config
         polling_interval = config_entry.data.get(
             CONF_POLLING_INTERVAL, DEFAULT_POLLING_INTERVAL
         )
+        self._tier_intervals: dict[str, float] = {
+            TIER_STATUS: polling_interval,
+            TIER_NAMES: config_entry.data.get(
+                CONF_NAMES_POLLING_INTERVAL, DEFAULT_NAMES_POLLING_INTERVAL
+            ),
+            TIER_UPS: config_entry.data.get(
+                CONF_UPS_POLLING_INTERVAL, DEFAULT_UPS_POLLING_INTERVAL
+            ),
+        }
+        self._ups_power_lost_interval: float = config_entry.data.get(
+            CONF_UPS_POWER_LOST_INTERVAL, DEFAULT_UPS_POWER_LOST_INTERVAL
+        )
+        self._last_fetch: dict[str, float] = {}
+        self._device_info: DeviceIdentity | None = None
+        self._power_lost = False
+        self._profile_store: Store = Store(
+            hass,
+            PROFILE_STORAGE_VERSION,
+            f"{PROFILE_STORAGE_KEY}.{config_entry.entry_id}",
+        )
+        self._profile: dict[str, Any] | None = None
+        # Unsupported queries found by the capability probe, keyed by the
+        # serial number and firmware they were probed on
+        self._capabilities: dict[str, Any] | None = None
+        self._energy_store: Store = Store(
+            hass,
+            ENERGY_STORAGE_VERSION,
+            f"{ENERGY_STORAGE_KEY}.{config_entry.entry_id}",
+        )
+        # Recent power status readings, for rolling statistics and diagnostics
+        self.telemetry = TelemetryBuffer()
+        self._telemetry_recorded = 0
+        self.statistics_window: float = config_entry.data.get(
+            CONF_STATISTICS_WINDOW, DEFAULT_STATISTICS_WINDOW
+        )
+        self._power_quality = PowerQualityMonitor(
+            config_entry.data.get(CONF_NOMINAL_VOLTAGE, DEFAULT_NOMINAL_VOLTAGE)
+        )
+        # True while voltage is out of band, which polls status faster
+        self._voltage_event = False
+        # Some models always report 0, so the flag only counts once seen at 1
+        self._safe_voltage_reported = False
+        # The shedding plan is built once, ready to send the moment it triggers
+        self.load_shedder = LoadShedder.from_config(config_entry.data)
+        self._outlet_power_enabled_only: bool = config_entry.data.get(
+            CONF_OUTLET_POWER_ENABLED_ONLY, DEFAULT_OUTLET_POWER_ENABLED_ONLY
+        )
+        self._adaptive: bool = config_entry.data.get(
+            CONF_ADAPTIVE_POLLING, DEFAULT_ADAPTIVE_POLLING
+        )
+        self._min_interval: float = config_entry.data.get(
+            CONF_MIN_POLLING_INTERVAL, DEFAULT_MIN_POLLING_INTERVAL
+        )
+        self._max_interval: float = config_entry.data.get(
+            CONF_MAX_POLLING_INTERVAL, DEFAULT_MAX_POLLING_INTERVAL
+        )
+        self._last_readings: tuple[tuple, tuple] | None = None
+        if self._adaptive:
+            self._tier_intervals[TIER_STATUS] = min(
+                max(polling_interval, self._min_interval), self._max_interval
+            )
+        # Gaps up to the longest status interval are integrated, with room for
+        # scheduler slots stretching it; failed polls interrupt the meter
+        longest_status_interval = (
+            self._max_interval if self._adaptive else self._tier_intervals[TIER_STATUS]
+        )
+        self._energy = WattboxEnergyMeter(
+            max(ENERGY_MAX_GAP, ENERGY_GAP_FACTOR * longest_status_interval)
+        )
+        # Keys changed by the latest update (None means everything changed)
+        self.changed_keys: frozenset[str] | None = None
+        self._snapshot: WattboxSnapshot | None = None
+        self._snapshot_success: bool | None = None
+        # The update in flight, shared by concurrent refreshes
+        self._updates = SingleFlight()
+        # Outlet number -> number of enabled per-outlet power entities
+        self._outlet_power_entities: dict[int, int] = {}
 
         super().__init__(
             hass,
@@ -41,55 +260,496 @@ class WattboxDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             update_interval=timedelta(seconds=polling_interval),
         )
 
-    async def _async_update_data(self) -> dict[str, Any]:
-        """Update data via library."""
+        # Publish outlet changes pushed by the device without waiting for a poll
+        self._remove_outlet_status_listener = telnet_client.add_outlet_status_listener(
+            self._publish_outlet_info
+        )
+
+    async def _async_update_data(self) -> WattboxSnapshot:
+        """Update data, sharing one update between concurrent refreshes."""
+        return await self._updates.async_do(None, self._async_scheduled_update)
+
+    async def _async_scheduled_update(self) -> WattboxSnapshot:
+        """Update data, within a fleet poll slot when scheduled."""
+        if self._scheduler is None:
+            return await self._async_fetch_tiers()
+        async with self._scheduler.async_poll(self.config_entry.entry_id):
+            return await self._async_fetch_tiers()
+
+    async def _async_fetch_tiers(self) -> WattboxSnapshot:
+        """Update data via library, fetching only the tiers that are due."""
         try:
             # Ensure we're connected
             if not self.telnet_client.is_connected:
                 await self.telnet_client.async_connect()
+                # Identity is re-read once per connection
+                self._device_info = None
+                self._energy.interrupt()
 
-            # Get device info
-            device_info = await self.telnet_client.async_get_device_info()
+            if self._device_info is None:
+                device_info = await self.telnet_client.async_get_device_info()
+                await self._async_discover_capabilities(device_info)
+                self._device_info = device_info
+                self.load_shedder.limit_to(
+                    device_info.outlet_count or DEFAULT_OUTLET_COUNT
+                )
+            device_info = self._device_info
 
-            # Get outlet status (assuming 18 outlets for 800 series)
-            outlet_info = await self.telnet_client.async_get_outlet_status(18)
+            now = time.monotonic()
+            status_due = self._is_tier_due(TIER_STATUS, now)
+            names_due = self._is_tier_due(TIER_NAMES, now)
+            ups_due = self._is_tier_due(TIER_UPS, now)
+            previous = self.data or WattboxSnapshot.empty()
 
-            # Get status monitoring data (includes power status via telnet)
-            status_info = await self.telnet_client.async_get_status_info()
+            # Get outlet status (assuming 18 outlets for 800 series if unknown)
+            outlet_count = device_info.outlet_count or DEFAULT_OUTLET_COUNT
+            power_outlets = (
+                self._outlet_power_targets(outlet_count) if status_due else []
+            )
+            # Every due query goes out in one pipelined batch
+            if status_due or names_due or ups_due:
+                outlets, power, ups = await self.telnet_client.async_poll(
+                    outlet_count,
+                    include_states=status_due,
+                    include_names=names_due,
+                    include_power=status_due,
+                    include_ups=ups_due,
+                    power_outlets=power_outlets,
+                )
+            else:
+                outlets, power, ups = previous.outlets, previous.power, previous.ups
 
-            # Extract power metrics from status_info for backward compatibility
-            power_status = status_info.get("power_status", {})
-            voltage = power_status.get("voltage")
-            current = power_status.get("current")
-            power = power_status.get("power")
+            self._mark_tiers_fetched(
+                now, {TIER_STATUS: status_due, TIER_NAMES: names_due, TIER_UPS: ups_due}
+            )
+            outlets = await self._async_shed_load(outlets, power, ups)
+            energy, quality = previous.energy, previous.quality
+            if status_due:
+                self._adapt_status_interval(outlets, power, ups)
+                energy = self._sample_energy(now, power, outlets, power_outlets)
+                quality = self._power_quality.sample(power.voltage, now)
+                self.telemetry.record(now, power)
+                self._update_voltage_event(power, quality)
+            self._update_tier_schedule(ups)
+            await self._async_save_profile(device_info, outlets)
 
-            return {
-                "device_info": device_info,
-                "outlet_info": outlet_info,
-                "voltage": voltage,
-                "current": current,
-                "power": power,
-                "status_info": status_info,
-                "connected": True,
-            }
+            # Unchanged parts are carried over as the same objects
+            return evolve(
+                previous,
+                device=device_info,
+                outlets=outlets,
+                power=power,
+                ups=ups,
+                energy=energy,
+                quality=quality,
+                connected=True,
+            )
 
         except WattboxConnectionError as err:
+            self._energy.interrupt()
             _LOGGER.error("Connection error: %s", err)
             raise UpdateFailed(f"Connection error: {err}") from err
         except Exception as err:
+            self._energy.interrupt()
             _LOGGER.error("Unexpected error: %s", err)
             raise UpdateFailed(f"Unexpected error: {err}") from err
 
+    async def _async_shed_load(
+        self,
+        outlets: tuple[OutletState, ...],
+        power: PowerStatus,
+        ups: UPSStatus,
+    ) -> tuple[OutletState, ...]:
+        """Shed load in this poll if a trigger rule fires.
+
+        Returns the outlets confirmed after shedding. If the device rejects
+        part of the batch or the connection drops, the error is logged and the
+        client's last known outlets are recorded and returned, so the poll
+        still publishes what was actually shed; the episode counts as handled
+        either way, so a failing batch is not re-sent on every poll.
+        """
+        reason = self.load_shedder.check(power, ups)
+        if reason is None:
+            return outlets
+        plan = self.load_shedder.plan
+        _LOGGER.warning(
+            "Shedding load (%s): turning off outlets %s",
+            reason,
+            ", ".join(str(number) for number in plan),
+        )
+        self.load_shedder.active = True
+        try:
+            confirmed = await self.telnet_client.async_set_outlet_states(plan)
+        except WattboxTelnetError as err:
+            confirmed = self.telnet_client.snapshot.outlets or outlets
+            _LOGGER.error(
+                "Load shedding incomplete, outlets off: %s: %s",
+                ", ".join(map(str, _outlets_off(plan, confirmed))) or "none",
+                err,
+            )
+        self.load_shedder.shed = _outlets_off(plan, confirmed)
+        return confirmed
+
+    async def async_load_profile(self) -> bool:
+        """Seed coordinator data from the stored device profile.
+
+        Returns True if a profile was found, in which case entities can be
+        created right away while the first refresh runs in the background.
+        Outlet states and readings stay unknown until that refresh completes.
+        """
+        profile = await self._profile_store.async_load()
+        if not profile:
+            return False
+
+        self._profile = profile
+        self._capabilities = profile.get("capabilities")
+        device_info = profile["device_info"]
+        self.data = evolve(
+            WattboxSnapshot.empty(),
+            device=evolve(
+                DeviceIdentity.unknown(),
+                **{key: device_info.get(key) for key in _PROFILE_DEVICE_FIELDS},
+            ),
+            outlets=tuple(
+                evolve(OutletState.default(number, name), state=None)
+                for number, name in enumerate(profile["outlet_names"], start=1)
+            ),
+            power=PowerStatus.unknown(),
+            ups=UPSStatus.unknown(),
+            energy=self._energy.totals(len(profile["outlet_names"])),
+            connected=False,
+        )
+        return True
+
+    async def async_load_energy(self) -> None:
+        """Restore the energy totals integrated before a restart."""
+        data = await self._energy_store.async_load()
+        if data:
+            self._energy.restore(data)
+
+    def _sample_energy(
+        self,
+        now: float,
+        power: PowerStatus,
+        outlets: tuple[OutletState, ...],
+        power_outlets: list[int],
+    ) -> EnergyTotals:
+        """Integrate the readings of a status poll and schedule a save.
+
+        Only outlets whose power was read in this poll are sampled.
+        """
+        self._energy.sample(
+            power.power,
+            (
+                (number, outlets[number - 1].power)
+                for number in power_outlets
+                if number <= len(outlets)
+            ),
+            now,
+        )
+        self._energy_store.async_delay_save(self._energy.as_dict, ENERGY_SAVE_DELAY)
+        return self._energy.totals(len(outlets))
+
+    async def _async_save_profile(
+        self, device_info: DeviceIdentity, outlets: tuple[OutletState, ...]
+    ) -> None:
+        """Store the device identity and outlet names if they changed."""
+        profile = {
+            "device_info": {
+                key: getattr(device_info, key) for key in _PROFILE_DEVICE_FIELDS
+            },
+            "outlet_names": [outlet.name for outlet in outlets],
+            "capabilities": self._capabilities,
+        }
+        if profile == self._profile:
+            return
+
+        self._profile = profile
+        await self._profile_store.async_save(profile)
+
+    async def _async_discover_capabilities(self, device_info: DeviceIdentity) -> None:
+        """Tell the client which queries to skip, probing the device if needed.
+
+        A stored probe result is reused while the serial number and firmware
+        match and it only names queries that are still probed; a new device,
+        a firmware update or an older result is probed again.
+        """
+        key = {
+            "serial_number": device_info.serial_number,
+            "hardware_version": device_info.hardware_version,
+        }
+        capabilities = self._capabilities
+        if (
+            capabilities is not None
+            and all(capabilities.get(name) == value for name, value in key.items())
+            and set(capabilities["unsupported"]) <= _PROBED_COMMANDS
+        ):
+            self.telnet_client.set_unsupported_commands(capabilities["unsupported"])
+            return
+
+        unsupported = await self.telnet_client.async_probe_capabilities()
+        self._capabilities = {**key, "unsupported": sorted(unsupported)}
+
+    def is_supported(self, command: str) -> bool:
+        """Return False if the device is known to answer a query with #Error."""
+        if self._capabilities is None:
+            return True
+        return command.split("=", 1)[0] not in self._capabilities["unsupported"]
+
+    def _tier_interval(self, tier: str) -> float:
+        """Return the current interval for a polling tier."""
+        if tier == TIER_UPS and self._power_lost:
+            return min(self._tier_intervals[TIER_UPS], self._ups_power_lost_interval)
+        if tier == TIER_STATUS and self._voltage_event:
+            return min(self._tier_intervals[TIER_STATUS], self._min_interval)
+        return self._tier_intervals[tier]
+
+    def _is_tier_due(self, tier: str, now: float) -> bool:
+        """Return True if a tier has never been fetched or its interval elapsed."""
+        last_fetch = self._last_fetch.get(tier)
+        if last_fetch is None:
+            return True
+        # Allow for timer jitter so a tier is not pushed back a whole tick
+        return now - last_fetch >= self._tier_interval(tier) - 1
+
+    def _mark_tiers_fetched(self, now: float, due: dict[str, bool]) -> None:
+        """Record the fetch time of every tier that was just polled."""
+        for tier, fetched in due.items():
+            if fetched:
+                self._last_fetch[tier] = now
+
+    def _adapt_status_interval(
+        self, outlets: tuple[OutletState, ...], power: PowerStatus, ups: UPSStatus
+    ) -> None:
+        """Poll faster while readings move or the UPS is on battery.
+
+        Any outlet state change, a reading moving by more than
+        ADAPTIVE_CHANGE_THRESHOLD or UPS power loss drops the status interval
+        to the minimum; steady polls stretch it by ADAPTIVE_BACKOFF_FACTOR up
+        to the maximum.
+        """
+        if not self._adaptive:
+            return
+
+        states = tuple(outlet.state for outlet in outlets)
+        values = (
+            power.voltage,
+            power.current,
+            power.power,
+            *(outlet.power for outlet in outlets),
+        )
+        previous = self._last_readings
+        self._last_readings = (states, values)
+
+        power_lost = bool(ups.power_lost)
+        interval = self._tier_intervals[TIER_STATUS]
+        if previous is None and not power_lost:
+            # Nothing to compare against yet
+            return
+        if power_lost or previous[0] != states or _readings_moved(previous[1], values):
+            interval = self._min_interval
+        else:
+            interval = min(interval * ADAPTIVE_BACKOFF_FACTOR, self._max_interval)
+        if interval != self._tier_intervals[TIER_STATUS]:
+            _LOGGER.debug("Adaptive polling interval now %.1fs", interval)
+        self._tier_intervals[TIER_STATUS] = interval
+
+    def _update_voltage_event(self, power: PowerStatus, quality: PowerQuality) -> None:
+        """Sample voltage faster while it is out of band.
+
+        The device's own safe-voltage flag counts too, so short dips between
+        polls are more likely to be caught while the supply is unsettled. It
+        is only trusted after the device has reported safe voltage once.
+        """
+        if power.safe_voltage == 1:
+            self._safe_voltage_reported = True
+        voltage_event = quality.out_of_band or (
+            self._safe_voltage_reported and power.safe_voltage == 0
+        )
+        if voltage_event != self._voltage_event:
+            self._voltage_event = voltage_event
+            _LOGGER.info(
+                "Voltage %s, polling status every %ss",
+                "out of band" if voltage_event else "back in band",
+                self._tier_interval(TIER_STATUS),
+            )
+
+    def _update_tier_schedule(self, ups: UPSStatus) -> None:
+        """Tick at the shortest active tier interval."""
+        power_lost = bool(ups.power_lost)
+        if power_lost != self._power_lost:
+            _LOGGER.info(
+                "UPS %s, polling UPS status every %ss",
+                "on battery" if power_lost else "back on mains",
+                (
+                    self._ups_power_lost_interval
+                    if power_lost
+                    else self._tier_intervals[TIER_UPS]
+                ),
+            )
+            self._power_lost = power_lost
+
+        interval = min(self._tier_interval(tier) for tier in self._tier_intervals)
+        # On battery, UPS status is polled on its own fast cadence rather than
+        # waiting up to half an interval longer for the entry's fleet slot
+        if self._scheduler is not None and not self._power_lost:
+            # Land on this entry's slot so the fleet's polls stay spread out
+            interval = self._scheduler.next_delay(self.config_entry.entry_id, interval)
+        self.update_interval = timedelta(seconds=interval)
+
     async def async_set_outlet_state(self, outlet_number: int, state: bool) -> None:
-        """Set outlet state."""
+        """Set outlet state.
+
+        Only the affected outlet is updated, optimistically, and then confirmed
+        from the ?OutletStatus read pipelined with the command (or the next
+        push), instead of refreshing all device data.
+        """
+        previous_state = self._get_outlet_state(outlet_number)
+        self._publish_outlet_state(outlet_number, int(state))
         try:
-            await self.telnet_client.async_set_outlet_state(outlet_number, state)
-            # Trigger a data refresh to get updated outlet states
-            await self.async_request_refresh()
+            outlets = await self.telnet_client.async_set_outlet_state(
+                outlet_number, state
+            )
         except Exception as err:
             _LOGGER.error("Failed to set outlet %d state: %s", outlet_number, err)
+            if previous_state is not None:
+                self._publish_outlet_state(outlet_number, previous_state)
+            raise
+
+        self._publish_outlet_info(outlets)
+
+    async def async_set_outlet_states(self, actions: Mapping[int, str]) -> None:
+        """Apply several outlet actions with one write to the device.
+
+        Outlets switched on or off are updated optimistically; everything is
+        then confirmed from the single ?OutletStatus read sent with the batch.
+        """
+        previous = {
+            number: self._get_outlet_state(number)
+            for number, action in actions.items()
+            if action in (OUTLET_ACTION_ON, OUTLET_ACTION_OFF)
+        }
+        previous = {n: state for n, state in previous.items() if state is not None}
+        if previous:
+            self._publish_outlet_states(
+                {n: int(actions[n] == OUTLET_ACTION_ON) for n in previous}
+            )
+        try:
+            outlets = await self.telnet_client.async_set_outlet_states(actions)
+        except Exception as err:
+            _LOGGER.error("Failed to apply outlet actions %s: %s", actions, err)
+            if previous:
+                self._publish_outlet_states(previous)
             raise
 
+        self._publish_outlet_info(outlets)
+
+    def _get_outlet_state(self, outlet_number: int) -> int | None:
+        """Return the published state of an outlet, if known."""
+        if not self.data:
+            return None
+        outlet = self.data.outlet(outlet_number)
+        return outlet.state if outlet is not None else None
+
+    @callback
+    def _publish_outlet_state(self, outlet_number: int, state: int) -> None:
+        """Publish a new state for a single outlet."""
+        if self._get_outlet_state(outlet_number) is None:
+            return
+
+        self._async_publish(
+            evolve(
+                self.data,
+                outlets=replace_outlet(self.data.outlets, outlet_number, state=state),
+            )
+        )
+
+    @callback
+    def _outlet_power_targets(self, outlet_count: int) -> list[int]:
+        """Return the outlets to read ?OutletPowerStatus for."""
+        if self._outlet_power_enabled_only:
+            return sorted(
+                outlet
+                for outlet in self._outlet_power_entities
+                if outlet <= outlet_count
+            )
+        return list(range(1, outlet_count + 1))
+
+    @callback
+    def async_add_outlet_power_entity(self, outlet_number: int) -> Callable[[], None]:
+        """Register an enabled per-outlet power entity; return a remove callable."""
+        self._outlet_power_entities[outlet_number] = (
+            self._outlet_power_entities.get(outlet_number, 0) + 1
+        )
+
+        @callback
+        def remove() -> None:
+            remaining = self._outlet_power_entities.get(outlet_number, 0) - 1
+            if remaining > 0:
+                self._outlet_power_entities[outlet_number] = remaining
+            else:
+                self._outlet_power_entities.pop(outlet_number, None)
+
+        return remove
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Work out which data keys changed, then notify entities."""
+        self._update_changed_keys()
+        super().async_update_listeners()
+
+    def _update_changed_keys(self) -> None:
+        """Diff the new data against the previous snapshot.
+
+        ``changed_keys`` holds every changed dotted key together with its
+        parents, so an entity can subscribe to ``outlets.7`` or
+        ``power.voltage``. ``telemetry`` is added when new readings were
+        recorded. Availability changes and the first update notify
+        everyone.
+        """
+        snapshot = self.data
+        previous = self._snapshot
+        if previous is None or self._snapshot_success != self.last_update_success:
+            self.changed_keys = None
+        else:
+            changed: set[str] = set()
+            _diff(previous, snapshot, "", changed)
+            if self.telemetry.recorded != self._telemetry_recorded:
+                changed.add(TELEMETRY_KEY)
+            self.changed_keys = frozenset(changed)
+        self._snapshot = snapshot
+        self._snapshot_success = self.last_update_success
+        self._telemetry_recorded = self.telemetry.recorded
+
+    @callback
+    def _publish_outlet_states(self, states: Mapping[int, int]) -> None:
+        """Publish new states for several outlets in one update."""
+        outlets = self.data.outlets
+        for number, state in states.items():
+            outlets = replace_outlet(outlets, number, state=state)
+        self._async_publish(evolve(self.data, outlets=outlets))
+
+    def _publish_outlet_info(self, outlets: tuple[OutletState, ...]) -> None:
+        """Publish new outlet info, e.g. from a device push or a confirmation."""
+        if not self.data:
+            # Nothing to update until the first poll has completed
+            return
+
+        self._async_publish(evolve(self.data, outlets=outlets))
+
+    @callback
+    def _async_publish(self, data: WattboxSnapshot) -> None:
+        """Publish data between polls without moving the next poll.
+
+        async_set_updated_data would restart the refresh timer at
+        update_interval, so every push or toggle would push back the next
+        poll and pull it out of its fleet slot.
+        """
+        self.data = data
+        self.async_update_listeners()
+
     async def async_disconnect(self) -> None:
         """Disconnect from the device."""
+        self._remove_outlet_status_listener()
+        await self._energy_store.async_save(self._energy.as_dict())
         await self.telnet_client.async_disconnect()
@@ -0,0 +1,73 @@
+"""Diagnostics support for the Wattbox integration."""
+
+from __future__ import annotations
+
+from dataclasses import asdict
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import (
+    CONF_PASSWORD,
+    CONF_USERNAME,
+    DATA_SCHEDULER,
+    DIAGNOSTICS_WINDOWS,
+    DOMAIN,
+    TELEMETRY_METRICS,
+)
+from .coordinator import WattboxDataUpdateCoordinator
+from .scheduler import WattboxPollScheduler
+from .telemetry import TelemetryBuffer
+
+TO_REDACT = {CONF_PASSWORD, CONF_USERNAME}
+
+
+def _telemetry_history(telemetry: TelemetryBuffer) -> dict[str, Any]:
+    """Return the telemetry history downsampled at each diagnostics window.
+
+    Window times are given as seconds before the newest sample.
+    """
+    latest = telemetry.latest_time
+    history: dict[str, Any] = {}
+    for window in DIAGNOSTICS_WINDOWS:
+        history[f"{window}s"] = {
+            metric: [
+                {
+                    **asdict(stats),
+                    "start": round(latest - stats.start, 1),
+                    "end": round(latest - stats.end, 1),
+                }
+                for stats in telemetry.downsample(metric, window)
+            ]
+            for metric in TELEMETRY_METRICS
+        }
+    return history
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, config_entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    domain_data = hass.data[DOMAIN]
+    coordinator: WattboxDataUpdateCoordinator = domain_data[config_entry.entry_id]
+    scheduler: WattboxPollScheduler | None = domain_data.get(DATA_SCHEDULER)
+    telemetry = coordinator.telemetry
+    return {
+        "entry": async_redact_data(dict(config_entry.data), TO_REDACT),
+        "data": asdict(coordinator.data) if coordinator.data else None,
+        "unsupported_commands": sorted(coordinator.telnet_client.unsupported_commands),
+        "load_shedding": {
+            "enabled": coordinator.load_shedder.enabled,
+            "plan": list(coordinator.load_shedder.plan),
+            "active": coordinator.load_shedder.active,
+            "shed": list(coordinator.load_shedder.shed),
+        },
+        "scheduler": scheduler.report() if scheduler else None,
+        "telemetry": {
+            "samples": len(telemetry),
+            "capacity": telemetry.capacity,
+            "history": _telemetry_history(telemetry),
+        },
+    }
@@ -0,0 +1,119 @@
+"""Energy integration from Wattbox power readings."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import Any
+
+from .const import ENERGY_MAX_GAP
+from .models import EnergyTotals
+
+# Watt-seconds in a kilowatt-hour, doubled for the trapezoid's average
+_TRAPEZOID_DIVISOR = 2 * 3_600_000
+
+
+class EnergyIntegrator:
+    """Accumulate kWh from power samples with the trapezoidal rule.
+
+    Each sample adds the area between it and the previous sample. Energy over
+    a gap longer than ``max_gap``, a missing reading or an interruption such
+    as a reconnect is not guessed; integration resumes from the next sample.
+    Negative readings count as zero so the total never decreases.
+    """
+
+    __slots__ = ("energy", "_max_gap", "_time", "_power")
+
+    def __init__(self, energy: float = 0.0, max_gap: float = ENERGY_MAX_GAP) -> None:
+        """Initialize the integrator with a starting energy in kWh."""
+        self.energy = energy
+        self._max_gap = max_gap
+        self._time: float | None = None
+        self._power = 0.0
+
+    def add(self, power: float | None, now: float) -> None:
+        """Add a power sample in watts taken at monotonic time ``now``."""
+        if power is None:
+            self._time = None
+            return
+
+        power = max(power, 0.0)
+        if self._time is not None:
+            elapsed = now - self._time
+            if 0 < elapsed <= self._max_gap:
+                self.energy += (self._power + power) * elapsed / _TRAPEZOID_DIVISOR
+        self._time = now
+        self._power = power
+
+    def interrupt(self) -> None:
+        """Start afresh from the next sample, keeping the energy so far."""
+        self._time = None
+
+
+class WattboxEnergyMeter:
+    """Energy integrators for a device and each of its outlets."""
+
+    def __init__(self, max_gap: float = ENERGY_MAX_GAP) -> None:
+        """Initialize the meter."""
+        self._max_gap = max_gap
+        self._total: EnergyIntegrator | None = None
+        self._outlets: dict[int, EnergyIntegrator] = {}
+
+    def sample(
+        self,
+        power: float | None,
+        outlets: Iterable[tuple[int, float | None]],
+        now: float,
+    ) -> None:
+        """Add the device power and the (outlet, power) pairs read at ``now``."""
+        if power is not None and self._total is None:
+            self._total = EnergyIntegrator(max_gap=self._max_gap)
+        if self._total is not None:
+            self._total.add(power, now)
+
+        for number, outlet_power in outlets:
+            integrator = self._outlets.get(number)
+            if integrator is None:
+                if outlet_power is None:
+                    continue
+                integrator = self._outlets[number] = EnergyIntegrator(
+                    max_gap=self._max_gap
+                )
+            integrator.add(outlet_power, now)
+
+    def interrupt(self) -> None:
+        """Stop integrating across a gap, e.g. a failed poll or reconnect."""
+        if self._total is not None:
+            self._total.interrupt()
+        for integrator in self._outlets.values():
+            integrator.interrupt()
+
+    def totals(self, outlet_count: int) -> EnergyTotals:
+        """Return the energy so far for the device and its outlets."""
+        outlets = tuple(
+            self._outlets[number].energy if number in self._outlets else None
+            for number in range(1, outlet_count + 1)
+        )
+        return EnergyTotals(
+            self._total.energy if self._total is not None else None, outlets
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the energy so far for storage."""
+        return {
+            "total": self._total.energy if self._total is not None else None,
+            "outlets": {
+                str(number): integrator.energy
+                for number, integrator in self._outlets.items()
+            },
+        }
+
+    def restore(self, data: dict[str, Any]) -> None:
+        """Restore stored energy; integration restarts with the next sample."""
+        total = data.get("total")
+        self._total = (
+            EnergyIntegrator(total, self._max_gap) if total is not None else None
+        )
+        self._outlets = {
+            int(number): EnergyIntegrator(energy, self._max_gap)
+            for number, energy in data.get("outlets", {}).items()
+        }
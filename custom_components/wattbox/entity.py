@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from typing import Any
 
+from homeassistant.core import callback
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -15,10 +16,13 @@ class WattboxEntity(CoordinatorEntity):
 
     _attr_has_entity_name = True
 
+    # Coordinator data keys the entity state depends on; None means all keys
+    _coordinator_keys: tuple[str, ...] | None = None
+
     def __init__(
         self,
         coordinator: Any,
-        device_info: dict[str, Any],
+        device_info: Any,
         unique_id: str,
     ) -> None:
         """Initialize the entity."""
@@ -40,15 +44,14 @@ class WattboxEntity(CoordinatorEntity):
         """Return device info."""
         # Update device info if coordinator data is available
         if self.coordinator.data:
-            device_data = self.coordinator.data.get("device_info", {})
-            if device_data:
-                self._attr_device_info = DeviceInfo(
-                    identifiers={(DOMAIN, device_data.get("serial_number", "unknown"))},
-                    name=device_data.get("hostname", "Wattbox"),
-                    manufacturer=DEVICE_MANUFACTURER,
-                    model=device_data.get("model", DEVICE_MODEL),
-                    sw_version=device_data.get("hardware_version"),
-                )
+            device = self.coordinator.data.device
+            self._attr_device_info = DeviceInfo(
+                identifiers={(DOMAIN, device.serial_number or "unknown")},
+                name=device.hostname or "Wattbox",
+                manufacturer=DEVICE_MANUFACTURER,
+                model=device.model or DEVICE_MODEL,
+                sw_version=device.hardware_version,
+            )
         return self._attr_device_info
 
     @property
@@ -56,6 +59,18 @@ class WattboxEntity(CoordinatorEntity):
         """Return if polling is needed."""
         return False
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only if one of the entity's keys changed."""
+        changed_keys = getattr(self.coordinator, "changed_keys", None)
+        if (
+            changed_keys is not None
+            and self._coordinator_keys is not None
+            and changed_keys.isdisjoint(self._coordinator_keys)
+        ):
+            return
+        super()._handle_coordinator_update()
+
 
 class WattboxDeviceEntity(WattboxEntity):
     """Base entity for Wattbox device-level entities."""
@@ -63,7 +78,7 @@ class WattboxDeviceEntity(WattboxEntity):
     def __init__(
         self,
         coordinator: Any,
-        device_info: dict[str, Any],
+        device_info: Any,
         unique_id: str,
     ) -> None:
         """Initialize the device entity."""
@@ -77,7 +92,7 @@ class WattboxOutletEntity(WattboxEntity):
     def __init__(
         self,
         coordinator: Any,
-        device_info: dict[str, Any],
+        device_info: Any,
         unique_id: str,
         outlet_number: int,
     ) -> None:
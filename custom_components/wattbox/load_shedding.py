@@ -0,0 +1,144 @@
+"""Automatic priority-based load shedding."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import Any
+
+from .const import (
+    CONF_SHED_MAX_CURRENT,
+    CONF_SHED_MIN_RUNTIME,
+    CONF_SHED_ON_BATTERY,
+    CONF_SHED_PRIORITIES,
+    DEFAULT_SHED_MAX_CURRENT,
+    DEFAULT_SHED_MIN_RUNTIME,
+    DEFAULT_SHED_ON_BATTERY,
+    DEFAULT_SHED_PRIORITIES,
+    OUTLET_ACTION_OFF,
+    SHED_REASON_LOW_RUNTIME,
+    SHED_REASON_ON_BATTERY,
+    SHED_REASON_OVERCURRENT,
+)
+from .models import PowerStatus, UPSStatus
+
+
+def parse_priorities(text: str, outlet_count: int | None = None) -> dict[int, int]:
+    """Parse an outlet priority map such as ``"7:1, 8:1, 3:2"``.
+
+    Each entry is ``outlet:priority``; a bare outlet number has priority 1.
+    Raises ValueError for malformed entries and, when ``outlet_count`` is
+    known, for outlets the device does not have.
+    """
+    priorities: dict[int, int] = {}
+    for entry in text.replace(";", ",").split(","):
+        entry = entry.strip()
+        if not entry:
+            continue
+        outlet, _, priority = entry.partition(":")
+        try:
+            number = int(outlet)
+            level = int(priority) if priority else 1
+        except ValueError:
+            raise ValueError(f"Invalid outlet priority: {entry}") from None
+        if number < 1 or level < 1:
+            raise ValueError(f"Invalid outlet priority: {entry}")
+        if outlet_count is not None and number > outlet_count:
+            raise ValueError(
+                f"Outlet {number} does not exist on a {outlet_count}-outlet device"
+            )
+        priorities[number] = level
+    return priorities
+
+
+class LoadShedder:
+    """Turn off low-priority outlets when a trigger rule fires.
+
+    The plan - every outlet with a priority, lowest priority first - is
+    built once, so shedding is a single pipelined batch of !OutletSet
+    commands sent from the poll that saw the trigger, without a round trip
+    through Home Assistant automations. Load is shed once per episode;
+    once no rule fires any more the shedder re-arms. Outlets are not turned
+    back on automatically.
+    """
+
+    def __init__(
+        self,
+        priorities: Mapping[int, int],
+        *,
+        on_battery: bool = DEFAULT_SHED_ON_BATTERY,
+        min_runtime: int = DEFAULT_SHED_MIN_RUNTIME,
+        max_current: float = DEFAULT_SHED_MAX_CURRENT,
+    ) -> None:
+        """Initialize the shedder with its priority map and trigger rules.
+
+        A ``min_runtime`` or ``max_current`` of 0 disables that rule.
+        """
+        self.plan: dict[int, str] = {
+            number: OUTLET_ACTION_OFF
+            for number in sorted(priorities, key=lambda n: (priorities[n], n))
+        }
+        self._on_battery = on_battery
+        self._min_runtime = min_runtime
+        self._max_current = max_current
+        self.active = False
+        # Outlets confirmed off by the latest shed
+        self.shed: tuple[int, ...] = ()
+
+    @classmethod
+    def from_config(cls, data: Mapping[str, Any]) -> LoadShedder:
+        """Build a shedder from config entry data."""
+        return cls(
+            parse_priorities(data.get(CONF_SHED_PRIORITIES, DEFAULT_SHED_PRIORITIES)),
+            on_battery=data.get(CONF_SHED_ON_BATTERY, DEFAULT_SHED_ON_BATTERY),
+            min_runtime=data.get(CONF_SHED_MIN_RUNTIME, DEFAULT_SHED_MIN_RUNTIME),
+            max_current=data.get(CONF_SHED_MAX_CURRENT, DEFAULT_SHED_MAX_CURRENT),
+        )
+
+    def limit_to(self, outlet_count: int) -> None:
+        """Drop outlets from the plan that the device does not have."""
+        self.plan = {
+            number: action
+            for number, action in self.plan.items()
+            if number <= outlet_count
+        }
+
+    @property
+    def enabled(self) -> bool:
+        """Return True if there is anything to shed and a rule to trigger it."""
+        return bool(self.plan) and bool(
+            self._on_battery or self._min_runtime or self._max_current
+        )
+
+    def trigger(self, power: PowerStatus, ups: UPSStatus) -> str | None:
+        """Return the first rule firing for these readings, if any."""
+        on_battery = bool(ups.power_lost)
+        if self._on_battery and on_battery:
+            return SHED_REASON_ON_BATTERY
+        if (
+            self._min_runtime
+            and on_battery
+            and ups.battery_runtime is not None
+            and ups.battery_runtime < self._min_runtime
+        ):
+            return SHED_REASON_LOW_RUNTIME
+        if (
+            self._max_current
+            and power.current is not None
+            and power.current > self._max_current
+        ):
+            return SHED_REASON_OVERCURRENT
+        return None
+
+    def check(self, power: PowerStatus, ups: UPSStatus) -> str | None:
+        """Return the trigger reason if load should be shed now.
+
+        Returns None while no rule fires, which re-arms the shedder, and
+        while load has already been shed for the current episode.
+        """
+        if not self.enabled:
+            return None
+        reason = self.trigger(power, ups)
+        if reason is None:
+            self.active = False
+            return None
+        return None if self.active else reason
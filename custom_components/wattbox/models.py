@@ -0,0 +1,268 @@
+"""Immutable data model for Wattbox device state.
+
+Every poll produces a new ``WattboxSnapshot``. Records that did not change
+are carried over as the same objects, so comparing two snapshots mostly
+short-circuits on identity and unchanged parts cost no extra memory.
+Classes declare ``__slots__`` explicitly (``dataclass(slots=True)`` needs
+Python 3.10), which is why defaults come from classmethods instead of
+field defaults.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass, replace
+from typing import Any, TypeVar
+
+_RecordT = TypeVar("_RecordT")
+
+
+@dataclass(frozen=True)
+class DeviceIdentity:
+    """Device identity, read once per connection."""
+
+    __slots__ = (
+        "hardware_version",
+        "model",
+        "serial_number",
+        "hostname",
+        "auto_reboot",
+        "outlet_count",
+    )
+
+    hardware_version: str | None
+    model: str | None
+    serial_number: str | None
+    hostname: str | None
+    auto_reboot: str | None
+    outlet_count: int | None
+
+    @classmethod
+    def unknown(cls) -> DeviceIdentity:
+        """Return an identity with nothing known yet."""
+        return cls(None, None, None, None, None, None)
+
+
+@dataclass(frozen=True)
+class OutletState:
+    """State and readings of a single outlet."""
+
+    __slots__ = ("number", "name", "state", "power", "current", "voltage")
+
+    number: int
+    name: str
+    state: int | None
+    power: float | None
+    current: float | None
+    voltage: float | None
+
+    @classmethod
+    def default(cls, number: int, name: str | None = None) -> OutletState:
+        """Return an outlet with no readings yet."""
+        return cls(number, name or f"Outlet {number}", 0, None, None, None)
+
+
+@dataclass(frozen=True)
+class PowerStatus:
+    """Device-level ?PowerStatus readings."""
+
+    __slots__ = ("current", "power", "voltage", "safe_voltage")
+
+    current: float | None
+    power: float | None
+    voltage: float | None
+    safe_voltage: int | None
+
+    @classmethod
+    def unknown(cls) -> PowerStatus:
+        """Return power status with no readings yet."""
+        return cls(None, None, None, None)
+
+
+@dataclass(frozen=True)
+class UPSStatus:
+    """UPS connection (?UPSConnection) and ?UPSStatus readings."""
+
+    __slots__ = (
+        "connected",
+        "battery_charge",
+        "battery_load",
+        "battery_health",
+        "power_lost",
+        "battery_runtime",
+        "alarm_enabled",
+        "alarm_muted",
+    )
+
+    connected: bool | None
+    battery_charge: int | None
+    battery_load: int | None
+    battery_health: str | None
+    power_lost: bool | None
+    battery_runtime: int | None
+    alarm_enabled: bool | None
+    alarm_muted: bool | None
+
+    @classmethod
+    def unknown(cls) -> UPSStatus:
+        """Return UPS status with no readings yet."""
+        return cls(None, None, None, None, None, None, None, None)
+
+
+@dataclass(frozen=True)
+class EnergyTotals:
+    """Energy integrated from power readings, in kWh.
+
+    ``outlets`` is indexed by outlet number - 1; outlets whose power has
+    never been read are None.
+    """
+
+    __slots__ = ("total", "outlets")
+
+    total: float | None
+    outlets: tuple[float | None, ...]
+
+    @classmethod
+    def unknown(cls) -> EnergyTotals:
+        """Return energy totals with nothing integrated yet."""
+        return cls(None, ())
+
+    def outlet(self, number: int) -> float | None:
+        """Return the energy of an outlet by its 1-based number."""
+        if 1 <= number <= len(self.outlets):
+            return self.outlets[number - 1]
+        return None
+
+
+@dataclass(frozen=True)
+class PowerQuality:
+    """Voltage events seen in ?PowerStatus readings.
+
+    ``sag``, ``swell`` and ``brownout`` are True while the event is ongoing;
+    the counts are events since startup.
+    """
+
+    __slots__ = ("sag", "swell", "brownout", "sags", "swells", "brownouts")
+
+    sag: bool | None
+    swell: bool | None
+    brownout: bool | None
+    sags: int
+    swells: int
+    brownouts: int
+
+    @classmethod
+    def unknown(cls) -> PowerQuality:
+        """Return power quality with no readings yet."""
+        return cls(None, None, None, 0, 0, 0)
+
+    @property
+    def out_of_band(self) -> bool:
+        """Return True while any voltage event is ongoing."""
+        return bool(self.sag or self.swell or self.brownout)
+
+
+@dataclass(frozen=True)
+class WindowStats:
+    """Minimum, mean and maximum of the samples in a time window.
+
+    ``start`` and ``end`` are the monotonic times of the first and last
+    sample in the window.
+    """
+
+    __slots__ = ("start", "end", "count", "minimum", "mean", "maximum")
+
+    start: float
+    end: float
+    count: int
+    minimum: float
+    mean: float
+    maximum: float
+
+
+@dataclass(frozen=True)
+class WattboxSnapshot:
+    """Everything known about a device after one poll."""
+
+    __slots__ = (
+        "device",
+        "outlets",
+        "power",
+        "ups",
+        "energy",
+        "quality",
+        "connected",
+    )
+
+    device: DeviceIdentity
+    outlets: tuple[OutletState, ...]
+    power: PowerStatus
+    ups: UPSStatus
+    energy: EnergyTotals
+    quality: PowerQuality
+    connected: bool
+
+    @classmethod
+    def empty(cls) -> WattboxSnapshot:
+        """Return a snapshot with nothing known yet."""
+        return cls(
+            DeviceIdentity.unknown(),
+            (),
+            PowerStatus.unknown(),
+            UPSStatus.unknown(),
+            EnergyTotals.unknown(),
+            PowerQuality.unknown(),
+            False,
+        )
+
+    def outlet(self, number: int) -> OutletState | None:
+        """Return an outlet by its 1-based number."""
+        if 1 <= number <= len(self.outlets):
+            return self.outlets[number - 1]
+        return None
+
+
+def evolve(record: _RecordT, **changes: Any) -> _RecordT:
+    """Return ``record`` with changes applied, or ``record`` itself if unchanged."""
+    for name, value in changes.items():
+        current = getattr(record, name)
+        if current is not value and current != value:
+            return replace(record, **changes)
+    return record
+
+
+def replace_outlet(
+    outlets: tuple[OutletState, ...], number: int, **changes: Any
+) -> tuple[OutletState, ...]:
+    """Return outlets with one outlet changed, sharing every other outlet."""
+    if not 1 <= number <= len(outlets):
+        return outlets
+    outlet = outlets[number - 1]
+    updated = evolve(outlet, **changes)
+    if updated is outlet:
+        return outlets
+    return outlets[: number - 1] + (updated,) + outlets[number:]
+
+
+def parse_state_mask(values: Sequence[str]) -> int:
+    """Return ``?OutletStatus`` values as a bitmask, bit 0 being outlet 1.
+
+    The whole list is converted in one ``int(..., 2)`` call instead of one
+    ``int()`` per outlet. Only the tokens ``0`` and ``1`` are accepted, with
+    surrounding whitespace ignored; anything else raises ValueError.
+    """
+    if not values:
+        return 0
+    bits = "".join(value.strip() for value in reversed(values))
+    # int() alone would accept "10", "" or "1_1" as tokens and shift outlets
+    if len(bits) != len(values) or bits.strip("01"):
+        raise ValueError(f"Outlet states must be 0 or 1: {','.join(values)}")
+    return int(bits, 2)
+
+
+def mask_outlets(mask: int) -> Iterator[int]:
+    """Yield the 1-based numbers of the outlets whose bit is set in ``mask``."""
+    while mask:
+        lowest = mask & -mask
+        yield lowest.bit_length()
+        mask ^= lowest
@@ -0,0 +1,72 @@
+"""Voltage sag, swell and brownout detection."""
+
+from __future__ import annotations
+
+from .const import (
+    POWER_QUALITY_BROWNOUT_DURATION,
+    POWER_QUALITY_SAG_RATIO,
+    POWER_QUALITY_SWELL_RATIO,
+)
+from .models import PowerQuality, evolve
+
+
+class PowerQualityMonitor:
+    """Classify voltage readings against a band around the nominal voltage.
+
+    A reading below the band starts a sag; if the voltage is still low after
+    POWER_QUALITY_BROWNOUT_DURATION the sag becomes a brownout. A reading
+    above the band is a swell. Every sag is counted when it starts, so the
+    sag count includes dips that went on to become brownouts. Missing
+    readings leave the state as it was.
+    """
+
+    def __init__(
+        self,
+        nominal_voltage: float,
+        brownout_duration: float = POWER_QUALITY_BROWNOUT_DURATION,
+    ) -> None:
+        """Initialize the monitor for a nominal voltage."""
+        self._low = nominal_voltage * POWER_QUALITY_SAG_RATIO
+        self._high = nominal_voltage * POWER_QUALITY_SWELL_RATIO
+        self._brownout_duration = brownout_duration
+        self._low_since: float | None = None
+        self._quality = PowerQuality.unknown()
+
+    @property
+    def quality(self) -> PowerQuality:
+        """Return the current events and counts."""
+        return self._quality
+
+    def sample(self, voltage: float | None, now: float) -> PowerQuality:
+        """Classify a voltage reading taken at monotonic time ``now``."""
+        if voltage is None:
+            return self._quality
+
+        quality = self._quality
+        sags, swells, brownouts = quality.sags, quality.swells, quality.brownouts
+        low = voltage < self._low
+        high = voltage > self._high
+        brownout = False
+        if low:
+            if self._low_since is None:
+                self._low_since = now
+                sags += 1
+            brownout = now - self._low_since >= self._brownout_duration
+            if brownout and not quality.brownout:
+                brownouts += 1
+        else:
+            self._low_since = None
+        if high and not quality.swell:
+            swells += 1
+
+        # An unchanged state is kept as the same object
+        self._quality = evolve(
+            quality,
+            sag=low and not brownout,
+            swell=high,
+            brownout=brownout,
+            sags=sags,
+            swells=swells,
+            brownouts=brownouts,
+        )
+        return self._quality
@@ -0,0 +1,129 @@
+"""Incremental parser for the Wattbox telnet response stream."""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+
+from .const import (
+    TELNET_LINE_TERMINATOR,
+    TELNET_MAX_FRAME_SIZE,
+    TELNET_RESPONSE_ERROR,
+    TELNET_RESPONSE_OK,
+    TELNET_UNSOLICITED_PREFIX,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# Frame kinds
+FRAME_RESPONSE = "response"  # ?Key=value, answering a request
+FRAME_PUSH = "push"  # ~Key=value, sent unsolicited by the device
+FRAME_ERROR = "error"  # #Error
+FRAME_OK = "ok"  # OK, acknowledging a control command
+FRAME_OTHER = "other"  # anything else, e.g. a banner
+
+_TERMINATOR = TELNET_LINE_TERMINATOR.encode()
+_OK = TELNET_RESPONSE_OK.encode()
+_ERROR = TELNET_RESPONSE_ERROR.encode()
+_REQUEST = ord("?")
+_PUSH = ord(TELNET_UNSOLICITED_PREFIX)
+_SEPARATOR = ord("=")
+
+
+@dataclass(frozen=True)
+class Frame:
+    """One complete record from the device.
+
+    ``key`` is the ``?Key=`` or ``~Key=`` prefix of responses and pushes, so
+    it compares directly with the prefix a request is answered by.
+    """
+
+    __slots__ = ("kind", "key", "line")
+
+    kind: str
+    key: str | None
+    line: str
+
+
+def _parse_record(record: bytearray) -> Frame | None:
+    """Classify one stripped record, decoding only that record."""
+    if not record:
+        return None
+    line = record.decode("utf-8", errors="ignore")
+    first = record[0]
+    if first in (_REQUEST, _PUSH):
+        separator = record.find(_SEPARATOR)
+        if separator != -1:
+            return Frame(
+                FRAME_RESPONSE if first == _REQUEST else FRAME_PUSH,
+                record[: separator + 1].decode("ascii", errors="ignore"),
+                line,
+            )
+    elif record.startswith(_ERROR):
+        return Frame(FRAME_ERROR, None, line)
+    elif record == _OK:
+        return Frame(FRAME_OK, None, line)
+    return Frame(FRAME_OTHER, None, line)
+
+
+class WattboxFrameParser:
+    """Split the device's byte stream into ``\\n``-terminated frames.
+
+    Bytes are appended to one reusable ``bytearray``; complete records are
+    cut from its front in place, so a reply split over several reads is
+    reassembled and nothing past the last terminator is lost. Only the
+    bytes already searched are skipped when looking for the next
+    terminator. A record growing beyond ``max_frame_size`` without a
+    terminator is dropped, up to and including its terminator, instead of
+    buffering without bound.
+    """
+
+    def __init__(self, max_frame_size: int = TELNET_MAX_FRAME_SIZE) -> None:
+        """Initialize the parser."""
+        self._buffer = bytearray()
+        self._max_frame_size = max_frame_size
+        self._scanned = 0
+        self._discarding = False
+
+    @property
+    def pending(self) -> bytes:
+        """Return the bytes of the incomplete record, if any."""
+        return bytes(self._buffer)
+
+    def reset(self) -> None:
+        """Forget any partial record, e.g. after reconnecting."""
+        self._buffer.clear()
+        self._scanned = 0
+        self._discarding = False
+
+    def feed(self, data: bytes) -> list[Frame]:
+        """Add received data and return the frames it completed."""
+        buffer = self._buffer
+        # memoryview rejects anything that is not bytes-like
+        buffer += memoryview(data)
+
+        frames: list[Frame] = []
+        start = 0
+        end = buffer.find(_TERMINATOR, self._scanned)
+        while end != -1:
+            if self._discarding:
+                # The tail of an oversized record ends here
+                self._discarding = False
+            else:
+                frame = _parse_record(buffer[start:end].strip())
+                if frame is not None:
+                    frames.append(frame)
+            start = end + 1
+            end = buffer.find(_TERMINATOR, start)
+        if start:
+            del buffer[:start]
+
+        if len(buffer) > self._max_frame_size:
+            _LOGGER.warning(
+                "Dropping oversized frame (%d bytes without a line terminator)",
+                len(buffer),
+            )
+            buffer.clear()
+            self._discarding = True
+        self._scanned = len(buffer)
+        return frames
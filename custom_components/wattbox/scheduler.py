@@ -0,0 +1,111 @@
+"""Fleet poll scheduler shared by all Wattbox config entries."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+from .const import DATA_SCHEDULER, DOMAIN, MAX_CONCURRENT_POLLS
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class WattboxPollScheduler:
+    """Spread polls of many devices evenly and cap how many run at once.
+
+    Every registered entry owns a slot at ``index / entries`` of its polling
+    interval, measured from a common anchor. After each poll the coordinator
+    asks for the delay to its next slot instead of a plain interval, so
+    entries that started together drift apart into evenly spaced polls.
+    Skew is the difference between when a poll was scheduled and when it
+    actually started, including time spent waiting for a free poll slot.
+    """
+
+    def __init__(self, max_concurrent: int = MAX_CONCURRENT_POLLS) -> None:
+        """Initialize the scheduler."""
+        self._max_concurrent = max_concurrent
+        self._semaphore: asyncio.Semaphore | None = None
+        self._entries: list[str] = []
+        self._anchor = time.monotonic()
+        self._expected: dict[str, float] = {}
+        self._skew: dict[str, float] = {}
+        self._in_flight = 0
+
+    @property
+    def in_flight(self) -> int:
+        """Return the number of polls currently running."""
+        return self._in_flight
+
+    def register(self, entry_id: str) -> None:
+        """Give an entry a poll slot."""
+        if entry_id not in self._entries:
+            self._entries.append(entry_id)
+
+    def unregister(self, entry_id: str) -> None:
+        """Release an entry's poll slot."""
+        if entry_id in self._entries:
+            self._entries.remove(entry_id)
+        self._expected.pop(entry_id, None)
+        self._skew.pop(entry_id, None)
+
+    def next_delay(self, entry_id: str, interval: float) -> float:
+        """Return the delay until the entry's next slot.
+
+        The delay is kept between half and one and a half intervals so an
+        entry never polls much faster or slower than configured while it
+        moves into its slot.
+        """
+        now = time.monotonic()
+        if len(self._entries) < 2 or entry_id not in self._entries:
+            delay = interval
+        else:
+            phase = self._entries.index(entry_id) * interval / len(self._entries)
+            delay = (self._anchor + phase - now) % interval
+            if delay < interval / 2:
+                delay += interval
+        self._expected[entry_id] = now + delay
+        return delay
+
+    @asynccontextmanager
+    async def async_poll(self, entry_id: str) -> AsyncIterator[None]:
+        """Hold one of the concurrent poll slots while an entry polls."""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._max_concurrent)
+        async with self._semaphore:
+            expected = self._expected.get(entry_id)
+            if expected is not None:
+                self._skew[entry_id] = time.monotonic() - expected
+                _LOGGER.debug(
+                    "Poll for %s started %.3fs off schedule",
+                    entry_id,
+                    self._skew[entry_id],
+                )
+            self._in_flight += 1
+            try:
+                yield
+            finally:
+                self._in_flight -= 1
+
+    def report(self) -> dict[str, Any]:
+        """Return scheduling statistics for the fleet."""
+        return {
+            "entries": len(self._entries),
+            "in_flight": self._in_flight,
+            "max_concurrent": self._max_concurrent,
+            "skew": dict(self._skew),
+            "max_skew": max((abs(s) for s in self._skew.values()), default=0.0),
+        }
+
+
+def async_get_scheduler(hass: HomeAssistant) -> WattboxPollScheduler:
+    """Return the domain-wide poll scheduler, creating it on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if DATA_SCHEDULER not in domain_data:
+        domain_data[DATA_SCHEDULER] = WattboxPollScheduler()
+    return domain_data[DATA_SCHEDULER]
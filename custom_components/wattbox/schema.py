@@ -0,0 +1,316 @@
+"""Declarative response schemas for the Wattbox telnet protocol.
+
+Each query the integration sends has one ``CommandSchema`` listing the fields
+of its reply in order, with the converter for each. Schemas are compiled once
+into parser functions that return a named tuple record, or a ``ParseError``
+describing why the reply could not be read. Replies holding several records,
+such as one per connected adapter, use a ``RepeatedSchema`` and parse into a
+tuple of records. Supporting a new query is a matter of adding its schema to
+``SCHEMAS``.
+"""
+
+from __future__ import annotations
+
+from collections import namedtuple
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from .const import (
+    TELNET_CMD_ADAPTER_SENSOR_DATA,
+    TELNET_CMD_AUTO_REBOOT,
+    TELNET_CMD_FIRMWARE,
+    TELNET_CMD_HOSTNAME,
+    TELNET_CMD_MODEL,
+    TELNET_CMD_NETWORK,
+    TELNET_CMD_OUTLET_COUNT,
+    TELNET_CMD_OUTLET_NAME,
+    TELNET_CMD_OUTLET_POWER_STATUS,
+    TELNET_CMD_OUTLET_STATUS,
+    TELNET_CMD_POWER_STATUS,
+    TELNET_CMD_SERVICE_TAG,
+    TELNET_CMD_UPS_CONNECTION,
+    TELNET_CMD_UPS_STATUS,
+    TELNET_RESPONSE_ERROR,
+    TELNET_UNSOLICITED_PREFIX,
+)
+from .models import parse_state_mask
+
+# Parse error reasons
+PARSE_DEVICE_ERROR = "device_error"  # the device answered #Error
+PARSE_UNEXPECTED = "unexpected"  # the reply is for another command
+PARSE_ARITY = "arity"  # fewer values than the schema has fields
+PARSE_VALUE = "value"  # a value failed its converter
+
+_REPLY_PREFIXES = ("?", TELNET_UNSOLICITED_PREFIX)
+
+# The value a repeated reply holds when it has no records
+_NO_RECORDS = "None"
+
+AdapterSensor = namedtuple("AdapterSensor", ("connected", "unit", "value"))
+
+
+@dataclass(frozen=True)
+class Field:
+    """One field of a reply.
+
+    A ``rest`` field is converted from the list of every value left after
+    the fixed fields, for replies with one value per outlet.
+    """
+
+    __slots__ = ("name", "convert", "rest")
+
+    name: str
+    convert: Callable[[Any], Any]
+    rest: bool
+
+
+@dataclass(frozen=True)
+class CommandSchema:
+    """The reply layout of one query."""
+
+    __slots__ = ("command", "record", "fields")
+
+    command: str
+    record: str
+    fields: tuple[Field, ...]
+
+
+@dataclass(frozen=True)
+class RepeatedSchema(CommandSchema):
+    """The reply layout of a query answering with several records.
+
+    Records are split on ``separator`` and each is parsed with ``fields``.
+    """
+
+    __slots__ = ("separator",)
+
+    separator: str
+
+
+@dataclass(frozen=True)
+class ParseError:
+    """Why a reply could not be parsed."""
+
+    __slots__ = ("command", "reason", "line", "detail")
+
+    command: str
+    reason: str
+    line: str
+    detail: str | None
+
+
+def field(name: str, convert: Callable[[Any], Any]) -> Field:
+    """Return a field holding one value."""
+    return Field(name, convert, False)
+
+
+def rest(name: str, convert: Callable[[list[str]], Any]) -> Field:
+    """Return a field converted from all remaining values."""
+    return Field(name, convert, True)
+
+
+def text(value: str) -> str:
+    """Convert a non-empty text value."""
+    value = value.strip()
+    if not value:
+        raise ValueError("empty value")
+    return value
+
+
+def flag(value: str) -> bool:
+    """Convert a True/False or 1/0 value."""
+    if value in ("True", "1"):
+        return True
+    if value in ("False", "0"):
+        return False
+    raise ValueError(f"invalid flag {value!r}")
+
+
+def count(value: str) -> int:
+    """Convert a positive count."""
+    number = int(value)
+    if number <= 0:
+        raise ValueError(f"invalid count {number}")
+    return number
+
+
+def names(values: list[str]) -> tuple[str, ...]:
+    """Convert outlet names, removing their braces."""
+    return tuple(value.replace("{", "").replace("}", "") for value in values)
+
+
+def sensors(values: list[str]) -> tuple[AdapterSensor, ...]:
+    """Convert adapter sensor triples of connected, unit and value.
+
+    The value of a disconnected probe is not valid and is returned as None.
+    """
+    if len(values) % 3:
+        raise ValueError(f"{len(values)} values are not sensor triples")
+    result = []
+    for index in range(0, len(values), 3):
+        connected = flag(values[index].strip())
+        unit = int(values[index + 1])
+        value = int(values[index + 2]) if connected else None
+        result.append(AdapterSensor(connected, unit, value))
+    return tuple(result)
+
+
+SCHEMAS: tuple[CommandSchema, ...] = (
+    # A firmware reply is either "2.8.0.0" or "version,revision,..."
+    CommandSchema(TELNET_CMD_FIRMWARE, "Firmware", (field("firmware", str.strip),)),
+    CommandSchema(TELNET_CMD_MODEL, "Model", (field("model", text),)),
+    CommandSchema(
+        TELNET_CMD_SERVICE_TAG, "ServiceTag", (field("serial_number", text),)
+    ),
+    CommandSchema(TELNET_CMD_HOSTNAME, "Hostname", (field("hostname", text),)),
+    CommandSchema(TELNET_CMD_AUTO_REBOOT, "AutoReboot", (field("auto_reboot", text),)),
+    CommandSchema(
+        TELNET_CMD_OUTLET_COUNT, "OutletCount", (field("outlet_count", count),)
+    ),
+    CommandSchema(
+        TELNET_CMD_OUTLET_STATUS,
+        "OutletStatus",
+        (rest("mask", parse_state_mask), rest("count", len)),
+    ),
+    CommandSchema(TELNET_CMD_OUTLET_NAME, "OutletName", (rest("names", names),)),
+    CommandSchema(
+        TELNET_CMD_POWER_STATUS,
+        "PowerStatus",
+        (
+            field("current", float),
+            field("power", float),
+            field("voltage", float),
+            field("safe_voltage", int),
+        ),
+    ),
+    CommandSchema(
+        TELNET_CMD_OUTLET_POWER_STATUS,
+        "OutletPowerStatus",
+        (
+            field("outlet", int),
+            field("power", float),
+            field("current", float),
+            field("voltage", float),
+        ),
+    ),
+    CommandSchema(
+        TELNET_CMD_UPS_CONNECTION, "UPSConnection", (field("connected", flag),)
+    ),
+    CommandSchema(
+        TELNET_CMD_UPS_STATUS,
+        "UPSStatus",
+        (
+            field("battery_charge", int),
+            field("battery_load", int),
+            field("battery_health", text),
+            field("power_lost", flag),
+            field("battery_runtime", int),
+            field("alarm_enabled", flag),
+            field("alarm_muted", flag),
+        ),
+    ),
+    CommandSchema(
+        TELNET_CMD_NETWORK,
+        "Network",
+        (
+            field("dhcp", flag),
+            field("static_dns", flag),
+            field("hostname", text),
+            field("ip", str.strip),
+            field("subnet", str.strip),
+            field("gateway", str.strip),
+            field("dns1", str.strip),
+            field("dns2", str.strip),
+        ),
+    ),
+    RepeatedSchema(
+        TELNET_CMD_ADAPTER_SENSOR_DATA,
+        "AdapterSensorData",
+        (field("service_tag", text), field("port", int), rest("sensors", sensors)),
+        ";",
+    ),
+)
+
+
+def compile_schema(schema: CommandSchema) -> Callable[[str], Any]:
+    """Compile a schema into a function parsing one reply line.
+
+    The line may be the ``?`` reply or the ``~`` push for the command. A reply
+    with a single field keeps its whole value, commas included; extra values
+    past the last fixed field are ignored. A ``RepeatedSchema`` reply parses
+    into a tuple of records, empty when the device answers ``None``.
+    """
+    fixed = tuple(f.convert for f in schema.fields if not f.rest)
+    tail = tuple(f.convert for f in schema.fields if f.rest)
+    if any(f.rest for f in schema.fields[: len(fixed)]):
+        raise ValueError(f"{schema.command}: rest fields must come last")
+
+    record = namedtuple(schema.record, [f.name for f in schema.fields])
+    command = schema.command
+    key = f"{command[1:]}="
+    offset = len(key) + 1
+    arity = len(fixed)
+    whole = arity == 1 and not tail
+    separator = getattr(schema, "separator", None)
+
+    def build(line: str, value: str) -> Any:
+        values: Any = [value] if whole else value.split(",")
+        if len(values) < arity:
+            return ParseError(
+                command, PARSE_ARITY, line, f"{len(values)} of {arity} values"
+            )
+        try:
+            if tail:
+                remaining = values[arity:]
+                return record(
+                    *[convert(value) for convert, value in zip(fixed, values)],
+                    *[convert(remaining) for convert in tail],
+                )
+            return record._make(map(_apply, fixed, values))
+        except (TypeError, ValueError) as err:
+            return ParseError(command, PARSE_VALUE, line, str(err))
+
+    def parse(line: str) -> Any:
+        if line[:1] not in _REPLY_PREFIXES or not line.startswith(key, 1):
+            reason = (
+                PARSE_DEVICE_ERROR
+                if line.startswith(TELNET_RESPONSE_ERROR)
+                else PARSE_UNEXPECTED
+            )
+            return ParseError(command, reason, line, None)
+
+        if separator is None:
+            return build(line, line[offset:])
+        return _build_records(build, line, line[offset:], separator)
+
+    return parse
+
+
+def _build_records(
+    build: Callable[[str, str], Any], line: str, value: str, separator: str
+) -> Any:
+    """Build the records of a repeated reply, or the first error."""
+    if value.strip() == _NO_RECORDS:
+        return ()
+    records = []
+    for part in value.split(separator):
+        parsed = build(line, part.strip())
+        if isinstance(parsed, ParseError):
+            return parsed
+        records.append(parsed)
+    return tuple(records)
+
+
+def _apply(convert: Callable[[str], Any], value: str) -> Any:
+    """Apply a converter to a value."""
+    return convert(value)
+
+
+PARSERS: dict[str, Callable[[str], Any]] = {
+    schema.command: compile_schema(schema) for schema in SCHEMAS
+}
+
+
+def parse_reply(command: str, line: str) -> Any:
+    """Parse the reply to ``command``, ignoring any ``=argument`` it carries."""
+    return PARSERS[command.split("=", 1)[0]](line)
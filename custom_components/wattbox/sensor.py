@@ -4,19 +4,68 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from typing import Any
 
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import UnitOfElectricPotential, UnitOfPower
+from homeassistant.const import UnitOfElectricPotential, UnitOfEnergy, UnitOfPower
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DOMAIN
+from .const import (
+    DEFAULT_OUTLET_COUNT,
+    DOMAIN,
+    TELEMETRY_KEY,
+    TELNET_CMD_OUTLET_POWER_STATUS,
+)
 from .coordinator import WattboxDataUpdateCoordinator
-from .entity import WattboxDeviceEntity
+from .entity import WattboxDeviceEntity, WattboxOutletEntity
 
 _LOGGER = logging.getLogger(__name__)
 
+# UPSStatus field, name, unit and device class of each UPS sensor
+UPS_SENSORS: tuple[tuple[str, str, str | None, str | None], ...] = (
+    ("battery_charge", "Battery Charge", "%", "battery"),
+    ("battery_load", "Battery Load", "%", None),
+    ("battery_runtime", "Battery Runtime", "min", "duration"),
+    ("battery_health", "Battery Health", None, None),
+)
+
+
+def _create_outlet_power_sensors(
+    coordinator: WattboxDataUpdateCoordinator,
+    config_entry: ConfigEntry,
+) -> list[WattboxOutletMeasurementSensor]:
+    """Create power, current, voltage and energy sensors for every outlet.
+
+    None are created if the device is known not to report per-outlet power.
+    """
+    if not coordinator.is_supported(TELNET_CMD_OUTLET_POWER_STATUS):
+        return []
+
+    outlet_count = DEFAULT_OUTLET_COUNT
+    if coordinator.data:
+        outlet_count = (
+            len(coordinator.data.outlets)
+            or coordinator.data.device.outlet_count
+            or DEFAULT_OUTLET_COUNT
+        )
+
+    sensor_classes: tuple[type[WattboxOutletMeasurementSensor], ...] = (
+        WattboxOutletPowerSensor,
+        WattboxOutletCurrentSensor,
+        WattboxOutletVoltageSensor,
+        WattboxOutletEnergySensor,
+    )
+
+    sensors: list[WattboxOutletMeasurementSensor] = []
+    for outlet_number in range(1, outlet_count + 1):
+        for sensor_class in sensor_classes:
+            sensors.append(
+                sensor_class(coordinator, config_entry.entry_id, outlet_number)
+            )
+    return sensors
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -46,11 +95,30 @@ async def async_setup_entry(
         WattboxVoltageSensor(coordinator, config_entry.entry_id),
         WattboxCurrentSensor(coordinator, config_entry.entry_id),
         WattboxPowerSensor(coordinator, config_entry.entry_id),
+        WattboxEnergySensor(coordinator, config_entry.entry_id),
+        WattboxVoltageEventCountSensor(
+            coordinator, config_entry.entry_id, "sags", "Voltage Sags"
+        ),
+        WattboxVoltageEventCountSensor(
+            coordinator, config_entry.entry_id, "swells", "Voltage Swells"
+        ),
+        WattboxVoltageEventCountSensor(
+            coordinator, config_entry.entry_id, "brownouts", "Brownouts"
+        ),
+    ]
+
+    # UPS sensors stay unknown until a UPS is attached
+    ups_sensors = [
+        WattboxUPSSensor(coordinator, config_entry.entry_id, *description)
+        for description in UPS_SENSORS
     ]
 
+    # Create per-outlet power monitoring sensors
+    outlet_sensors = _create_outlet_power_sensors(coordinator, config_entry)
+
     # Combine all sensors and filter out any None sensors
     # v0.2.10: Enhanced safety to prevent NoneType errors
-    all_sensors = sensors + power_sensors
+    all_sensors = sensors + power_sensors + ups_sensors + outlet_sensors
     valid_sensors = []
     for sensor in all_sensors:
         if sensor is not None:
@@ -82,14 +150,14 @@ class WattboxFirmwareSensor(WattboxDeviceEntity, SensorEntity):
         super().__init__(coordinator, {}, f"{entry_id}_firmware")
         self._attr_name = "Firmware"
         self._attr_device_class = None
+        self._coordinator_keys = ("device.hardware_version",)
 
     @property
     def native_value(self) -> str | None:
         """Return the firmware value."""
         if not self.coordinator.data:
             return None
-        device_info = self.coordinator.data.get("device_info", {})
-        return device_info.get("hardware_version")
+        return self.coordinator.data.device.hardware_version
 
 
 class WattboxModelSensor(WattboxDeviceEntity, SensorEntity):
@@ -104,14 +172,14 @@ class WattboxModelSensor(WattboxDeviceEntity, SensorEntity):
         super().__init__(coordinator, {}, f"{entry_id}_model")
         self._attr_name = "Model"
         self._attr_device_class = None
+        self._coordinator_keys = ("device.model",)
 
     @property
     def native_value(self) -> str | None:
         """Return the model value."""
         if not self.coordinator.data:
             return None
-        device_info = self.coordinator.data.get("device_info", {})
-        return device_info.get("model")
+        return self.coordinator.data.device.model
 
 
 class WattboxSerialSensor(WattboxDeviceEntity, SensorEntity):
@@ -126,14 +194,14 @@ class WattboxSerialSensor(WattboxDeviceEntity, SensorEntity):
         super().__init__(coordinator, {}, f"{entry_id}_serial")
         self._attr_name = "Serial Number"
         self._attr_device_class = None
+        self._coordinator_keys = ("device.serial_number",)
 
     @property
     def native_value(self) -> str | None:
         """Return the serial value."""
         if not self.coordinator.data:
             return None
-        device_info = self.coordinator.data.get("device_info", {})
-        return device_info.get("serial_number")
+        return self.coordinator.data.device.serial_number
 
 
 class WattboxHostnameSensor(WattboxDeviceEntity, SensorEntity):
@@ -148,19 +216,42 @@ class WattboxHostnameSensor(WattboxDeviceEntity, SensorEntity):
         super().__init__(coordinator, {}, f"{entry_id}_hostname")
         self._attr_name = "Hostname"
         self._attr_device_class = None
+        self._coordinator_keys = ("device.hostname",)
 
     @property
     def native_value(self) -> str | None:
         """Return the hostname value."""
         if not self.coordinator.data:
             return None
-        device_info = self.coordinator.data.get("device_info", {})
-        return device_info.get("hostname")
+        return self.coordinator.data.device.hostname
+
+
+class WattboxStatisticsSensor(WattboxDeviceEntity, SensorEntity):
+    """Base class for device readings with rolling statistics attributes."""
+
+    _measurement: str
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return min, mean and max over the statistics window."""
+        window = self.coordinator.statistics_window
+        stats = self.coordinator.telemetry.stats(self._measurement, window)
+        if stats is None:
+            return None
+        return {
+            "window": window,
+            "samples": stats.count,
+            "minimum": stats.minimum,
+            "mean": stats.mean,
+            "maximum": stats.maximum,
+        }
 
 
-class WattboxVoltageSensor(WattboxDeviceEntity, SensorEntity):
+class WattboxVoltageSensor(WattboxStatisticsSensor):
     """Representation of a Wattbox voltage sensor."""
 
+    _measurement = "voltage"
+
     def __init__(
         self,
         coordinator: WattboxDataUpdateCoordinator,
@@ -171,18 +262,21 @@ class WattboxVoltageSensor(WattboxDeviceEntity, SensorEntity):
         self._attr_name = "Voltage"
         self._attr_native_unit_of_measurement = UnitOfElectricPotential.VOLT
         self._attr_device_class = "voltage"
+        self._coordinator_keys = ("power.voltage", TELEMETRY_KEY)
 
     @property
     def native_value(self) -> float | None:
         """Return the voltage value."""
         if not self.coordinator.data:
             return None
-        return self.coordinator.data.get("voltage")
+        return self.coordinator.data.power.voltage
 
 
-class WattboxCurrentSensor(WattboxDeviceEntity, SensorEntity):
+class WattboxCurrentSensor(WattboxStatisticsSensor):
     """Representation of a Wattbox current sensor."""
 
+    _measurement = "current"
+
     def __init__(
         self,
         coordinator: WattboxDataUpdateCoordinator,
@@ -193,18 +287,21 @@ class WattboxCurrentSensor(WattboxDeviceEntity, SensorEntity):
         self._attr_name = "Current"
         self._attr_native_unit_of_measurement = "A"  # Amperes
         self._attr_device_class = "current"
+        self._coordinator_keys = ("power.current", TELEMETRY_KEY)
 
     @property
     def native_value(self) -> float | None:
         """Return the current value."""
         if not self.coordinator.data:
             return None
-        return self.coordinator.data.get("current")
+        return self.coordinator.data.power.current
 
 
-class WattboxPowerSensor(WattboxDeviceEntity, SensorEntity):
+class WattboxPowerSensor(WattboxStatisticsSensor):
     """Representation of a Wattbox power sensor."""
 
+    _measurement = "power"
+
     def __init__(
         self,
         coordinator: WattboxDataUpdateCoordinator,
@@ -215,10 +312,218 @@ class WattboxPowerSensor(WattboxDeviceEntity, SensorEntity):
         self._attr_name = "Power"
         self._attr_native_unit_of_measurement = UnitOfPower.WATT
         self._attr_device_class = "power"
+        self._coordinator_keys = ("power.power", TELEMETRY_KEY)
 
     @property
     def native_value(self) -> float | None:
         """Return the power value."""
         if not self.coordinator.data:
             return None
-        return self.coordinator.data.get("power")
+        return self.coordinator.data.power.power
+
+
+class WattboxEnergySensor(WattboxDeviceEntity, SensorEntity):
+    """Energy used by the device, integrated from its power readings."""
+
+    def __init__(
+        self,
+        coordinator: WattboxDataUpdateCoordinator,
+        entry_id: str,
+    ) -> None:
+        """Initialize the energy sensor."""
+        super().__init__(coordinator, {}, f"{entry_id}_energy")
+        self._attr_name = "Energy"
+        self._attr_native_unit_of_measurement = UnitOfEnergy.KILO_WATT_HOUR
+        self._attr_device_class = "energy"
+        self._attr_state_class = "total_increasing"
+        self._attr_suggested_display_precision = 3
+        self._coordinator_keys = ("energy.total",)
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the energy value."""
+        if not self.coordinator.data:
+            return None
+        return self.coordinator.data.energy.total
+
+
+class WattboxVoltageEventCountSensor(WattboxDeviceEntity, SensorEntity):
+    """Number of voltage sags, swells or brownouts since startup."""
+
+    def __init__(
+        self,
+        coordinator: WattboxDataUpdateCoordinator,
+        entry_id: str,
+        count: str,
+        name: str,
+    ) -> None:
+        """Initialize the voltage event count sensor."""
+        super().__init__(coordinator, {}, f"{entry_id}_voltage_{count}")
+        self._count = count
+        self._attr_name = name
+        self._attr_state_class = "total_increasing"
+        self._coordinator_keys = (f"quality.{count}",)
+
+    @property
+    def native_value(self) -> int | None:
+        """Return the event count."""
+        if not self.coordinator.data:
+            return None
+        return getattr(self.coordinator.data.quality, self._count)
+
+
+class WattboxUPSSensor(WattboxDeviceEntity, SensorEntity):
+    """A ?UPSStatus reading.
+
+    Polled every few seconds while the UPS is on battery, so battery runtime
+    stays fresh for shutdown automations.
+    """
+
+    def __init__(
+        self,
+        coordinator: WattboxDataUpdateCoordinator,
+        entry_id: str,
+        field: str,
+        name: str,
+        unit: str | None,
+        device_class: str | None,
+    ) -> None:
+        """Initialize the UPS sensor."""
+        super().__init__(coordinator, {}, f"{entry_id}_ups_{field}")
+        self._field = field
+        self._attr_name = name
+        self._attr_native_unit_of_measurement = unit
+        self._attr_device_class = device_class
+        if unit is not None:
+            self._attr_state_class = "measurement"
+        self._coordinator_keys = ("connected", f"ups.{field}")
+
+    @property
+    def native_value(self) -> int | str | None:
+        """Return the UPS reading."""
+        if not self.coordinator.data or not self.coordinator.data.connected:
+            return None
+        return getattr(self.coordinator.data.ups, self._field)
+
+
+class WattboxOutletMeasurementSensor(WattboxOutletEntity, SensorEntity):
+    """Base class for per-outlet readings from ?OutletPowerStatus."""
+
+    _measurement: str
+
+    def __init__(
+        self,
+        coordinator: WattboxDataUpdateCoordinator,
+        entry_id: str,
+        outlet_number: int,
+    ) -> None:
+        """Initialize the outlet sensor."""
+        super().__init__(
+            coordinator,
+            {},
+            f"{entry_id}_outlet_{outlet_number}_{self._measurement}",
+            outlet_number,
+        )
+        self._coordinator_keys = (f"outlets.{outlet_number}.{self._measurement}",)
+
+    async def async_added_to_hass(self) -> None:
+        """Ask the coordinator to poll this outlet while the entity is enabled."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.coordinator.async_add_outlet_power_entity(self._outlet_number)
+        )
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the outlet reading."""
+        if not self.coordinator.data:
+            return None
+        outlet = self.coordinator.data.outlet(self._outlet_number)
+        if outlet is None:
+            return None
+        return getattr(outlet, self._measurement)
+
+
+class WattboxOutletPowerSensor(WattboxOutletMeasurementSensor):
+    """Representation of a Wattbox outlet power sensor."""
+
+    _measurement = "power"
+
+    def __init__(
+        self,
+        coordinator: WattboxDataUpdateCoordinator,
+        entry_id: str,
+        outlet_number: int,
+    ) -> None:
+        """Initialize the outlet power sensor."""
+        super().__init__(coordinator, entry_id, outlet_number)
+        self._attr_name = f"Outlet {outlet_number} Power"
+        self._attr_native_unit_of_measurement = UnitOfPower.WATT
+        self._attr_device_class = "power"
+
+
+class WattboxOutletCurrentSensor(WattboxOutletMeasurementSensor):
+    """Representation of a Wattbox outlet current sensor."""
+
+    _measurement = "current"
+
+    def __init__(
+        self,
+        coordinator: WattboxDataUpdateCoordinator,
+        entry_id: str,
+        outlet_number: int,
+    ) -> None:
+        """Initialize the outlet current sensor."""
+        super().__init__(coordinator, entry_id, outlet_number)
+        self._attr_name = f"Outlet {outlet_number} Current"
+        self._attr_native_unit_of_measurement = "A"  # Amperes
+        self._attr_device_class = "current"
+        self._attr_entity_registry_enabled_default = False
+
+
+class WattboxOutletVoltageSensor(WattboxOutletMeasurementSensor):
+    """Representation of a Wattbox outlet voltage sensor."""
+
+    _measurement = "voltage"
+
+    def __init__(
+        self,
+        coordinator: WattboxDataUpdateCoordinator,
+        entry_id: str,
+        outlet_number: int,
+    ) -> None:
+        """Initialize the outlet voltage sensor."""
+        super().__init__(coordinator, entry_id, outlet_number)
+        self._attr_name = f"Outlet {outlet_number} Voltage"
+        self._attr_native_unit_of_measurement = UnitOfElectricPotential.VOLT
+        self._attr_device_class = "voltage"
+        # Every outlet shares the supply voltage
+        self._attr_entity_registry_enabled_default = False
+
+
+class WattboxOutletEnergySensor(WattboxOutletMeasurementSensor):
+    """Energy used by an outlet, integrated from its power readings."""
+
+    _measurement = "energy"
+
+    def __init__(
+        self,
+        coordinator: WattboxDataUpdateCoordinator,
+        entry_id: str,
+        outlet_number: int,
+    ) -> None:
+        """Initialize the outlet energy sensor."""
+        super().__init__(coordinator, entry_id, outlet_number)
+        self._attr_name = f"Outlet {outlet_number} Energy"
+        self._attr_native_unit_of_measurement = UnitOfEnergy.KILO_WATT_HOUR
+        self._attr_device_class = "energy"
+        self._attr_state_class = "total_increasing"
+        self._attr_suggested_display_precision = 3
+        self._coordinator_keys = (f"energy.outlets.{outlet_number}",)
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the outlet energy value."""
+        if not self.coordinator.data:
+            return None
+        return self.coordinator.data.energy.outlet(self._outlet_number)
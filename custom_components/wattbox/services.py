@@ -0,0 +1,93 @@
+"""Services for the Wattbox integration."""
+
+from __future__ import annotations
+
+import logging
+
+import voluptuous as vol
+from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.exceptions import HomeAssistantError
+
+from .const import (
+    ATTR_ENTRY_ID,
+    ATTR_OUTLETS,
+    DOMAIN,
+    OUTLET_ACTIONS,
+    SERVICE_SET_OUTLETS,
+)
+from .coordinator import WattboxDataUpdateCoordinator
+from .telnet_client import WattboxTelnetError
+
+_LOGGER = logging.getLogger(__name__)
+
+SET_OUTLETS_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_ENTRY_ID): str,
+        vol.Required(ATTR_OUTLETS): vol.Schema(
+            {vol.Coerce(int): vol.All(vol.Lower, vol.In(OUTLET_ACTIONS))}
+        ),
+    }
+)
+
+
+def _get_coordinator(
+    hass: HomeAssistant, entry_id: str | None
+) -> WattboxDataUpdateCoordinator:
+    """Return the coordinator a service call is for.
+
+    The entry may be left out when only one Wattbox is configured.
+    """
+    coordinators = {
+        key: value
+        for key, value in hass.data.get(DOMAIN, {}).items()
+        if isinstance(value, WattboxDataUpdateCoordinator)
+    }
+    if entry_id is not None:
+        if entry_id not in coordinators:
+            raise HomeAssistantError(f"Unknown Wattbox entry: {entry_id}")
+        return coordinators[entry_id]
+    if len(coordinators) != 1:
+        raise HomeAssistantError(
+            f"{ATTR_ENTRY_ID} is required when {len(coordinators)} Wattboxes "
+            "are configured"
+        )
+    return next(iter(coordinators.values()))
+
+
+async def _async_set_outlets(hass: HomeAssistant, call: ServiceCall) -> None:
+    """Handle the set_outlets service."""
+    coordinator = _get_coordinator(hass, call.data.get(ATTR_ENTRY_ID))
+    actions = {
+        int(number): action for number, action in call.data[ATTR_OUTLETS].items()
+    }
+    try:
+        await coordinator.async_set_outlet_states(actions)
+    except ValueError as err:
+        raise HomeAssistantError(str(err)) from err
+    except WattboxTelnetError as err:
+        raise HomeAssistantError(
+            f"Failed to set Wattbox outlets {sorted(actions)}: {err}"
+        ) from err
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the integration services once."""
+    if hass.services.has_service(DOMAIN, SERVICE_SET_OUTLETS):
+        return
+
+    async def set_outlets(call: ServiceCall) -> None:
+        await _async_set_outlets(hass, call)
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_SET_OUTLETS, set_outlets, schema=SET_OUTLETS_SCHEMA
+    )
+
+
+def async_unload_services(hass: HomeAssistant) -> None:
+    """Remove the integration services once no entries are left."""
+    if any(
+        isinstance(value, WattboxDataUpdateCoordinator)
+        for value in hass.data.get(DOMAIN, {}).values()
+    ):
+        return
+    hass.services.async_remove(DOMAIN, SERVICE_SET_OUTLETS)
@@ -0,0 +1,46 @@
+"""Coalesce concurrent identical fetches into one."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Hashable
+from typing import Callable, TypeVar
+
+_T = TypeVar("_T")
+
+
+class SingleFlight:
+    """Share one in-flight call between concurrent callers with the same key.
+
+    The first caller for a key starts the call; anyone asking for the same key
+    before it finishes awaits that call and gets its result or exception.
+    The call runs as its own task, so one caller being cancelled does not
+    cancel it for the others. Once it finishes, the next caller starts a new
+    one.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the group."""
+        self._calls: dict[Hashable, asyncio.Future] = {}
+
+    @property
+    def in_flight(self) -> int:
+        """Return the number of calls currently running."""
+        return len(self._calls)
+
+    async def async_do(self, key: Hashable, call: Callable[[], Awaitable[_T]]) -> _T:
+        """Return the result of ``call``, joining a running call for ``key``."""
+        future = self._calls.get(key)
+        if future is None:
+            future = asyncio.ensure_future(call())
+            self._calls[key] = future
+            future.add_done_callback(lambda done: self._forget(key, done))
+        return await asyncio.shield(future)
+
+    def _forget(self, key: Hashable, future: asyncio.Future) -> None:
+        """Drop a finished call so the next caller starts afresh."""
+        if self._calls.get(key) is future:
+            del self._calls[key]
+        if not future.cancelled():
+            # Every caller may have been cancelled; don't warn about the result
+            future.exception()
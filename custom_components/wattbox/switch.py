@@ -21,16 +21,14 @@ _LOGGER = logging.getLogger(__name__)
 def _create_outlet_switches(
     coordinator: WattboxDataUpdateCoordinator,
     config_entry: ConfigEntry,
-    outlet_info: list,
+    outlet_count: int,
 ) -> list[WattboxSwitch]:
     """Create WattboxSwitch instances for outlets."""
     switches = []
-    for i, _outlet in enumerate(outlet_info):
+    for i in range(outlet_count):
         switch = WattboxSwitch(
             coordinator=coordinator,
-            device_info=(
-                coordinator.data.get("device_info", {}) if coordinator.data else {}
-            ),
+            device_info=coordinator.data.device if coordinator.data else None,
             unique_id=f"{config_entry.entry_id}_outlet_{i + 1}",
             outlet_number=i + 1,
         )
@@ -53,22 +51,18 @@ async def async_setup_entry(
 
     coordinator: WattboxDataUpdateCoordinator = hass.data[DOMAIN][config_entry.entry_id]
 
-    # Get outlet info from coordinator data - handle missing data gracefully
-    outlet_info = coordinator.data.get("outlet_info", []) if coordinator.data else []
-
-    # Ensure outlet_info is a list and not None
-    if outlet_info is None:
-        outlet_info = []
+    # Get the outlet count from coordinator data - handle missing data gracefully
+    outlet_count = len(coordinator.data.outlets) if coordinator.data else 0
 
     # If no outlet data is available yet, create a default set of switches
     # This ensures entities are created even before first data fetch
-    if not outlet_info:
+    if not outlet_count:
         _LOGGER.info("No outlet data available yet, creating default switches")
         # Create switches for 18 outlets (typical for 800 series)
-        outlet_info = [{"state": 0} for _ in range(18)]
+        outlet_count = 18
 
     # Create switches for each outlet
-    switches = _create_outlet_switches(coordinator, config_entry, outlet_info)
+    switches = _create_outlet_switches(coordinator, config_entry, outlet_count)
 
     # Filter out any None switches and add only valid ones
     valid_switches = [switch for switch in switches if switch is not None]
@@ -93,7 +87,7 @@ class WattboxSwitch(WattboxOutletEntity, SwitchEntity):
     def __init__(
         self,
         coordinator: WattboxDataUpdateCoordinator,
-        device_info: dict[str, Any],
+        device_info: Any,
         unique_id: str,
         outlet_number: int,
     ) -> None:
@@ -101,17 +95,18 @@ class WattboxSwitch(WattboxOutletEntity, SwitchEntity):
         super().__init__(coordinator, device_info, unique_id, outlet_number)
         self._attr_name = f"Outlet {outlet_number}"
         self._attr_device_class = "outlet"
+        self._coordinator_keys = (f"outlets.{outlet_number}.state",)
 
     @property
     def is_on(self) -> bool | None:
         """Return true if the switch is on."""
         if not self.coordinator.data:
             return None
-        outlet_info = self.coordinator.data.get("outlet_info", [])
-        if self._outlet_number <= len(outlet_info):
-            outlet = outlet_info[self._outlet_number - 1]
-            return bool(outlet.get("state", 0))
-        return None
+        outlet = self.coordinator.data.outlet(self._outlet_number)
+        # State is unknown until the first refresh after a profile load
+        if outlet is None or outlet.state is None:
+            return None
+        return bool(outlet.state)
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the switch on."""
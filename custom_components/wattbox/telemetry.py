@@ -0,0 +1,138 @@
+"""Fixed-size telemetry history for rolling statistics."""
+
+from __future__ import annotations
+
+import math
+from array import array
+from collections.abc import Iterator
+
+from .const import TELEMETRY_CAPACITY, TELEMETRY_METRICS
+from .models import PowerStatus, WindowStats
+
+_NAN = math.nan
+# Readings are stored as 32-bit floats; round statistics to hide the noise
+_PRECISION = 3
+
+
+class TelemetryBuffer:
+    """Ring buffer of voltage, current and power readings.
+
+    Readings live in preallocated ``array('f')`` columns next to an
+    ``array('d')`` of monotonic sample times, so recording a sample writes a
+    few floats in place instead of allocating objects. Once full, the oldest
+    sample is overwritten. Missing readings are stored as NaN and left out of
+    statistics.
+    """
+
+    def __init__(self, capacity: int = TELEMETRY_CAPACITY) -> None:
+        """Initialize an empty buffer holding up to ``capacity`` samples."""
+        if capacity < 1:
+            raise ValueError("Telemetry capacity must be at least 1")
+        self._capacity = capacity
+        self._times = array("d", bytes(8 * capacity))
+        self._columns = {
+            metric: array("f", [_NAN]) * capacity for metric in TELEMETRY_METRICS
+        }
+        self._next = 0
+        self._size = 0
+        # Samples recorded since startup, including overwritten ones
+        self.recorded = 0
+
+    @property
+    def capacity(self) -> int:
+        """Return the maximum number of samples kept."""
+        return self._capacity
+
+    def __len__(self) -> int:
+        """Return the number of samples kept."""
+        return self._size
+
+    @property
+    def latest_time(self) -> float | None:
+        """Return the time of the newest sample."""
+        if not self._size:
+            return None
+        return self._times[self._index(0)]
+
+    def record(self, now: float, power: PowerStatus) -> None:
+        """Record the readings of a power status poll taken at ``now``."""
+        index = self._next
+        self._times[index] = now
+        for metric, column in self._columns.items():
+            value = getattr(power, metric)
+            column[index] = _NAN if value is None else value
+        self._next = (index + 1) % self._capacity
+        self._size = min(self._size + 1, self._capacity)
+        self.recorded += 1
+
+    def _index(self, offset: int) -> int:
+        """Return the buffer index of the sample ``offset`` places before the newest."""
+        return (self._next - 1 - offset) % self._capacity
+
+    def _windows(self, window: float, span: float | None) -> Iterator[range]:
+        """Yield newest-first offset ranges of the samples in each window."""
+        latest = self.latest_time
+        first = 0
+        bucket = 0.0
+        for offset in range(self._size):
+            age = latest - self._times[self._index(offset)]
+            if span is not None and age >= span:
+                break
+            if age // window != bucket:
+                if offset > first:
+                    yield range(first, offset)
+                first = offset
+                bucket = age // window
+        else:
+            offset = self._size
+        if offset > first:
+            yield range(first, offset)
+
+    def _summarize(self, metric: str, offsets: range) -> WindowStats | None:
+        """Return statistics over the readings at ``offsets``, skipping NaN."""
+        column = self._columns[metric]
+        count = 0
+        total = 0.0
+        minimum = math.inf
+        maximum = -math.inf
+        for offset in offsets:
+            value = column[self._index(offset)]
+            if math.isnan(value):
+                continue
+            count += 1
+            total += value
+            minimum = min(minimum, value)
+            maximum = max(maximum, value)
+        if not count:
+            return None
+        return WindowStats(
+            self._times[self._index(offsets[-1])],
+            self._times[self._index(offsets[0])],
+            count,
+            round(minimum, _PRECISION),
+            round(total / count, _PRECISION),
+            round(maximum, _PRECISION),
+        )
+
+    def stats(self, metric: str, window: float) -> WindowStats | None:
+        """Return statistics over the ``window`` seconds up to the newest sample."""
+        buckets = self.downsample(metric, window, window)
+        return buckets[-1] if buckets else None
+
+    def downsample(
+        self, metric: str, window: float, span: float | None = None
+    ) -> list[WindowStats]:
+        """Return statistics per ``window`` seconds, oldest first.
+
+        Windows are counted back from the newest sample and cover ``span``
+        seconds, or the whole buffer. Windows without readings are left out.
+        """
+        if not self._size:
+            return []
+        buckets = []
+        for offsets in self._windows(window, span):
+            stats = self._summarize(metric, offsets)
+            if stats is not None:
+                buckets.append(stats)
+        buckets.reverse()
+        return buckets
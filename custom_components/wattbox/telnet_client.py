@@ -3,18 +3,27 @@
 from __future__ import annotations
 
 import asyncio
+import functools
+import itertools
 import logging
-from typing import Any
+from typing import Any, Callable, Iterable, Mapping
 
 import telnetlib3
 
 from .const import (
+    CAPABILITY_PROBE_COMMANDS,
+    COMMAND_PRIORITY_CONTROL,
+    COMMAND_PRIORITY_TELEMETRY,
+    OUTLET_ACTION_RESET,
+    OUTLET_ACTIONS,
+    OUTLET_ALL,
     TELNET_CMD_AUTO_REBOOT,
     TELNET_CMD_FIRMWARE,
     TELNET_CMD_HOSTNAME,
     TELNET_CMD_MODEL,
     TELNET_CMD_OUTLET_COUNT,
     TELNET_CMD_OUTLET_NAME,
+    TELNET_CMD_OUTLET_POWER_STATUS,
     TELNET_CMD_OUTLET_SET,
     TELNET_CMD_OUTLET_STATUS,
     TELNET_CMD_POWER_STATUS,
@@ -24,12 +33,45 @@ from .const import (
     TELNET_LOGIN_SUCCESS,
     TELNET_PASSWORD_PROMPT,
     TELNET_PORT,
+    TELNET_READ_CHUNK_SIZE,
+    TELNET_RESPONSE_ERROR,
+    TELNET_RESPONSE_OK,
     TELNET_TIMEOUT,
+    TELNET_UNSOLICITED_PREFIX,
     TELNET_USERNAME_PROMPT,
 )
+from .models import (
+    DeviceIdentity,
+    OutletState,
+    PowerStatus,
+    UPSStatus,
+    WattboxSnapshot,
+    evolve,
+    mask_outlets,
+    replace_outlet,
+)
+from .protocol import (
+    FRAME_ERROR,
+    FRAME_OK,
+    FRAME_PUSH,
+    Frame,
+    WattboxFrameParser,
+)
+from .schema import PARSE_DEVICE_ERROR, ParseError, parse_reply
+from .singleflight import SingleFlight
 
 _LOGGER = logging.getLogger(__name__)
 
+# Device info queries and the identity field each one fills
+_DEVICE_INFO_COMMANDS = (
+    (TELNET_CMD_FIRMWARE, "hardware_version"),
+    (TELNET_CMD_MODEL, "model"),
+    (TELNET_CMD_SERVICE_TAG, "serial_number"),
+    (TELNET_CMD_HOSTNAME, "hostname"),
+    (TELNET_CMD_AUTO_REBOOT, "auto_reboot"),
+    (TELNET_CMD_OUTLET_COUNT, "outlet_count"),
+)
+
 
 class WattboxTelnetError(Exception):
     """Base exception for Wattbox Telnet errors."""
@@ -43,6 +85,60 @@ class WattboxAuthenticationError(WattboxTelnetError):
     """Exception raised when authentication fails."""
 
 
+def _response_prefix(command: str) -> str:
+    """Return the line prefix the device uses to answer a command.
+
+    Request messages (``?Key`` or ``?Key=ARG``) are echoed back as ``?Key=...``;
+    control messages (``!Key=...``) are acknowledged with a bare ``OK``.
+    """
+    if command.startswith("?"):
+        return command.split("=", 1)[0] + "="
+    return TELNET_RESPONSE_OK
+
+
+def _base_command(command: str) -> str:
+    """Return a command without its ``=argument``."""
+    return command.split("=", 1)[0]
+
+
+def _outlet_set_commands(actions: Mapping[int, str], outlet_count: int) -> list[str]:
+    """Build the !OutletSet commands for a set of outlet actions.
+
+    Commands are sent in the order the actions are given. Resetting every
+    outlet, either through outlet 0 or by listing them all, becomes one
+    command to outlet 0; the device accepts outlet 0 for RESET only.
+    """
+    actions = {number: action.lower() for number, action in actions.items()}
+    for number, action in actions.items():
+        if action not in OUTLET_ACTIONS:
+            raise ValueError(f"Invalid action for outlet {number}: {action}")
+        if number == OUTLET_ALL and action != OUTLET_ACTION_RESET:
+            raise ValueError(f"Outlet {OUTLET_ALL} only supports {OUTLET_ACTION_RESET}")
+
+    resets = {n for n, action in actions.items() if action == OUTLET_ACTION_RESET}
+    reset_all = OUTLET_ALL in resets or (
+        outlet_count > 0 and resets.issuperset(range(1, outlet_count + 1))
+    )
+    commands = []
+    if reset_all:
+        commands.append(f"{TELNET_CMD_OUTLET_SET}={OUTLET_ALL},RESET")
+    for number in actions:
+        if reset_all and number in resets:
+            continue
+        commands.append(f"{TELNET_CMD_OUTLET_SET}={number},{actions[number].upper()}")
+    return commands
+
+
+def _matches_response(command: str, frame: Frame) -> bool:
+    """Return True if a response frame answers the given command."""
+    if frame.kind == FRAME_ERROR:
+        return True
+    prefix = _response_prefix(command)
+    if prefix == TELNET_RESPONSE_OK:
+        return frame.kind == FRAME_OK
+    return frame.key == prefix
+
+
 class WattboxTelnetClient:
     """Telnet client for Wattbox devices."""
 
@@ -63,40 +159,33 @@ class WattboxTelnetClient:
         self._reader: telnetlib3.TelnetReader | None = None
         self._writer: telnetlib3.TelnetWriter | None = None
         self._connected = False
-        self._device_data: dict[str, Any] = {
-            "device_info": {
-                "hardware_version": None,
-                "model": None,
-                "serial_number": None,
-                "hostname": None,
-                "auto_reboot": None,
-            },
-            "outlet_info": [],
-            "status_info": {
-                "power_status": {
-                    "current": None,
-                    "power": None,
-                    "voltage": None,
-                    "safe_voltage": None,
-                },
-                "ups_status": {
-                    "battery_charge": None,
-                    "battery_load": None,
-                    "battery_health": None,
-                    "power_lost": None,
-                    "battery_runtime": None,
-                    "alarm_enabled": None,
-                    "alarm_muted": None,
-                },
-                "ups_connected": None,
-            },
-        }
+        self._parser = WattboxFrameParser()
+        self._pending: list[tuple[str, asyncio.Future[str]]] = []
+        self._read_task: asyncio.Task[None] | None = None
+        self._command_queue: (
+            asyncio.PriorityQueue[tuple[int, int, list[str], asyncio.Future[list[str]]]]
+            | None
+        ) = None
+        self._command_sequence = itertools.count()
+        self._command_task: asyncio.Task[None] | None = None
+        self._outlet_status_listeners: list[
+            Callable[[tuple[OutletState, ...]], None]
+        ] = []
+        self._snapshot = WattboxSnapshot.empty()
+        # Outlet states as a bitmask (bit 0 is outlet 1), mirroring the snapshot
+        self._outlet_mask = 0
+        # Fetches in flight, shared by concurrent callers
+        self._fetches = SingleFlight()
+        # Queries the device answers with #Error, skipped when polling
+        self._unsupported: frozenset[str] = frozenset()
+        # Firmware is re-read once per connection to notice upgrades
+        self._firmware_checked = False
 
     async def async_connect(self) -> None:
         """Connect to the Wattbox device."""
         try:
             self._reader, self._writer = await asyncio.wait_for(
-                telnetlib3.open_connection(self._host, self._port),
+                telnetlib3.open_connection(self._host, self._port, encoding=False),
                 timeout=self._timeout,
             )
 
@@ -110,7 +199,10 @@ class WattboxTelnetClient:
 
             # Wait for login success
             await self._wait_for_prompt(TELNET_LOGIN_SUCCESS)
+            self._parser.reset()
+            self._firmware_checked = False
             self._connected = True
+            self._start_read_loop()
 
         except asyncio.TimeoutError as err:
             raise WattboxConnectionError(
@@ -123,10 +215,14 @@ class WattboxTelnetClient:
 
     async def async_disconnect(self) -> None:
         """Disconnect from the Wattbox device."""
+        await self._stop_command_loop(WattboxConnectionError("Disconnected"))
+        await self._stop_read_loop()
         if self._writer:
             self._writer.close()
             await self._writer.wait_closed()
         self._connected = False
+        self._parser.reset()
+        self._fail_pending(WattboxConnectionError("Disconnected"))
 
     async def _wait_for_prompt(self, prompt: str) -> str:
         """Wait for a specific prompt and return the response."""
@@ -138,11 +234,7 @@ class WattboxTelnetClient:
                 self._reader.readuntil(prompt.encode()),
                 timeout=self._timeout,
             )
-            # Handle both bytes and str (telnetlib3 may return either)
-            if isinstance(response, bytes):
-                return response.decode().strip()
-            else:
-                return str(response).strip()
+            return response.decode(errors="ignore").strip()
         except asyncio.TimeoutError as err:
             raise WattboxConnectionError(
                 f"Timeout waiting for prompt: {prompt}"
@@ -153,161 +245,352 @@ class WattboxTelnetClient:
         if not self._writer:
             raise WattboxConnectionError("Not connected")
 
-        self._writer.write(command + "\r\n")
+        self._writer.write(f"{command}\r\n".encode())
         await self._writer.drain()
 
     async def async_send_command(self, command: str) -> str:
-        """Send a command and return the response."""
+        """Send a command and return the response line that answers it.
+
+        The response is matched by its echoed ``?Key=`` prefix (or ``OK`` for
+        control commands), so this returns as soon as the device answers.
+        Stale or unsolicited lines read in the meantime are discarded.
+        """
+        responses = await self.async_send_batch([command])
+        return responses[0]
+
+    async def async_send_batch(
+        self, commands: list[str], priority: int | None = None
+    ) -> list[str]:
+        """Pipeline several commands in one write and return their responses.
+
+        Responses are sorted back to the command that requested them by key
+        and returned in the same order as ``commands``, so a whole batch costs
+        a single round trip.
+
+        Batches go through a single-writer queue, so only one exchange is on
+        the wire at a time. Batches containing control (``!``) commands run at
+        control priority and jump ahead of queued telemetry reads unless a
+        ``priority`` is given.
+        """
         if not self._connected:
             raise WattboxConnectionError("Not connected")
+        if not commands:
+            return []
+        if not self._writer:
+            raise WattboxConnectionError("Not connected")
 
-        # Flush any pending data in the buffer before sending new command
-        await self._flush_buffer()
+        if priority is None:
+            priority = (
+                COMMAND_PRIORITY_CONTROL
+                if any(command.startswith("!") for command in commands)
+                else COMMAND_PRIORITY_TELEMETRY
+            )
 
-        await self._send_command(command)
+        if self._command_queue is None:
+            self._command_queue = asyncio.PriorityQueue()
+        future: asyncio.Future[list[str]] = asyncio.get_running_loop().create_future()
+        self._command_queue.put_nowait(
+            (priority, next(self._command_sequence), list(commands), future)
+        )
+        self._start_command_loop()
+        return await future
+
+    def _start_command_loop(self) -> None:
+        """Start the single-writer command task if it is not already running."""
+        if self._command_task is None or self._command_task.done():
+            self._command_task = asyncio.get_running_loop().create_task(
+                self._async_command_loop()
+            )
 
-        # Wait for command to be processed
-        await asyncio.sleep(0.2)
+    async def _stop_command_loop(self, err: Exception) -> None:
+        """Cancel the command task and fail every queued batch."""
+        task, self._command_task = self._command_task, None
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+        queue = self._command_queue
+        while queue is not None and not queue.empty():
+            *_, future = queue.get_nowait()
+            if not future.done():
+                future.set_exception(err)
+
+    async def _async_command_loop(self) -> None:
+        """Run queued batches one at a time, highest priority first."""
+        assert self._command_queue is not None
+        while True:
+            _priority, _sequence, commands, future = await self._command_queue.get()
+            if future.done():
+                # The caller gave up while the batch was queued
+                continue
+            try:
+                responses = await self._async_exchange(commands)
+            except asyncio.CancelledError:
+                if not future.done():
+                    future.set_exception(WattboxConnectionError("Disconnected"))
+                raise
+            except Exception as err:
+                if not future.done():
+                    future.set_exception(err)
+            else:
+                if not future.done():
+                    future.set_result(responses)
 
-        # Read the response with a more flexible approach
-        if not self._reader:
+    async def _async_exchange(self, commands: list[str]) -> list[str]:
+        """Write a batch and wait for every response to it."""
+        if not self._connected or not self._writer:
             raise WattboxConnectionError("Not connected")
 
+        loop = asyncio.get_running_loop()
+        futures = [loop.create_future() for _ in commands]
+        self._pending.extend(zip(commands, futures))
+        self._start_read_loop()
+
         try:
-            # Use read() instead of readuntil() for more flexible response handling
-            # This allows us to get whatever response is available
-            response = await asyncio.wait_for(
-                self._reader.read(1024),
-                timeout=self._timeout,
+            self._writer.write(
+                "".join(f"{command}\r\n" for command in commands).encode()
+            )
+            await self._writer.drain()
+            return list(
+                await asyncio.wait_for(asyncio.gather(*futures), timeout=self._timeout)
+            )
+        except asyncio.TimeoutError as err:
+            error = WattboxConnectionError(
+                f"Timeout waiting for response to command: {', '.join(commands)}"
             )
+            # A late reply would otherwise resolve the next command with the
+            # same key, so drop the session and let the caller reconnect.
+            await self._async_drop_connection(error)
+            raise error from err
+        finally:
+            self._pending = [
+                (command, future)
+                for command, future in self._pending
+                if future not in futures
+            ]
 
-            # Decode and clean up the response
-            # Handle both bytes and str (telnetlib3 may return either)
-            if isinstance(response, bytes):
-                response_str = response.decode("utf-8", errors="ignore").strip()
-            else:
-                response_str = str(response).strip()
+    def add_outlet_status_listener(
+        self, listener: Callable[[tuple[OutletState, ...]], None]
+    ) -> Callable[[], None]:
+        """Register a listener for unsolicited ~OutletStatus messages.
 
-            return response_str
-        except asyncio.TimeoutError as err:
-            raise WattboxConnectionError(
-                f"Timeout waiting for response to command: {command}"
-            ) from err
+        The listener is called with the updated outlet records whenever the device
+        reports an outlet state change. Returns a callable that removes it.
+        """
+        self._outlet_status_listeners.append(listener)
 
-    async def _flush_buffer(self) -> None:
-        """Flush any pending data in the telnet buffer."""
-        if not self._reader:
-            return
+        def remove_listener() -> None:
+            if listener in self._outlet_status_listeners:
+                self._outlet_status_listeners.remove(listener)
+
+        return remove_listener
 
+    def _start_read_loop(self) -> None:
+        """Start the background reader task if it is not already running."""
+        if self._reader and (self._read_task is None or self._read_task.done()):
+            self._read_task = asyncio.get_running_loop().create_task(
+                self._async_read_loop()
+            )
+
+    async def _stop_read_loop(self) -> None:
+        """Cancel the background reader task."""
+        task, self._read_task = self._read_task, None
+        if task is None or task.done():
+            return
+        task.cancel()
         try:
-            # Try to read any pending data with a short timeout
-            # Use a more robust approach that handles mocks
-            if hasattr(self._reader, "read") and callable(self._reader.read):
-                data = await asyncio.wait_for(
-                    self._reader.read(1024), timeout=0.1  # Very short timeout
-                )
-                if data:
-                    pass  # Data flushed
-        except asyncio.TimeoutError:
-            # No more data to flush
+            await task
+        except asyncio.CancelledError:
             pass
-        except Exception:
-            pass  # Ignore flush errors
 
-    async def async_get_device_info(self) -> dict[str, Any]:
+    async def _async_read_loop(self) -> None:
+        """Read frames from the device and dispatch them until disconnected."""
+        try:
+            while True:
+                for frame in await self._read_frames():
+                    self._dispatch_frame(frame)
+        except Exception as err:
+            if self._connected:
+                _LOGGER.warning("Lost connection to %s: %s", self._host, err)
+            self._connected = False
+            if not isinstance(err, WattboxConnectionError):
+                err = WattboxConnectionError(f"Read failed: {err}")
+            self._fail_pending(err)
+
+    def _dispatch_frame(self, frame: Frame) -> None:
+        """Route a frame to its waiting command or to the push handlers.
+
+        The device answers in order, so a response resolves the oldest
+        pending command it matches.
+        """
+        if frame.kind == FRAME_PUSH:
+            self._handle_unsolicited(frame.line)
+            return
+
+        for index, (command, future) in enumerate(self._pending):
+            if _matches_response(command, frame):
+                del self._pending[index]
+                if not future.done():
+                    future.set_result(frame.line)
+                return
+
+        _LOGGER.debug("Discarding unmatched line: %s", frame.line)
+
+    def _handle_unsolicited(self, line: str) -> None:
+        """Handle an unsolicited message pushed by the device."""
+        _LOGGER.debug("Unsolicited message: %s", line)
+        if not line.startswith(f"{TELNET_UNSOLICITED_PREFIX}OutletStatus="):
+            return
+
+        try:
+            changed = self._parse_outlet_states(line)
+        except Exception as e:
+            _LOGGER.warning("Failed to parse outlet status push %s: %s", line, e)
+            return
+        if not changed:
+            # Pushes repeating the known states cost nothing downstream
+            return
+
+        for listener in list(self._outlet_status_listeners):
+            try:
+                listener(self._snapshot.outlets)
+            except Exception:
+                _LOGGER.exception("Error in outlet status listener")
+
+    async def _async_drop_connection(self, err: Exception) -> None:
+        """Close a session whose response stream can no longer be trusted.
+
+        Runs from the command task, so the task itself keeps going; queued
+        batches fail with ``Not connected`` until the next connect.
+        """
+        self._connected = False
+        await self._stop_read_loop()
+        if self._writer:
+            self._writer.close()
+        self._parser.reset()
+        self._fail_pending(err)
+
+    def _fail_pending(self, err: Exception) -> None:
+        """Fail every command still waiting for a response."""
+        pending, self._pending = self._pending, []
+        for _command, future in pending:
+            if not future.done():
+                future.set_exception(err)
+
+    async def _read_frames(self) -> list[Frame]:
+        """Read from the device until at least one complete frame arrives."""
+        if not self._reader:
+            raise WattboxConnectionError("Not connected")
+
+        while True:
+            chunk = await self._reader.read(TELNET_READ_CHUNK_SIZE)
+            if not chunk:
+                self._connected = False
+                raise WattboxConnectionError("Connection closed by device")
+
+            frames = self._parser.feed(chunk)
+            if frames:
+                return frames
+
+    async def async_get_device_info(self) -> DeviceIdentity:
         """Get device information with proper command sequencing."""
         if not self._connected:
             await self.async_connect()
 
-        # Get device info in sequence with proper delays to avoid command response mixing
-        # Only get device info once per connection to avoid constant changes
+        # Known fields are kept; only firmware is re-read on each connection
+        firmware = self._snapshot.device.hardware_version
         commands = self._build_device_info_commands()
         await self._execute_device_info_commands(commands)
+        self._firmware_checked = True
 
-        # Fix field assignments if they appear to be swapped
-        self._fix_field_assignments()
-
-        return self._device_data["device_info"]
-
-    def _build_device_info_commands(self) -> list[tuple[str, str]]:
-        """Build list of commands to execute for device info."""
-        commands = []
-        if not self._device_data["device_info"].get("hardware_version"):
-            commands.append(("?Firmware", "_parse_firmware_data"))
-        if not self._device_data["device_info"].get("model"):
-            commands.append(("?Model", "_parse_model_data"))
-        if not self._device_data["device_info"].get("serial_number"):
-            commands.append(("?ServiceTag", "_parse_service_tag_data"))
-        if not self._device_data["device_info"].get("hostname"):
-            commands.append(("?Hostname", "_parse_hostname_data"))
-        if not self._device_data["device_info"].get("auto_reboot"):
-            commands.append(("?AutoReboot", "_parse_auto_reboot_data"))
-        return commands
-
-    async def _execute_device_info_commands(
-        self, commands: list[tuple[str, str]]
-    ) -> None:
-        """Execute device info commands with proper sequencing."""
-        for command, parser_method in commands:
-            try:
-                response = await self.async_send_command(command)
-                if response and "=" in response:
-                    data = response.split("=")[1].strip()
-                    # Call the appropriate parser method
-                    getattr(self, parser_method)(data)
-                else:
-                    _LOGGER.warning("No data in response for %s: %s", command, response)
-
-                # Extra delay between commands to ensure proper sequencing
-                await asyncio.sleep(0.3)
-            except Exception as e:
-                _LOGGER.warning("Failed to get %s: %s", command, e)
-
-    def _fix_field_assignments(self) -> None:
-        """Fix field assignments if they appear to be swapped."""
-        device_info = self._device_data["device_info"]
-
-        # Check if fields appear to be swapped based on their content patterns
-        model = device_info.get("model", "")
-        serial = device_info.get("serial_number", "")
-        hostname = device_info.get("hostname", "")
-
-        # If model looks like firmware version (e.g., "2.8.0.0") and we don't have
-        # hardware_version
-        if (
-            model
-            and "." in model
-            and len(model.split(".")) == 4
-            and not device_info.get("hardware_version")
-        ):
+        if firmware and self._snapshot.device.hardware_version != firmware:
             _LOGGER.info(
-                "Model field contains firmware version, moving to hardware_version: %s",
-                model,
+                "Firmware changed from %s to %s, re-reading device info",
+                firmware,
+                self._snapshot.device.hardware_version,
             )
-            device_info["hardware_version"] = model
-            device_info["model"] = None
+            self._forget_device_info()
+            await self._execute_device_info_commands(self._build_device_info_commands())
 
-        # If serial looks like model number (e.g., "WB-800-IPVM-12") and we don't have model
-        if serial and serial.startswith("WB-") and not device_info.get("model"):
-            _LOGGER.info(
-                "Serial field contains model number, moving to model: %s", serial
-            )
-            device_info["model"] = serial
-            device_info["serial_number"] = None
-
-        # If hostname looks like service tag (e.g., "ST201916431G842A") and we don't
-        # have serial_number
-        if (
-            hostname
-            and hostname.startswith("ST")
-            and not device_info.get("serial_number")
-        ):
-            _LOGGER.info(
-                "Hostname field contains service tag, moving to serial_number: %s",
-                hostname,
+        return self._snapshot.device
+
+    def _build_device_info_commands(self) -> list[str]:
+        """Build list of commands to execute for device info.
+
+        Fields already known are skipped, except firmware the first time
+        device info is read on a connection.
+        """
+        device = self._snapshot.device
+        return [
+            command
+            for command, name in _DEVICE_INFO_COMMANDS
+            if not getattr(device, name)
+            or (command == TELNET_CMD_FIRMWARE and not self._firmware_checked)
+        ]
+
+    def _forget_device_info(self) -> None:
+        """Clear identity fields and capabilities learned on older firmware."""
+        self._update_device(
+            **{
+                name: None
+                for _command, name in _DEVICE_INFO_COMMANDS
+                if name != "hardware_version"
+            }
+        )
+        self._unsupported = frozenset()
+
+    async def _execute_device_info_commands(self, commands: list[str]) -> None:
+        """Execute device info commands as a single pipelined batch."""
+        if not commands:
+            return
+
+        await self._async_run_queries(
+            [
+                (command, functools.partial(self._parse_device_info, command))
+                for command in commands
+            ]
+        )
+
+    def _parse_device_info(self, command: str, response: str) -> None:
+        """Parse a device info response into the device identity."""
+        record = self._parse_response(command, response)
+        if record is None:
+            return
+        if command == TELNET_CMD_FIRMWARE:
+            self._parse_firmware_data(record.firmware)
+        else:
+            _LOGGER.info("%s: %s", command[1:], record[0])
+            self._update_device(**record._asdict())
+
+    def _parse_response(self, command: str, response: str) -> Any | None:
+        """Parse a response with the command's schema.
+
+        Returns the parsed record, or None after logging why the response
+        could not be parsed.
+        """
+        try:
+            record = parse_reply(command, response)
+        except KeyError:
+            _LOGGER.warning("No schema for response: %s", response)
+            return None
+        if isinstance(record, ParseError):
+            _LOGGER.log(
+                (
+                    logging.DEBUG
+                    if record.reason == PARSE_DEVICE_ERROR
+                    else logging.WARNING
+                ),
+                "Invalid %s response (%s%s): %s",
+                record.command,
+                record.reason,
+                f": {record.detail}" if record.detail else "",
+                record.line,
             )
-            device_info["serial_number"] = hostname
-            device_info["hostname"] = None
+            return None
+        return record
 
     async def _get_firmware_info(self) -> None:
         """Get firmware information."""
@@ -321,15 +604,15 @@ class WattboxTelnetClient:
                 self._parse_firmware_data(firmware_data)
             else:
                 _LOGGER.warning("No firmware data in response: %s", response)
-                self._device_data["device_info"]["hardware_version"] = None
+                self._update_device(hardware_version=None)
         except Exception as e:
             _LOGGER.warning("Failed to get firmware info: %s", e)
-            self._device_data["device_info"]["hardware_version"] = None
+            self._update_device(hardware_version=None)
 
     def _parse_firmware_data(self, firmware_data: str) -> None:
         """Parse firmware data from device response."""
         if not firmware_data or firmware_data == "0,0,Good,False,0,False,False":
-            self._device_data["device_info"]["hardware_version"] = "Unknown"
+            self._update_device(hardware_version="Unknown")
             return
 
         parts = firmware_data.split(",")
@@ -340,14 +623,14 @@ class WattboxTelnetClient:
             self._parse_complex_firmware(parts[0].strip(), parts[1].strip())
         else:
             _LOGGER.warning("Invalid firmware data format: %s", firmware_data)
-            self._device_data["device_info"]["hardware_version"] = "Unknown"
+            self._update_device(hardware_version="Unknown")
 
     def _parse_simple_firmware(self, firmware_version: str) -> None:
         """Parse simple firmware format (e.g., '1.0.0')."""
         if firmware_version and firmware_version != "0":
             self._update_firmware_if_different(firmware_version)
         else:
-            self._device_data["device_info"]["hardware_version"] = "Unknown"
+            self._update_device(hardware_version="Unknown")
 
     def _parse_complex_firmware(self, version: str, revision: str) -> None:
         """Parse complex firmware format (version,revision,status,flags)."""
@@ -358,7 +641,7 @@ class WattboxTelnetClient:
             firmware_version = f"{version}.{revision}"
             self._update_firmware_if_different(firmware_version)
         else:
-            self._device_data["device_info"]["hardware_version"] = "Unknown"
+            self._update_device(hardware_version="Unknown")
 
     def _validate_firmware_values(self, version: str, revision: str) -> bool:
         """Validate that values look like firmware, not power readings."""
@@ -373,46 +656,22 @@ class WattboxTelnetClient:
                     version,
                     revision,
                 )
-                self._device_data["device_info"]["hardware_version"] = "Unknown"
+                self._update_device(hardware_version="Unknown")
                 return False
 
         except ValueError:
             _LOGGER.warning("Invalid firmware data format: %s,%s", version, revision)
-            self._device_data["device_info"]["hardware_version"] = "Unknown"
+            self._update_device(hardware_version="Unknown")
             return False
 
         return True
 
     def _update_firmware_if_different(self, firmware_version: str) -> None:
         """Update firmware version only if it's different."""
-        current_firmware = self._device_data["device_info"].get("hardware_version")
+        current_firmware = self._snapshot.device.hardware_version
         if current_firmware != firmware_version:
             _LOGGER.info("Firmware version: %s", firmware_version)
-            self._device_data["device_info"]["hardware_version"] = firmware_version
-
-    def _parse_model_data(self, model_data: str) -> None:
-        """Parse model data and store it."""
-        if model_data and model_data.strip():
-            _LOGGER.info("Model: %s", model_data)
-            self._device_data["device_info"]["model"] = model_data.strip()
-
-    def _parse_service_tag_data(self, service_tag_data: str) -> None:
-        """Parse service tag data and store it."""
-        if service_tag_data and service_tag_data.strip():
-            _LOGGER.info("Service tag: %s", service_tag_data)
-            self._device_data["device_info"]["serial_number"] = service_tag_data.strip()
-
-    def _parse_hostname_data(self, hostname_data: str) -> None:
-        """Parse hostname data and store it."""
-        if hostname_data and hostname_data.strip():
-            _LOGGER.info("Hostname: %s", hostname_data)
-            self._device_data["device_info"]["hostname"] = hostname_data.strip()
-
-    def _parse_auto_reboot_data(self, auto_reboot_data: str) -> None:
-        """Parse auto reboot data and store it."""
-        if auto_reboot_data and auto_reboot_data.strip():
-            _LOGGER.info("Auto reboot: %s", auto_reboot_data)
-            self._device_data["device_info"]["auto_reboot"] = auto_reboot_data.strip()
+            self._update_device(hardware_version=firmware_version)
 
     async def _get_model_info(self) -> None:
         """Get model information."""
@@ -431,14 +690,14 @@ class WattboxTelnetClient:
                     _LOGGER.warning(
                         "Model data looks like firmware version: %s", model_data
                     )
-                    self._device_data["device_info"]["model"] = None
+                    self._update_device(model=None)
                 else:
-                    self._device_data["device_info"]["model"] = model_data
+                    self._update_device(model=model_data)
             else:
-                self._device_data["device_info"]["model"] = None
+                self._update_device(model=None)
         except Exception as e:
             _LOGGER.warning("Failed to get model info: %s", e)
-            self._device_data["device_info"]["model"] = None
+            self._update_device(model=None)
 
     async def _get_service_tag(self) -> None:
         """Get service tag information."""
@@ -457,14 +716,14 @@ class WattboxTelnetClient:
                     _LOGGER.warning(
                         "Service tag data looks like model number: %s", service_tag
                     )
-                    self._device_data["device_info"]["serial_number"] = None
+                    self._update_device(serial_number=None)
                 else:
-                    self._device_data["device_info"]["serial_number"] = service_tag
+                    self._update_device(serial_number=service_tag)
             else:
-                self._device_data["device_info"]["serial_number"] = None
+                self._update_device(serial_number=None)
         except Exception as e:
             _LOGGER.warning("Failed to get service tag: %s", e)
-            self._device_data["device_info"]["serial_number"] = None
+            self._update_device(serial_number=None)
 
     async def _get_hostname(self) -> None:
         """Get hostname information."""
@@ -482,21 +741,21 @@ class WattboxTelnetClient:
                     _LOGGER.warning(
                         "Hostname data looks like service tag: %s", hostname
                     )
-                    self._device_data["device_info"]["hostname"] = None
+                    self._update_device(hostname=None)
                 else:
-                    self._device_data["device_info"]["hostname"] = hostname
+                    self._update_device(hostname=hostname)
             else:
-                self._device_data["device_info"]["hostname"] = None
+                self._update_device(hostname=None)
         except Exception as e:
             _LOGGER.warning("Failed to get hostname: %s", e)
-            self._device_data["device_info"]["hostname"] = None
+            self._update_device(hostname=None)
 
     async def _get_auto_reboot(self) -> None:
         """Get auto reboot setting."""
         try:
             response = await self.async_send_command(TELNET_CMD_AUTO_REBOOT)
-            self._device_data["device_info"]["auto_reboot"] = (
-                response.split("=")[1] if "=" in response else None
+            self._update_device(
+                auto_reboot=response.split("=")[1] if "=" in response else None
             )
         except Exception as e:
             _LOGGER.warning("Failed to get auto reboot setting: %s", e)
@@ -519,117 +778,371 @@ class WattboxTelnetClient:
             return 12
 
     async def async_get_outlet_status(
-        self, num_outlets: int = None
-    ) -> list[dict[str, Any]]:
-        """Get outlet status information."""
+        self,
+        num_outlets: int = None,
+        *,
+        include_states: bool = True,
+        include_names: bool = True,
+        power_outlets: Iterable[int] = (),
+    ) -> tuple[OutletState, ...]:
+        """Get outlet status information.
+
+        ``include_states`` and ``include_names`` select which queries are sent;
+        outlets keep their last known values for anything skipped. Outlets in
+        ``power_outlets`` also get their power, current and voltage read, with
+        every ?OutletPowerStatus query sent in the same pipelined batch.
+        Concurrent calls for the same queries share one fetch and its result.
+        """
+        power_outlets = tuple(power_outlets)
+        return await self._fetches.async_do(
+            ("outlets", num_outlets, include_states, include_names, power_outlets),
+            lambda: self._async_fetch_outlet_status(
+                num_outlets, include_states, include_names, power_outlets
+            ),
+        )
+
+    async def _async_fetch_outlet_status(
+        self,
+        num_outlets: int | None,
+        include_states: bool,
+        include_names: bool,
+        power_outlets: tuple[int, ...],
+    ) -> tuple[OutletState, ...]:
+        """Fetch outlet status information."""
+        if not self._connected:
+            await self.async_connect()
+
+        await self._async_init_outlets(num_outlets)
+        queries = self._outlet_status_queries(
+            include_states, include_names, power_outlets
+        )
+        if queries:
+            await self._async_run_queries(queries)
+
+        return self._snapshot.outlets
+
+    async def async_poll(
+        self,
+        num_outlets: int | None = None,
+        *,
+        include_states: bool = True,
+        include_names: bool = True,
+        include_power: bool = True,
+        include_ups: bool = True,
+        power_outlets: Iterable[int] = (),
+    ) -> tuple[tuple[OutletState, ...], PowerStatus, UPSStatus]:
+        """Get outlet, power and UPS status in a single round trip.
+
+        Takes the flags of async_get_outlet_status and async_get_status_info
+        and sends every selected query as one pipelined batch. Returns the
+        outlets, power status and UPS status. Concurrent calls for the same
+        queries share one fetch and its result.
+        """
+        power_outlets = tuple(power_outlets)
+        return await self._fetches.async_do(
+            (
+                "poll",
+                num_outlets,
+                include_states,
+                include_names,
+                include_power,
+                include_ups,
+                power_outlets,
+            ),
+            lambda: self._async_poll(
+                num_outlets,
+                include_states,
+                include_names,
+                include_power,
+                include_ups,
+                power_outlets,
+            ),
+        )
+
+    async def _async_poll(
+        self,
+        num_outlets: int | None,
+        include_states: bool,
+        include_names: bool,
+        include_power: bool,
+        include_ups: bool,
+        power_outlets: tuple[int, ...],
+    ) -> tuple[tuple[OutletState, ...], PowerStatus, UPSStatus]:
+        """Fetch outlet, power and UPS status in one batch."""
         if not self._connected:
             await self.async_connect()
 
+        await self._async_init_outlets(num_outlets)
+        queries = [
+            *self._outlet_status_queries(include_states, include_names, power_outlets),
+            *self._status_info_queries(include_power, include_ups),
+        ]
+        if queries:
+            await self._async_run_queries(queries)
+
+        return self._snapshot.outlets, self._snapshot.power, self._snapshot.ups
+
+    async def _async_init_outlets(self, num_outlets: int | None) -> None:
+        """Create default outlet records if none are known yet."""
+        if self._snapshot.outlets:
+            return
+
         # Get the actual number of outlets from the device if not specified
         if num_outlets is None:
             num_outlets = await self._get_outlet_count()
+        self._set_outlets(tuple(OutletState.default(i + 1) for i in range(num_outlets)))
+        self._outlet_mask = 0
 
-        # Initialize outlet info if not already done
-        if not self._device_data["outlet_info"]:
-            self._device_data["outlet_info"] = [
-                {"state": 0, "name": f"Outlet {i + 1}"} for i in range(num_outlets)
+    def _outlet_status_queries(
+        self,
+        include_states: bool,
+        include_names: bool,
+        power_outlets: tuple[int, ...],
+    ) -> list[tuple[str, Callable[[str], None]]]:
+        """Return the outlet queries to send and their parsers."""
+        queries: list[tuple[str, Callable[[str], None]]] = []
+        if include_states:
+            queries.append((TELNET_CMD_OUTLET_STATUS, self._parse_outlet_states))
+        if include_names:
+            queries.append((TELNET_CMD_OUTLET_NAME, self._parse_outlet_names))
+        for outlet_number in power_outlets:
+            queries.append(
+                (
+                    f"{TELNET_CMD_OUTLET_POWER_STATUS}={outlet_number}",
+                    self._parse_outlet_power_status,
+                )
+            )
+        return queries
+
+    async def _async_run_queries(
+        self, queries: list[tuple[str, Callable[[str], None]]]
+    ) -> None:
+        """Send queries as one pipelined batch and parse each response.
+
+        Queries the device does not support are left out. A response that
+        cannot be parsed is logged and skipped, but a failed or timed-out
+        batch raises, so callers never mistake stale records for fresh ones.
+        """
+        if self._unsupported:
+            queries = [
+                query
+                for query in queries
+                if _base_command(query[0]) not in self._unsupported
             ]
+        if not queries:
+            return
 
-        await self._get_outlet_states()
-        await self._get_outlet_names()
+        commands = [command for command, _ in queries]
+        responses = await self.async_send_batch(commands)
 
-        return self._device_data["outlet_info"]
+        for (command, parser), response in zip(queries, responses):
+            try:
+                parser(response)
+            except Exception as e:
+                _LOGGER.warning("Failed to parse %s response: %s", command, e)
 
     async def _get_outlet_states(self) -> None:
         """Get outlet states."""
         try:
-            # Use the new sequencing approach - send command directly
             response = await self.async_send_command(TELNET_CMD_OUTLET_STATUS)
+            self._parse_outlet_states(response)
+        except Exception as e:
+            _LOGGER.warning("Failed to get outlet status: %s", e)
+
+    def _parse_outlet_states(self, response: str) -> int:
+        """Parse an outlet status response into the outlet records.
 
-            _LOGGER.debug("Outlet status response: %s", response)
+        Returns the bitmask of outlets whose state changed.
+        """
+        _LOGGER.debug("Outlet status response: %s", response)
+        record = self._parse_response(TELNET_CMD_OUTLET_STATUS, response)
+        if record is None:
+            return 0
+
+        # Process only the number of outlets we have
+        return self._apply_outlet_mask(
+            record.mask, min(record.count, len(self._snapshot.outlets))
+        )
 
-            # The outlet status comes back as the response to the second dummy command
-            if "=" in response and "OutletStatus" in response:
-                outlet_states = response.split("=")[1].split(",")
-                _LOGGER.debug("Parsed outlet states: %s", outlet_states)
+    def _apply_outlet_mask(self, mask: int, count: int) -> int:
+        """Set the states of the first ``count`` outlets from a bitmask.
 
-                # Process only the number of outlets we have
-                num_outlets = min(
-                    len(outlet_states), len(self._device_data["outlet_info"])
-                )
-                for i in range(num_outlets):
-                    self._device_data["outlet_info"][i]["state"] = int(outlet_states[i])
-                    _LOGGER.debug(
-                        "Set outlet %d state to %d", i + 1, int(outlet_states[i])
-                    )
-            else:
-                _LOGGER.warning("No valid outlet status response found: %s", response)
-        except Exception as e:
-            _LOGGER.warning("Failed to get outlet status: %s", e)
+        One XOR against the current mask finds the changed outlets; only
+        those get new records. Returns the bitmask of changed outlets.
+        """
+        known = (1 << count) - 1
+        changed = (mask ^ self._outlet_mask) & known
+        if not changed:
+            return 0
+
+        outlets = self._snapshot.outlets
+        for number in mask_outlets(changed):
+            outlets = replace_outlet(outlets, number, state=(mask >> (number - 1)) & 1)
+        self._outlet_mask = (self._outlet_mask & ~known) | (mask & known)
+        self._set_outlets(outlets)
+        _LOGGER.debug("Outlets changed: %s", list(mask_outlets(changed)))
+        return changed
 
     async def _get_outlet_names(self) -> None:
         """Get outlet names."""
         try:
-            # Use the new sequencing approach - send command directly
             response = await self.async_send_command(TELNET_CMD_OUTLET_NAME)
+            self._parse_outlet_names(response)
+        except Exception as e:
+            _LOGGER.warning("Failed to get outlet names: %s", e)
 
-            _LOGGER.debug("Outlet names response: %s", response)
+    def _parse_outlet_names(self, response: str) -> None:
+        """Parse an outlet name response into the outlet records."""
+        _LOGGER.debug("Outlet names response: %s", response)
+        record = self._parse_response(TELNET_CMD_OUTLET_NAME, response)
+        if record is None:
+            return
 
-            # The response should contain the outlet names
-            if "=" in response and "OutletName" in response:
-                outlet_names = response.split("=")[1].split(",")
-                _LOGGER.debug("Parsed outlet names: %s", outlet_names)
+        # Process only the number of outlets we have
+        outlets = self._snapshot.outlets
+        for number, name in zip(range(1, len(outlets) + 1), record.names):
+            outlets = replace_outlet(outlets, number, name=name)
+        self._set_outlets(outlets)
 
-                # Process only the number of outlets we have
-                num_outlets = min(
-                    len(outlet_names), len(self._device_data["outlet_info"])
-                )
-                for i in range(num_outlets):
-                    # Clean up the name (remove braces)
-                    clean_name = outlet_names[i].replace("{", "").replace("}", "")
-                    self._device_data["outlet_info"][i]["name"] = clean_name
-                    _LOGGER.debug("Set outlet %d name to %s", i + 1, clean_name)
-            else:
-                _LOGGER.warning("No valid outlet names response found: %s", response)
-        except Exception as e:
-            _LOGGER.warning("Failed to get outlet names: %s", e)
+    async def async_set_outlet_state(
+        self, outlet_number: int, state: bool
+    ) -> tuple[OutletState, ...]:
+        """Set outlet state (on/off) and return the confirmed outlet info.
 
-    async def async_set_outlet_state(self, outlet_number: int, state: bool) -> None:
-        """Set outlet state (on/off)."""
+        The control command is pipelined with a single ?OutletStatus query, so
+        setting and confirming an outlet costs one round trip.
+        """
         if not self._connected:
             await self.async_connect()
 
         command = f"{TELNET_CMD_OUTLET_SET}={outlet_number},{'ON' if state else 'OFF'}"
         try:
-            await self.async_send_command(command)
+            response, status_response = await self.async_send_batch(
+                [command, TELNET_CMD_OUTLET_STATUS]
+            )
+            if response.startswith(TELNET_RESPONSE_ERROR):
+                raise WattboxTelnetError(f"Device rejected command: {command}")
             _LOGGER.debug(
                 "Set outlet %d to %s", outlet_number, "ON" if state else "OFF"
             )
 
             # Update the internal state directly since we know what we set
-            if 1 <= outlet_number <= len(self._device_data["outlet_info"]):
-                self._device_data["outlet_info"][outlet_number - 1]["state"] = (
-                    1 if state else 0
-                )
-                _LOGGER.debug(
-                    "Updated internal state for outlet %d to %d",
-                    outlet_number,
-                    1 if state else 0,
+            if 1 <= outlet_number <= len(self._snapshot.outlets):
+                bit = 1 << (outlet_number - 1)
+                self._apply_outlet_mask(
+                    self._outlet_mask | bit if state else self._outlet_mask & ~bit,
+                    len(self._snapshot.outlets),
                 )
 
         except Exception as e:
             _LOGGER.error("Failed to set outlet %d state: %s", outlet_number, e)
             raise
 
+        # Confirm against what the device reports
+        try:
+            self._parse_outlet_states(status_response)
+        except Exception as e:
+            _LOGGER.warning("Failed to parse outlet status response: %s", e)
+
+        return self._snapshot.outlets
+
+    async def async_set_outlet_states(
+        self, actions: Mapping[int, str]
+    ) -> tuple[OutletState, ...]:
+        """Apply several outlet actions and return the confirmed outlet info.
+
+        ``actions`` maps outlet numbers to on, off, toggle or reset. All the
+        !OutletSet commands and one closing ?OutletStatus query go out as a
+        single pipelined write. If the device rejects any command,
+        WattboxTelnetError is raised once the confirmed states are applied.
+        """
+        if not self._connected:
+            await self.async_connect()
+
+        commands = _outlet_set_commands(actions, len(self._snapshot.outlets))
+        if not commands:
+            return self._snapshot.outlets
+
+        *responses, status_response = await self.async_send_batch(
+            [*commands, TELNET_CMD_OUTLET_STATUS]
+        )
+        self._parse_outlet_states(status_response)
+
+        rejected = [
+            command
+            for command, response in zip(commands, responses)
+            if response.startswith(TELNET_RESPONSE_ERROR)
+        ]
+        if rejected:
+            raise WattboxTelnetError(f"Device rejected command: {', '.join(rejected)}")
+        _LOGGER.debug("Applied outlet actions: %s", ", ".join(commands))
+        return self._snapshot.outlets
+
+    @property
+    def unsupported_commands(self) -> frozenset[str]:
+        """Return the queries skipped because the device does not support them."""
+        return self._unsupported
+
+    def set_unsupported_commands(self, commands: Iterable[str]) -> None:
+        """Skip the given queries, e.g. as recorded by an earlier probe."""
+        self._unsupported = frozenset(_base_command(command) for command in commands)
+
+    async def async_probe_capabilities(
+        self, commands: Iterable[str] = CAPABILITY_PROBE_COMMANDS
+    ) -> frozenset[str]:
+        """Find which queries the device answers with #Error.
+
+        Every query is sent once in a single batch. The rejected ones are
+        skipped on later polls and returned, without any ``=argument``.
+        """
+        if not self._connected:
+            await self.async_connect()
+
+        commands = list(commands)
+        responses = await self.async_send_batch(commands)
+        self.set_unsupported_commands(
+            command
+            for command, response in zip(commands, responses)
+            if response.startswith(TELNET_RESPONSE_ERROR)
+        )
+        if self._unsupported:
+            _LOGGER.info(
+                "Device does not support %s; these queries will be skipped",
+                ", ".join(sorted(self._unsupported)),
+            )
+        return self._unsupported
+
     @property
     def is_connected(self) -> bool:
         """Return connection status."""
         return self._connected
 
+    def _update_device(self, **changes: Any) -> None:
+        """Replace device identity fields, keeping unchanged records shared."""
+        self._snapshot = evolve(
+            self._snapshot, device=evolve(self._snapshot.device, **changes)
+        )
+
+    def _update_power(self, **changes: Any) -> None:
+        """Replace power status fields, keeping unchanged records shared."""
+        self._snapshot = evolve(
+            self._snapshot, power=evolve(self._snapshot.power, **changes)
+        )
+
+    def _update_ups(self, **changes: Any) -> None:
+        """Replace UPS status fields, keeping unchanged records shared."""
+        self._snapshot = evolve(
+            self._snapshot, ups=evolve(self._snapshot.ups, **changes)
+        )
+
+    def _set_outlets(self, outlets: tuple[OutletState, ...]) -> None:
+        """Replace the outlet tuple."""
+        self._snapshot = evolve(self._snapshot, outlets=outlets)
+
     @property
-    def device_data(self) -> dict[str, Any]:
-        """Return current device data."""
-        return self._device_data
+    def snapshot(self) -> WattboxSnapshot:
+        """Return the latest device snapshot."""
+        return evolve(self._snapshot, connected=self._connected)
 
     async def async_get_power_metrics(self) -> dict[str, Any]:
         """Get power metrics (voltage, current, power) via HTTP.
@@ -647,110 +1160,103 @@ class WattboxTelnetClient:
         # TODO: Implement proper HTTP power monitoring when authentication is resolved
         return {"voltage": None, "current": None, "power": None}
 
-    async def async_get_status_info(self) -> dict[str, Any]:
-        """Get device status information including power and UPS status."""
+    async def async_get_status_info(
+        self, *, include_power: bool = True, include_ups: bool = True
+    ) -> tuple[PowerStatus, UPSStatus]:
+        """Get device status information including power and UPS status.
+
+        ``include_power`` and ``include_ups`` select which queries are sent;
+        the last known values are kept for anything skipped. Concurrent calls
+        for the same queries share one fetch and its result.
+        """
+        return await self._fetches.async_do(
+            ("status", include_power, include_ups),
+            lambda: self._async_fetch_status_info(include_power, include_ups),
+        )
+
+    async def _async_fetch_status_info(
+        self, include_power: bool, include_ups: bool
+    ) -> tuple[PowerStatus, UPSStatus]:
+        """Fetch power and UPS status information."""
         if not self._connected:
             await self.async_connect()
 
-        await self._get_power_status()
-        await self._get_ups_connection()
-        await self._get_ups_status()
+        queries = self._status_info_queries(include_power, include_ups)
+        if queries:
+            await self._async_run_queries(queries)
 
-        return self._device_data["status_info"]
+        return self._snapshot.power, self._snapshot.ups
+
+    def _status_info_queries(
+        self, include_power: bool, include_ups: bool
+    ) -> list[tuple[str, Callable[[str], None]]]:
+        """Return the power and UPS queries to send and their parsers."""
+        queries: list[tuple[str, Callable[[str], None]]] = []
+        if include_power:
+            queries.append((TELNET_CMD_POWER_STATUS, self._parse_power_status))
+        if include_ups:
+            queries.append((TELNET_CMD_UPS_CONNECTION, self._parse_ups_connection))
+            queries.append((TELNET_CMD_UPS_STATUS, self._parse_ups_status))
+        return queries
 
     async def _get_power_status(self) -> None:
         """Get power status information."""
         try:
             response = await self.async_send_command(TELNET_CMD_POWER_STATUS)
-            _LOGGER.debug("Power status response: %s", response)
-
-            if "=" in response and "PowerStatus" in response:
-                # Format: ?PowerStatus=60.00,600.00,110.00,1
-                # Where: current, power, voltage, safe_voltage
-                values = response.split("=")[1].split(",")
-                if len(values) >= 4:
-                    self._device_data["status_info"]["power_status"]["current"] = float(
-                        values[0]
-                    )
-                    self._device_data["status_info"]["power_status"]["power"] = float(
-                        values[1]
-                    )
-                    self._device_data["status_info"]["power_status"]["voltage"] = float(
-                        values[2]
-                    )
-                    self._device_data["status_info"]["power_status"]["safe_voltage"] = (
-                        int(values[3])
-                    )
-                    _LOGGER.debug(
-                        "Parsed power status: current=%s, power=%s, voltage=%s, "
-                        "safe_voltage=%s",
-                        values[0],
-                        values[1],
-                        values[2],
-                        values[3],
-                    )
+            self._parse_power_status(response)
         except Exception as e:
             _LOGGER.warning("Failed to get power status: %s", e)
 
+    def _parse_power_status(self, response: str) -> None:
+        """Parse a power status response into the power record."""
+        _LOGGER.debug("Power status response: %s", response)
+        record = self._parse_response(TELNET_CMD_POWER_STATUS, response)
+        if record is not None:
+            self._update_power(**record._asdict())
+
+    def _parse_outlet_power_status(self, response: str) -> None:
+        """Parse an outlet power status response into the outlet records.
+
+        WB150/250 models answer #Error, which is only logged at debug level.
+        """
+        record = self._parse_response(TELNET_CMD_OUTLET_POWER_STATUS, response)
+        if record is not None:
+            self._set_outlets(
+                replace_outlet(
+                    self._snapshot.outlets,
+                    record.outlet,
+                    power=record.power,
+                    current=record.current,
+                    voltage=record.voltage,
+                )
+            )
+
     async def _get_ups_connection(self) -> None:
         """Get UPS connection status."""
         try:
             response = await self.async_send_command(TELNET_CMD_UPS_CONNECTION)
-            _LOGGER.debug("UPS connection response: %s", response)
-
-            if "=" in response and "UPSConnection" in response:
-                # Format: ?UPSConnection=0 or ?UPSConnection=1
-                # 0 = Disconnected, 1 = Connected
-                connected = int(response.split("=")[1])
-                self._device_data["status_info"]["ups_connected"] = bool(connected)
-                _LOGGER.debug("UPS connected: %s", bool(connected))
+            self._parse_ups_connection(response)
         except Exception as e:
             _LOGGER.warning("Failed to get UPS connection status: %s", e)
 
+    def _parse_ups_connection(self, response: str) -> None:
+        """Parse a UPS connection response into the UPS record."""
+        _LOGGER.debug("UPS connection response: %s", response)
+        record = self._parse_response(TELNET_CMD_UPS_CONNECTION, response)
+        if record is not None:
+            self._update_ups(connected=record.connected)
+
     async def _get_ups_status(self) -> None:
         """Get UPS status information."""
         try:
             response = await self.async_send_command(TELNET_CMD_UPS_STATUS)
-            _LOGGER.debug("UPS status response: %s", response)
-
-            if "=" in response and "UPSStatus" in response:
-                # Format: ?UPSStatus=50,0,Good,False,25,True,False
-                # Where: battery_charge, battery_load, battery_health, power_lost,
-                #        battery_runtime, alarm_enabled, alarm_muted
-                values = response.split("=")[1].split(",")
-                if len(values) >= 7:
-                    self._device_data["status_info"]["ups_status"]["battery_charge"] = (
-                        int(values[0])
-                    )
-                    self._device_data["status_info"]["ups_status"]["battery_load"] = (
-                        int(values[1])
-                    )
-                    self._device_data["status_info"]["ups_status"]["battery_health"] = (
-                        values[2]
-                    )
-                    self._device_data["status_info"]["ups_status"]["power_lost"] = (
-                        values[3] == "True"
-                    )
-                    self._device_data["status_info"]["ups_status"][
-                        "battery_runtime"
-                    ] = int(values[4])
-                    self._device_data["status_info"]["ups_status"]["alarm_enabled"] = (
-                        values[5] == "True"
-                    )
-                    self._device_data["status_info"]["ups_status"]["alarm_muted"] = (
-                        values[6] == "True"
-                    )
-                    _LOGGER.debug(
-                        "Parsed UPS status: charge=%s%%, load=%s%%, health=%s, "
-                        "power_lost=%s, runtime=%smin, alarm_enabled=%s, "
-                        "alarm_muted=%s",
-                        values[0],
-                        values[1],
-                        values[2],
-                        values[3],
-                        values[4],
-                        values[5],
-                        values[6],
-                    )
+            self._parse_ups_status(response)
         except Exception as e:
             _LOGGER.warning("Failed to get UPS status: %s", e)
+
+    def _parse_ups_status(self, response: str) -> None:
+        """Parse a UPS status response into the UPS record."""
+        _LOGGER.debug("UPS status response: %s", response)
+        record = self._parse_response(TELNET_CMD_UPS_STATUS, response)
+        if record is not None:
+            self._update_ups(**record._asdict())
@@ -28,12 +28,16 @@ except ImportError:
     sys.modules["homeassistant.components.binary_sensor"] = (
         homeassistant.components.binary_sensor
     )
+    sys.modules["homeassistant.components.diagnostics"] = (
+        homeassistant.components.diagnostics
+    )
     sys.modules["homeassistant.components.sensor"] = homeassistant.components.sensor
     sys.modules["homeassistant.components.switch"] = homeassistant.components.switch
     # Add missing modules that our code imports
     sys.modules["homeassistant.const"] = homeassistant.const
     sys.modules["homeassistant.helpers"] = homeassistant.helpers
     sys.modules["homeassistant.helpers.frame"] = homeassistant.helpers.frame
+    sys.modules["homeassistant.helpers.storage"] = homeassistant.helpers.storage
     sys.modules["homeassistant.helpers.entity_platform"] = (
         homeassistant.helpers.entity_platform
     )
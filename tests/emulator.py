@@ -0,0 +1,317 @@
+"""Wattbox device emulator for local testing and benchmarking.
+
+Implements the parts of the SnapAV integration protocol (v3.0) used by
+``telnet_client.py`` over a plain asyncio TCP server: the login prompts,
+``?`` queries, ``!OutletSet`` and unsolicited ``~OutletStatus`` pushes.
+Telnet option negotiation from the client is refused so connections come
+up immediately.
+
+Example::
+
+    async with WattboxEmulator(outlet_count=12, latency=0.005) as device:
+        client = WattboxTelnetClient(device.host, "wattbox", "wattbox",
+                                     port=device.port)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+from dataclasses import dataclass, field
+from typing import Any
+
+IAC = 255
+DONT = 254
+DO = 253
+WONT = 252
+WILL = 251
+SB = 250
+SE = 240
+
+
+@dataclass
+class EmulatorStats:
+    """Traffic counters for one emulator instance."""
+
+    connections: int = 0
+    commands: int = 0
+    reads: int = 0
+    writes: int = 0
+    bytes_in: int = 0
+    bytes_out: int = 0
+
+    def reset(self) -> None:
+        """Reset all counters."""
+        self.connections = 0
+        self.commands = 0
+        self.reads = 0
+        self.writes = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+
+
+@dataclass
+class WattboxEmulator:
+    """Asyncio TCP server speaking the Wattbox telnet protocol.
+
+    ``latency`` and ``jitter`` (seconds) delay every response. With
+    ``split_size`` set, each write is sent in chunks of at most that many
+    bytes with a short pause between them, to exercise frame reassembly.
+    ``reads`` in the stats counts batches of commands arriving together,
+    which approximates round trips.
+    """
+
+    outlet_count: int = 12
+    username: str = "wattbox"
+    password: str = "wattbox"
+    latency: float = 0.0
+    jitter: float = 0.0
+    split_size: int | None = None
+    firmware: str = "2.8.0.0"
+    model: str = "WB-800-IPVM-12"
+    service_tag: str = "ST201916431G842A"
+    hostname: str = "WattBox"
+    unsupported: set[str] = field(default_factory=set)
+    host: str = "127.0.0.1"
+    port: int = 0
+    seed: int | None = None
+    outlet_states: list[int] = field(default_factory=list)
+    outlet_names: list[str] = field(default_factory=list)
+    power_status: tuple[float, float, float, int] = (1.25, 150.0, 120.0, 1)
+    ups_connected: bool = True
+    ups_status: tuple[Any, ...] = (100, 20, "Good", False, 45, True, False)
+    stats: EmulatorStats = field(default_factory=EmulatorStats)
+
+    def __post_init__(self) -> None:
+        """Fill in per-outlet defaults."""
+        if not self.outlet_states:
+            self.outlet_states = [1] * self.outlet_count
+        if not self.outlet_names:
+            self.outlet_names = [f"Outlet{i + 1}" for i in range(self.outlet_count)]
+        self._random = random.Random(self.seed)
+        self._server: asyncio.AbstractServer | None = None
+        self._clients: set[asyncio.StreamWriter] = set()
+        self._handlers: set[asyncio.Task[None]] = set()
+
+    async def __aenter__(self) -> WattboxEmulator:
+        """Start the server."""
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        """Stop the server."""
+        await self.stop()
+
+    async def start(self) -> None:
+        """Start listening; ``port`` is updated with the bound port."""
+        self._server = await asyncio.start_server(
+            self._handle_client, self.host, self.port
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        """Close all client connections and stop the server."""
+        if self._server is not None:
+            self._server.close()
+        for task in list(self._handlers):
+            task.cancel()
+        if self._handlers:
+            await asyncio.wait(self._handlers)
+        if self._server is not None:
+            await self._server.wait_closed()
+            self._server = None
+
+    async def push_outlet_status(self) -> None:
+        """Send an unsolicited ~OutletStatus message to every client."""
+        message = f"~OutletStatus={self._outlet_status_payload()}\n"
+        for writer in list(self._clients):
+            await self._write(writer, message)
+
+    async def _handle_client(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Serve one client connection."""
+        self.stats.connections += 1
+        task = asyncio.current_task()
+        if task is not None:
+            self._handlers.add(task)
+        try:
+            while not await self._login(reader, writer):
+                pass
+            self._clients.add(writer)
+            while True:
+                data = await reader.read(4096)
+                if not data:
+                    break
+                lines = self._strip_telnet(writer, data).decode(errors="ignore")
+                commands = [line.strip() for line in lines.splitlines()]
+                commands = [command for command in commands if command]
+                if not commands:
+                    continue
+                self.stats.reads += 1
+                self.stats.bytes_in += len(data)
+                await self._delay()
+                replies = []
+                for command in commands:
+                    self.stats.commands += 1
+                    replies.append(self._respond(command))
+                await self._write(writer, "".join(f"{reply}\n" for reply in replies))
+                if any(
+                    command.startswith("!OutletSet") and reply == "OK"
+                    for command, reply in zip(commands, replies)
+                ):
+                    # The device announces every outlet change.
+                    await self.push_outlet_status()
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.CancelledError):
+            # Connection handlers end quietly when the emulator stops.
+            pass
+        finally:
+            self._clients.discard(writer)
+            self._handlers.discard(task)
+            writer.close()
+
+    async def _login(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> bool:
+        """Run one login attempt; the device re-prompts after a failure."""
+        await self._write(writer, "Please Login to Continue\nUsername: ")
+        username = await self._read_line(reader, writer)
+        await self._write(writer, "Password: ")
+        password = await self._read_line(reader, writer)
+        if username == self.username and password == self.password:
+            await self._write(writer, "Successfully Logged In!\n")
+            return True
+        await self._write(writer, "Invalid Login\n")
+        return False
+
+    async def _read_line(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> str:
+        """Read one line, skipping telnet negotiation."""
+        buffer = b""
+        while b"\n" not in buffer:
+            data = await reader.read(1024)
+            if not data:
+                raise ConnectionError("Client closed connection")
+            buffer += self._strip_telnet(writer, data)
+        return buffer.split(b"\n", 1)[0].decode(errors="ignore").strip()
+
+    def _strip_telnet(self, writer: asyncio.StreamWriter, data: bytes) -> bytes:
+        """Remove telnet commands from data, refusing every option requested."""
+        output = bytearray()
+        index = 0
+        while index < len(data):
+            byte = data[index]
+            if byte != IAC:
+                output.append(byte)
+                index += 1
+                continue
+            command = data[index + 1] if index + 1 < len(data) else None
+            if command in (DO, DONT, WILL, WONT) and index + 2 < len(data):
+                option = data[index + 2]
+                if command == DO:
+                    writer.write(bytes([IAC, WONT, option]))
+                elif command == WILL:
+                    writer.write(bytes([IAC, DONT, option]))
+                index += 3
+            elif command == SB:
+                end = data.find(bytes([IAC, SE]), index)
+                index = len(data) if end == -1 else end + 2
+            else:
+                index += 2
+        return bytes(output)
+
+    def _respond(self, command: str) -> str:
+        """Return the device reply for a single command line."""
+        key, _, argument = command.partition("=")
+        if key in self.unsupported:
+            return "#Error"
+        handler = {
+            "?Firmware": lambda: self.firmware,
+            "?Model": lambda: self.model,
+            "?ServiceTag": lambda: self.service_tag,
+            "?Hostname": lambda: self.hostname,
+            "?AutoReboot": lambda: "1",
+            "?OutletCount": lambda: str(self.outlet_count),
+            "?OutletStatus": self._outlet_status_payload,
+            "?OutletName": lambda: ",".join(f"{{{n}}}" for n in self.outlet_names),
+            "?PowerStatus": lambda: "{:.2f},{:.2f},{:.2f},{}".format(
+                *self.power_status
+            ),
+            "?UPSConnection": lambda: "1" if self.ups_connected else "0",
+            "?UPSStatus": lambda: ",".join(str(v) for v in self.ups_status),
+        }.get(key)
+        if handler is not None and not argument:
+            return f"{key}={handler()}"
+        if key == "?OutletPowerStatus":
+            return self._outlet_power_status(argument)
+        if key == "!OutletSet":
+            return self._outlet_set(argument)
+        return "#Error"
+
+    def _outlet_status_payload(self) -> str:
+        """Return the comma separated outlet states."""
+        return ",".join(str(state) for state in self.outlet_states)
+
+    def _outlet_power_status(self, argument: str) -> str:
+        """Answer ?OutletPowerStatus=N with watts, amps and volts."""
+        try:
+            outlet = int(argument)
+        except ValueError:
+            return "#Error"
+        if not 1 <= outlet <= self.outlet_count:
+            return "#Error"
+        volts = self.power_status[2]
+        watts = 10.0 * outlet if self.outlet_states[outlet - 1] else 0.0
+        amps = watts / volts
+        return f"?OutletPowerStatus={outlet},{watts:.2f},{amps:.2f},{volts:.2f}"
+
+    def _outlet_set(self, argument: str) -> str:
+        """Apply !OutletSet=OUTLET,ACTION[,DELAY]."""
+        parts = argument.split(",")
+        try:
+            outlet = int(parts[0])
+            action = parts[1].strip().upper()
+        except (IndexError, ValueError):
+            return "#Error"
+        if outlet == 0 and action == "RESET":
+            outlets = range(1, self.outlet_count + 1)
+        elif 1 <= outlet <= self.outlet_count:
+            outlets = range(outlet, outlet + 1)
+        else:
+            return "#Error"
+        for number in outlets:
+            current = self.outlet_states[number - 1]
+            if action == "ON":
+                self.outlet_states[number - 1] = 1
+            elif action == "OFF":
+                self.outlet_states[number - 1] = 0
+            elif action == "TOGGLE":
+                self.outlet_states[number - 1] = 0 if current else 1
+            elif action == "RESET":
+                self.outlet_states[number - 1] = 1
+            else:
+                return "#Error"
+        return "OK"
+
+    async def _delay(self) -> None:
+        """Simulate device processing and network latency."""
+        delay = self.latency
+        if self.jitter:
+            delay += self._random.uniform(0, self.jitter)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    async def _write(self, writer: asyncio.StreamWriter, text: str) -> None:
+        """Write text, optionally split into several TCP segments."""
+        data = text.encode()
+        self.stats.writes += 1
+        self.stats.bytes_out += len(data)
+        if not self.split_size:
+            writer.write(data)
+            await writer.drain()
+            return
+        for start in range(0, len(data), self.split_size):
+            writer.write(data[start : start + self.split_size])
+            await writer.drain()
+            await asyncio.sleep(0.001)
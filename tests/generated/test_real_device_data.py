@@ -4,6 +4,7 @@ Generated from actual device capture on 2025-10-07T18:09:55.310632.
 Device: ST201916431G842A (WB-800-IPVM-12)
 """
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -121,7 +122,9 @@ class TestRealDeviceData:
         assert real_outlet_info[0]["name"] == "0"
 
     @pytest.mark.asyncio
-    async def test_telnet_client_with_real_data(self, real_device_data):
+    async def test_telnet_client_with_real_data(
+        self, real_device_data, real_outlet_info
+    ):
         """Test telnet client with real device responses."""
         with patch("telnetlib3.open_connection") as mock_open:
             mock_reader = AsyncMock()
@@ -133,18 +136,36 @@ class TestRealDeviceData:
                 b"Username: ",
                 b"Password: ",
                 b"Successfully Logged In!",
-                b"\n",  # Firmware response
-                b"\n",  # Model response
-                b"\n",  # Service tag response
-                b"\n",  # Hostname response
-                b"\n",  # Auto reboot response
-                b"\n",  # Outlet status response
-                b"\n",  # Outlet names response
             ]
 
+            # Answer each query written with the captured device values
+            responses = {
+                "?Firmware": "?Firmware=2.8.0.0",
+                "?Model": "?Model=WB-800-IPVM-12",
+                "?ServiceTag": "?ServiceTag=ST201916431G842A",
+                "?Hostname": "?Hostname=WattBox",
+                "?AutoReboot": "?AutoReboot=1",
+                "?OutletCount": "?OutletCount=12",
+                "?OutletStatus": "?OutletStatus=" + ",".join(["0"] * 12),
+                "?OutletName": "?OutletName="
+                + ",".join(f"{{{outlet['name']}}}" for outlet in real_outlet_info),
+            }
+            lines: asyncio.Queue[bytes] = asyncio.Queue()
+
+            def write(data: bytes) -> None:
+                for command in data.decode().split("\r\n"):
+                    if command in responses:
+                        lines.put_nowait(f"{responses[command]}\n".encode())
+
+            async def read(size: int) -> bytes:
+                return await lines.get()
+
+            mock_reader.read = read
+
             # Mock writer methods - write is synchronous, drain is async
-            mock_writer.write = MagicMock()
+            mock_writer.write = MagicMock(side_effect=write)
             mock_writer.drain = AsyncMock()
+            mock_writer.close = MagicMock()
 
             client = WattboxTelnetClient("192.168.1.100", "testuser", "test_password")
 
@@ -154,15 +175,18 @@ class TestRealDeviceData:
 
             # Test device info retrieval
             device_info = await client.async_get_device_info()
-            assert "hardware_version" in device_info
-            assert "model" in device_info
+            assert hasattr(device_info, "hardware_version")
+            assert hasattr(device_info, "model")
 
             # Test outlet status retrieval
             outlets = await client.async_get_outlet_status(18)
             assert len(outlets) == 18
             for outlet in outlets:
-                assert "state" in outlet
-                assert "name" in outlet
+                assert outlet.state is not None
+                assert outlet.name
+            assert outlets[1].name == "1"
+
+            await client.async_disconnect()
 
     def test_coordinator_with_real_data(self, real_device_data):
         """Test coordinator with real device data."""
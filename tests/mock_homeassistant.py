@@ -59,12 +59,47 @@ class FlowResult:
         return key in self.data
 
 
+class ServiceCall:
+    """Mock ServiceCall class."""
+
+    def __init__(self, domain: str, service: str, data: dict = None):
+        self.domain = domain
+        self.service = service
+        self.data = data or {}
+
+
+class ServiceRegistry:
+    """Mock ServiceRegistry class keeping handlers in memory."""
+
+    def __init__(self):
+        self._services: Dict[tuple, Any] = {}
+
+    def has_service(self, domain: str, service: str) -> bool:
+        """Return True if the service is registered."""
+        return (domain, service) in self._services
+
+    def async_register(self, domain, service, service_func, schema=None, **kwargs):
+        """Register a service handler."""
+        self._services[(domain, service)] = service_func
+
+    def async_remove(self, domain: str, service: str) -> None:
+        """Remove a service handler."""
+        self._services.pop((domain, service), None)
+
+    async def async_call(self, domain, service, service_data=None, **kwargs):
+        """Call a service handler with already validated data."""
+        await self._services[(domain, service)](
+            ServiceCall(domain, service, service_data)
+        )
+
+
 class HomeAssistant:
     """Mock HomeAssistant class."""
 
     def __init__(self, config_dir: str):
         self.config_dir = config_dir
         self.data: Dict[str, Any] = {}
+        self.services = ServiceRegistry()
         self.config_entries = MagicMock()
         self.entity_registry = MagicMock()
         self.device_registry = MagicMock()
@@ -96,6 +131,12 @@ class ConfigEntry:
         self.disabled_by = kwargs.get("disabled_by")
         self.reason = kwargs.get("reason")
 
+    def async_create_background_task(self, hass, target, name, eager_start=True):
+        """Mock async_create_background_task."""
+        import asyncio
+
+        return asyncio.ensure_future(target)
+
 
 class ConfigFlow:
     """Mock ConfigFlow class."""
@@ -179,11 +220,63 @@ class DataUpdateCoordinator:
         """Mock async_request_refresh."""
         pass
 
+    async def async_refresh(self):
+        """Mock async_refresh."""
+        pass
+
+    def async_set_updated_data(self, data):
+        """Mock async_set_updated_data, which restarts the refresh timer."""
+        self.data = data
+        self.last_update_success = True
+        if self.__dict__.get("_listeners"):
+            self._schedule_refresh()
+        self.async_update_listeners()
+
+    def _schedule_refresh(self):
+        """Mock _schedule_refresh; the next poll runs update_interval from now."""
+
+    def async_add_listener(self, update_callback, context=None):
+        """Mock async_add_listener."""
+        listeners = self.__dict__.setdefault("_listeners", [])
+        listeners.append(update_callback)
+        return lambda: listeners.remove(update_callback)
+
+    def async_update_listeners(self):
+        """Mock async_update_listeners."""
+        for update_callback in list(self.__dict__.get("_listeners", [])):
+            update_callback()
+
     def __class_getitem__(self, item):
         """Support generic type parameters like DataUpdateCoordinator[dict[str, Any]]."""
         return self
 
 
+class Store:
+    """Mock Store class keeping data in memory."""
+
+    def __init__(self, hass, version, key, **kwargs):
+        self.hass = hass
+        self.version = version
+        self.key = key
+        self.data = None
+
+    async def async_load(self):
+        """Mock async_load."""
+        return self.data
+
+    async def async_save(self, data):
+        """Mock async_save."""
+        self.data = data
+
+    def async_delay_save(self, data_func, delay=0):
+        """Save right away; the delay only batches writes in Home Assistant."""
+        self.data = data_func()
+
+    async def async_remove(self):
+        """Mock async_remove."""
+        self.data = None
+
+
 class UpdateFailed(Exception):
     """Mock UpdateFailed exception."""
 
@@ -220,6 +313,11 @@ class SwitchEntity:
     pass
 
 
+def callback(func):
+    """Mock callback decorator."""
+    return func
+
+
 # Create mock modules
 class MockModule:
     """Mock module class."""
@@ -250,6 +348,12 @@ class UnitOfPower:
     WATT = "W"
 
 
+class UnitOfEnergy:
+    """Mock UnitOfEnergy enum."""
+
+    KILO_WATT_HOUR = "kWh"
+
+
 # Mock configuration constants
 CONF_HOST = "host"
 CONF_PASSWORD = "password"
@@ -279,6 +383,29 @@ class CoordinatorEntity:
         self._attr_unique_id = None
         self._attr_name = None
         self._attr_device_class = None
+        self._on_remove = []
+
+    async def async_added_to_hass(self):
+        """Mock async_added_to_hass method."""
+        self.async_on_remove(
+            self.coordinator.async_add_listener(self._handle_coordinator_update)
+        )
+
+    def _handle_coordinator_update(self):
+        """Mock _handle_coordinator_update method."""
+        self.async_write_ha_state()
+
+    def async_write_ha_state(self):
+        """Mock async_write_ha_state method."""
+
+    def async_on_remove(self, func):
+        """Mock async_on_remove method."""
+        self._on_remove.append(func)
+
+    async def async_remove(self):
+        """Mock async_remove method that runs the on-remove callbacks."""
+        while self._on_remove:
+            self._on_remove.pop()()
 
     @property
     def unique_id(self):
@@ -296,6 +423,14 @@ class CoordinatorEntity:
         return self._attr_device_class
 
 
+def async_redact_data(data, to_redact):
+    """Mock async_redact_data for flat mappings."""
+    return {
+        key: "**REDACTED**" if key in to_redact else value
+        for key, value in data.items()
+    }
+
+
 class MockVoluptuous:
     """Mock voluptuous module."""
 
@@ -306,7 +441,9 @@ class MockVoluptuous:
 
 # Mock the homeassistant module structure
 homeassistant = MockModule(
-    core=MockModule(HomeAssistant=HomeAssistant),
+    core=MockModule(
+        HomeAssistant=HomeAssistant, ServiceCall=ServiceCall, callback=callback
+    ),
     config_entries=MockModule(ConfigEntry=ConfigEntry, ConfigFlow=ConfigFlow),
     data_entry_flow=MockModule(FlowResultType=FlowResultType, FlowResult=FlowResult),
     exceptions=MockModule(HomeAssistantError=HomeAssistantError),
@@ -314,6 +451,7 @@ homeassistant = MockModule(
         Platform=Platform,
         UnitOfElectricPotential=UnitOfElectricPotential,
         UnitOfPower=UnitOfPower,
+        UnitOfEnergy=UnitOfEnergy,
         CONF_HOST=CONF_HOST,
         CONF_PASSWORD=CONF_PASSWORD,
         CONF_USERNAME=CONF_USERNAME,
@@ -326,10 +464,12 @@ homeassistant = MockModule(
             CoordinatorEntity=CoordinatorEntity,
         ),
         frame=MockFrame(),
+        storage=MockModule(Store=Store),
         entity_platform=MockModule(AddEntitiesCallback=AddEntitiesCallback),
     ),
     components=MockModule(
         binary_sensor=MockModule(BinarySensorEntity=BinarySensorEntity),
+        diagnostics=MockModule(async_redact_data=async_redact_data),
         sensor=MockModule(SensorEntity=SensorEntity),
         switch=MockModule(SwitchEntity=SwitchEntity),
     ),
@@ -0,0 +1,150 @@
+"""Poll-cycle benchmarks for the Wattbox coordinator.
+
+Each scenario drives ``WattboxDataUpdateCoordinator._async_update_data``
+against the device emulator and records wall time, round trips and bytes
+per cycle. Results are compared with ``fixtures/benchmark_baseline.json``;
+set ``WATTBOX_UPDATE_BENCHMARK=1`` to rewrite the baseline after an
+intentional change.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from custom_components.wattbox.coordinator import (
+    TIER_NAMES,
+    TIER_STATUS,
+    TIER_UPS,
+    WattboxDataUpdateCoordinator,
+)
+from custom_components.wattbox.telnet_client import WattboxTelnetClient
+
+from .emulator import WattboxEmulator
+
+pytestmark = [pytest.mark.slow, pytest.mark.telnet]
+
+BASELINE_PATH = Path(__file__).parent / "fixtures" / "benchmark_baseline.json"
+UPDATE_BASELINE = os.environ.get("WATTBOX_UPDATE_BENCHMARK") == "1"
+
+# Simulated one-way device latency, so round trips show up in wall time
+LATENCY = 0.005
+CYCLES = 5
+
+# Wall time is noisy; allow this factor plus a fixed slack over the baseline
+WALL_TIME_FACTOR = 3.0
+WALL_TIME_SLACK = 0.05
+BYTES_FACTOR = 1.1
+
+PROFILES = {"12_outlet": 12, "18_outlet": 18}
+ALL_TIERS = (TIER_STATUS, TIER_NAMES, TIER_UPS)
+
+
+def _load_baseline() -> dict[str, Any]:
+    """Load the stored baseline, or an empty one."""
+    if BASELINE_PATH.exists():
+        return json.loads(BASELINE_PATH.read_text())
+    return {}
+
+
+def _save_result(profile: str, result: dict[str, Any]) -> None:
+    """Store one profile's results in the baseline file."""
+    baseline = _load_baseline()
+    baseline[profile] = result
+    BASELINE_PATH.write_text(json.dumps(baseline, indent=2, sort_keys=True) + "\n")
+
+
+async def _measure(
+    coordinator: WattboxDataUpdateCoordinator,
+    device: WattboxEmulator,
+    tiers: tuple[str, ...],
+) -> dict[str, float]:
+    """Run cycles with the given tiers due; return per-cycle means."""
+    wall_time = 0.0
+    round_trips = 0
+    bytes_total = 0
+    for _ in range(CYCLES):
+        for tier in tiers:
+            coordinator._last_fetch.pop(tier, None)
+        device.stats.reset()
+        start = time.perf_counter()
+        await coordinator._async_update_data()
+        wall_time += time.perf_counter() - start
+        round_trips += device.stats.reads
+        bytes_total += device.stats.bytes_in + device.stats.bytes_out
+    return {
+        "wall_time": round(wall_time / CYCLES, 4),
+        "round_trips": round_trips / CYCLES,
+        "bytes": bytes_total / CYCLES,
+    }
+
+
+def _check_budget(scenario: str, result: dict[str, float], budget: dict) -> None:
+    """Fail when a result regresses the stored budget."""
+    assert result["round_trips"] <= budget["round_trips"], (
+        f"{scenario}: {result['round_trips']} round trips per cycle, "
+        f"budget {budget['round_trips']}"
+    )
+    assert (
+        result["bytes"] <= budget["bytes"] * BYTES_FACTOR
+    ), f"{scenario}: {result['bytes']} bytes per cycle, budget {budget['bytes']}"
+    wall_budget = budget["wall_time"] * WALL_TIME_FACTOR + WALL_TIME_SLACK
+    assert result["wall_time"] <= wall_budget, (
+        f"{scenario}: {result['wall_time']:.4f}s per cycle, "
+        f"budget {wall_budget:.4f}s"
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("profile", list(PROFILES))
+async def test_poll_cycle_budget(hass: HomeAssistant, profile: str) -> None:
+    """Test poll cycles stay within the recorded budget."""
+    outlet_count = PROFILES[profile]
+    async with WattboxEmulator(
+        outlet_count=outlet_count, latency=LATENCY, seed=0
+    ) as device:
+        config_entry = MagicMock(spec=ConfigEntry)
+        config_entry.entry_id = f"benchmark_{profile}"
+        config_entry.data = {"host": device.host, "polling_interval": 30}
+        client = WattboxTelnetClient(
+            device.host, device.username, device.password, port=device.port
+        )
+        with patch("homeassistant.helpers.frame.report_usage"):
+            coordinator = WattboxDataUpdateCoordinator(hass, config_entry, client)
+
+        try:
+            # The first cycle also reads the device identity
+            await client.async_connect()
+            device.stats.reset()
+            start = time.perf_counter()
+            data = await coordinator._async_update_data()
+            cold = {
+                "wall_time": round(time.perf_counter() - start, 4),
+                "round_trips": device.stats.reads,
+                "bytes": device.stats.bytes_in + device.stats.bytes_out,
+            }
+            full = await _measure(coordinator, device, ALL_TIERS)
+            status = await _measure(coordinator, device, (TIER_STATUS,))
+        finally:
+            await coordinator.async_disconnect()
+
+    assert len(data.outlets) == outlet_count
+    result = {"cold": cold, "full": full, "status": status}
+
+    if UPDATE_BASELINE:
+        _save_result(profile, result)
+        return
+
+    baseline = _load_baseline().get(profile)
+    if baseline is None:
+        pytest.skip(f"No benchmark baseline recorded for {profile}")
+    for scenario, measured in result.items():
+        _check_budget(f"{profile}/{scenario}", measured, baseline[scenario])
@@ -17,19 +17,34 @@ from custom_components.wattbox.binary_sensor import (
     WattboxStatusBinarySensor,
     WattboxUPSConnectedBinarySensor,
     WattboxUPSPowerLostBinarySensor,
+    WattboxVoltageEventBinarySensor,
     async_setup_entry,
 )
 from custom_components.wattbox.const import DOMAIN
+from custom_components.wattbox.models import (
+    PowerQuality,
+    PowerStatus,
+    UPSStatus,
+    WattboxSnapshot,
+    evolve,
+)
+
+
+def _snapshot(connected: bool = True, power=None, ups=None) -> WattboxSnapshot:
+    """Return a snapshot with the given power and UPS fields."""
+    return evolve(
+        WattboxSnapshot.empty(),
+        power=evolve(PowerStatus.unknown(), **(power or {})),
+        ups=evolve(UPSStatus.unknown(), **(ups or {})),
+        connected=connected,
+    )
 
 
 @pytest.fixture
 def mock_coordinator() -> DataUpdateCoordinator:
     """Mock coordinator for testing."""
     coordinator = MagicMock(spec=DataUpdateCoordinator)
-    coordinator.data = {
-        "connected": True,
-        "last_update": "2023-01-01T00:00:00Z",
-    }
+    coordinator.data = _snapshot()
     return coordinator
 
 
@@ -109,15 +124,15 @@ def test_wattbox_status_binary_sensor_is_on(
     )
 
     # Test when device is connected
-    mock_coordinator.data = {"connected": True}
+    mock_coordinator.data = _snapshot()
     assert sensor.is_on is True
 
     # Test when device is not connected
-    mock_coordinator.data = {"connected": False}
+    mock_coordinator.data = _snapshot(connected=False)
     assert sensor.is_on is False
 
     # Test when no connection data
-    mock_coordinator.data = {}
+    mock_coordinator.data = None
     assert sensor.is_on is False
 
 
@@ -195,25 +210,19 @@ def test_wattbox_power_lost_binary_sensor_is_on(
     )
 
     # Test when power is lost
-    mock_coordinator.data = {
-        "connected": True,
-        "status_info": {"ups_status": {"power_lost": True}},
-    }
+    mock_coordinator.data = _snapshot(ups={"power_lost": True})
     assert sensor.is_on is True
 
     # Test when power is not lost
-    mock_coordinator.data = {
-        "connected": True,
-        "status_info": {"ups_status": {"power_lost": False}},
-    }
+    mock_coordinator.data = _snapshot(ups={"power_lost": False})
     assert sensor.is_on is False
 
     # Test when not connected
-    mock_coordinator.data = {"connected": False}
+    mock_coordinator.data = _snapshot(connected=False)
     assert sensor.is_on is None
 
     # Test when no status data
-    mock_coordinator.data = {"connected": True}
+    mock_coordinator.data = _snapshot()
     assert sensor.is_on is False
 
 
@@ -243,25 +252,19 @@ def test_wattbox_safe_voltage_binary_sensor_is_on(
     )
 
     # Test when voltage is safe (1)
-    mock_coordinator.data = {
-        "connected": True,
-        "status_info": {"power_status": {"safe_voltage": 1}},
-    }
+    mock_coordinator.data = _snapshot(power={"safe_voltage": 1})
     assert sensor.is_on is True
 
     # Test when voltage is not safe (0)
-    mock_coordinator.data = {
-        "connected": True,
-        "status_info": {"power_status": {"safe_voltage": 0}},
-    }
+    mock_coordinator.data = _snapshot(power={"safe_voltage": 0})
     assert sensor.is_on is False
 
     # Test when not connected
-    mock_coordinator.data = {"connected": False}
+    mock_coordinator.data = _snapshot(connected=False)
     assert sensor.is_on is None
 
     # Test when no status data
-    mock_coordinator.data = {"connected": True}
+    mock_coordinator.data = _snapshot()
     assert sensor.is_on is None
 
 
@@ -291,19 +294,19 @@ def test_wattbox_ups_connected_binary_sensor_is_on(
     )
 
     # Test when UPS is connected
-    mock_coordinator.data = {"connected": True, "status_info": {"ups_connected": True}}
+    mock_coordinator.data = _snapshot(ups={"connected": True})
     assert sensor.is_on is True
 
     # Test when UPS is not connected
-    mock_coordinator.data = {"connected": True, "status_info": {"ups_connected": False}}
+    mock_coordinator.data = _snapshot(ups={"connected": False})
     assert sensor.is_on is False
 
     # Test when not connected
-    mock_coordinator.data = {"connected": False}
+    mock_coordinator.data = _snapshot(connected=False)
     assert sensor.is_on is None
 
     # Test when no status data
-    mock_coordinator.data = {"connected": True}
+    mock_coordinator.data = _snapshot()
     assert sensor.is_on is False
 
 
@@ -333,23 +336,40 @@ def test_wattbox_ups_power_lost_binary_sensor_is_on(
     )
 
     # Test when UPS power is lost
-    mock_coordinator.data = {
-        "connected": True,
-        "status_info": {"ups_status": {"power_lost": True}},
-    }
+    mock_coordinator.data = _snapshot(ups={"power_lost": True})
     assert sensor.is_on is True
 
     # Test when UPS power is not lost
-    mock_coordinator.data = {
-        "connected": True,
-        "status_info": {"ups_status": {"power_lost": False}},
-    }
+    mock_coordinator.data = _snapshot(ups={"power_lost": False})
     assert sensor.is_on is False
 
     # Test when not connected
-    mock_coordinator.data = {"connected": False}
+    mock_coordinator.data = _snapshot(connected=False)
     assert sensor.is_on is None
 
     # Test when no status data
-    mock_coordinator.data = {"connected": True}
+    mock_coordinator.data = _snapshot()
+    assert sensor.is_on is False
+
+
+def test_wattbox_voltage_event_binary_sensor(
+    mock_coordinator: DataUpdateCoordinator,
+) -> None:
+    """Test the sag, swell and brownout binary sensors."""
+    sensor = WattboxVoltageEventBinarySensor(
+        mock_coordinator, "test_entry_id", "sag", "Voltage Sag"
+    )
+    assert sensor.unique_id == "test_entry_id_voltage_sag"
+    assert sensor.name == "Voltage Sag"
+    assert sensor.device_class == "problem"
+    assert sensor.is_on is None
+
+    mock_coordinator.data = evolve(
+        _snapshot(), quality=PowerQuality(True, False, False, 1, 0, 0)
+    )
+    assert sensor.is_on is True
+
+    mock_coordinator.data = _snapshot(connected=False)
+    assert sensor.is_on is None
+    mock_coordinator.data = None
     assert sensor.is_on is False
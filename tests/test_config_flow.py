@@ -155,6 +155,50 @@ async def test_user_flow_validation_errors(hass: HomeAssistant) -> None:
     assert "errors" in result
 
 
+@pytest.mark.asyncio
+async def test_user_flow_invalid_shed_priorities(hass: HomeAssistant) -> None:
+    """Test a malformed load shedding priority map is rejected before connecting."""
+    flow = ConfigFlow()
+    flow.hass = hass
+
+    with patch.object(flow, "_test_connection") as mock_test:
+        result = await flow.async_step_user(
+            {
+                "host": "192.168.1.100",
+                "username": "wattbox",
+                "password": "wattbox",
+                "shed_priorities": "7:low",
+            }
+        )
+
+    assert result["type"] == FlowResultType.FORM
+    assert result["errors"] == {"shed_priorities": "invalid_shed_priorities"}
+    mock_test.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_user_flow_shed_outlet_out_of_range(hass: HomeAssistant) -> None:
+    """Test shedding an outlet the device does not have is rejected."""
+    flow = ConfigFlow()
+    flow.hass = hass
+
+    async def connect(user_input):
+        flow._device_info = {"outlet_count": 12}
+
+    with patch.object(flow, "_test_connection", side_effect=connect):
+        result = await flow.async_step_user(
+            {
+                "host": "192.168.1.100",
+                "username": "wattbox",
+                "password": "wattbox",
+                "shed_priorities": "12:1, 13:2",
+            }
+        )
+
+    assert result["type"] == FlowResultType.FORM
+    assert result["errors"] == {"shed_priorities": "invalid_shed_priorities"}
+
+
 @pytest.mark.asyncio
 async def test_test_connection_success(hass: HomeAssistant) -> None:
     """Test successful connection test."""
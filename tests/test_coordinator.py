@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from datetime import timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -10,13 +11,66 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.update_coordinator import UpdateFailed
 
-from custom_components.wattbox.coordinator import WattboxDataUpdateCoordinator
+from custom_components.wattbox.coordinator import (
+    TIER_STATUS,
+    WattboxDataUpdateCoordinator,
+)
+from custom_components.wattbox.models import (
+    DeviceIdentity,
+    EnergyTotals,
+    OutletState,
+    PowerStatus,
+    UPSStatus,
+    WattboxSnapshot,
+    evolve,
+)
+from custom_components.wattbox.scheduler import WattboxPollScheduler
 from custom_components.wattbox.telnet_client import (
     WattboxAuthenticationError,
     WattboxConnectionError,
     WattboxTelnetClient,
+    WattboxTelnetError,
 )
 
+from .emulator import WattboxEmulator
+
+
+def _device(**fields) -> DeviceIdentity:
+    """Return a device identity with the given fields known."""
+    return evolve(DeviceIdentity.unknown(), **fields)
+
+
+def _outlets(*states: int, names: tuple[str, ...] = ()) -> tuple[OutletState, ...]:
+    """Return outlets with the given states."""
+    return tuple(
+        evolve(
+            OutletState.default(number, names[number - 1] if names else None),
+            state=state,
+        )
+        for number, state in enumerate(states, start=1)
+    )
+
+
+def _poll(
+    outlets: tuple[OutletState, ...] = (), power_lost: bool | None = None, **power
+) -> tuple[tuple[OutletState, ...], PowerStatus, UPSStatus]:
+    """Return (outlets, power, ups) records as async_poll does."""
+    return (
+        outlets,
+        evolve(PowerStatus.unknown(), **power),
+        evolve(UPSStatus.unknown(), power_lost=power_lost),
+    )
+
+
+def _snapshot(outlets: tuple[OutletState, ...], **power) -> WattboxSnapshot:
+    """Return a connected snapshot."""
+    return evolve(
+        WattboxSnapshot.empty(),
+        outlets=outlets,
+        power=evolve(PowerStatus.unknown(), **power),
+        connected=True,
+    )
+
 
 @pytest.fixture
 def mock_config_entry() -> ConfigEntry:
@@ -40,8 +94,8 @@ def mock_telnet_client() -> WattboxTelnetClient:
     client.async_connect = AsyncMock()
     client.async_disconnect = AsyncMock()
     client.async_get_device_info = AsyncMock()
-    client.async_get_outlet_status = AsyncMock()
-    client.async_get_status_info = AsyncMock()
+    client.async_poll = AsyncMock()
+    client.async_probe_capabilities = AsyncMock(return_value=frozenset())
     return client
 
 
@@ -77,6 +131,7 @@ def test_coordinator_init_custom_polling_interval(
 ) -> None:
     """Test coordinator initialization with custom polling interval."""
     config_entry = MagicMock(spec=ConfigEntry)
+    config_entry.entry_id = "test_entry_id"
     config_entry.data = {"polling_interval": 60}
 
     with patch("homeassistant.helpers.frame.report_usage"):
@@ -94,40 +149,484 @@ async def test_async_update_data_success(
 ) -> None:
     """Test successful data update."""
     # Mock successful data retrieval
-    mock_telnet_client.async_get_device_info.return_value = {
-        "hardware_version": "1.0.0",
-        "model": "WB-800VPS-IPVM-18",
-        "serial_number": "TEST123",
-        "hostname": "test-wattbox",
-    }
-
-    mock_telnet_client.async_get_outlet_status.return_value = [
-        {"state": 1, "name": "Outlet 1"},
-        {"state": 0, "name": "Outlet 2"},
-    ]
+    mock_telnet_client.async_get_device_info.return_value = _device(
+        hardware_version="1.0.0",
+        model="WB-800VPS-IPVM-18",
+        serial_number="TEST123",
+        hostname="test-wattbox",
+    )
 
-    mock_telnet_client.async_get_status_info.return_value = {
-        "power_status": {
-            "voltage": 120.5,
-            "current": 1.2,
-            "power": 144.6,
-        }
-    }
+    mock_telnet_client.async_poll.return_value = _poll(
+        _outlets(1, 0), voltage=120.5, current=1.2, power=144.6
+    )
 
     data = await coordinator._async_update_data()
 
-    assert data["connected"] is True
-    assert data["device_info"]["hostname"] == "test-wattbox"
-    assert len(data["outlet_info"]) == 2
-    assert data["voltage"] == 120.5
-    assert data["current"] == 1.2
-    assert data["power"] == 144.6
+    assert data.connected is True
+    assert data.device.hostname == "test-wattbox"
+    assert len(data.outlets) == 2
+    assert data.power.voltage == 120.5
+    assert data.power.current == 1.2
+    assert data.power.power == 144.6
 
     # Verify client methods were called
     mock_telnet_client.async_connect.assert_called_once()
     mock_telnet_client.async_get_device_info.assert_called_once()
-    mock_telnet_client.async_get_outlet_status.assert_called_once_with(18)
-    mock_telnet_client.async_get_status_info.assert_called_once()
+    # First poll fetches every tier
+    mock_telnet_client.async_poll.assert_called_once_with(
+        18,
+        include_states=True,
+        include_names=True,
+        include_power=True,
+        include_ups=True,
+        power_outlets=list(range(1, 19)),
+    )
+
+
+@pytest.mark.asyncio
+async def test_async_update_data_tiers(
+    coordinator: WattboxDataUpdateCoordinator,
+    mock_telnet_client: WattboxTelnetClient,
+) -> None:
+    """Test that later polls only fetch the tiers that are due."""
+    mock_telnet_client.async_get_device_info.return_value = _device(model="WB-800")
+    mock_telnet_client.async_poll.return_value = _poll(power_lost=False, voltage=120.0)
+
+    with patch(
+        "custom_components.wattbox.coordinator.time.monotonic", return_value=1000.0
+    ):
+        coordinator.data = await coordinator._async_update_data()
+
+    mock_telnet_client.is_connected = True
+    mock_telnet_client.async_poll.reset_mock()
+
+    with patch(
+        "custom_components.wattbox.coordinator.time.monotonic", return_value=1030.0
+    ):
+        data = await coordinator._async_update_data()
+
+    # Identity is fetched once per connection
+    mock_telnet_client.async_get_device_info.assert_called_once()
+    assert data.device == _device(model="WB-800")
+    # Outlet names are not due after one polling interval; UPS status is
+    mock_telnet_client.async_poll.assert_called_once_with(
+        18,
+        include_states=True,
+        include_names=False,
+        include_power=True,
+        include_ups=True,
+        power_outlets=list(range(1, 19)),
+    )
+    assert coordinator.update_interval == timedelta(seconds=30)
+
+
+@pytest.mark.asyncio
+async def test_async_update_data_power_lost_fast_ups(
+    coordinator: WattboxDataUpdateCoordinator,
+    mock_telnet_client: WattboxTelnetClient,
+) -> None:
+    """Test that UPS status is polled every few seconds while power is lost."""
+    mock_telnet_client.async_get_device_info.return_value = _device()
+    mock_telnet_client.async_poll.return_value = _poll(power_lost=True)
+
+    with patch(
+        "custom_components.wattbox.coordinator.time.monotonic", return_value=1000.0
+    ):
+        coordinator.data = await coordinator._async_update_data()
+
+    assert coordinator.update_interval == timedelta(seconds=2)
+
+    mock_telnet_client.is_connected = True
+    mock_telnet_client.async_poll.reset_mock()
+
+    # Battery runtime is read on every fast poll
+    for now, runtime in ((1002.0, 25), (1004.0, 24)):
+        mock_telnet_client.async_poll.return_value = (
+            (),
+            PowerStatus.unknown(),
+            evolve(UPSStatus.unknown(), power_lost=True, battery_runtime=runtime),
+        )
+        with patch(
+            "custom_components.wattbox.coordinator.time.monotonic", return_value=now
+        ):
+            coordinator.data = await coordinator._async_update_data()
+        assert coordinator.data.ups.battery_runtime == runtime
+
+    assert mock_telnet_client.async_poll.call_count == 2
+    mock_telnet_client.async_poll.assert_called_with(
+        18,
+        include_states=False,
+        include_names=False,
+        include_power=False,
+        include_ups=True,
+        power_outlets=[],
+    )
+
+    # Normal cadence resumes once mains returns
+    mock_telnet_client.async_poll.return_value = _poll(power_lost=False)
+    with patch(
+        "custom_components.wattbox.coordinator.time.monotonic", return_value=1006.0
+    ):
+        await coordinator._async_update_data()
+    assert coordinator.update_interval == timedelta(seconds=30)
+
+
+@pytest.mark.asyncio
+async def test_power_lost_skips_fleet_slot(
+    hass: HomeAssistant,
+    mock_config_entry: ConfigEntry,
+    mock_telnet_client: WattboxTelnetClient,
+) -> None:
+    """Test a UPS on battery is not held back to its fleet slot."""
+    scheduler = MagicMock(spec=WattboxPollScheduler)
+    scheduler.async_poll.return_value.__aenter__ = AsyncMock()
+    scheduler.async_poll.return_value.__aexit__ = AsyncMock(return_value=False)
+    scheduler.next_delay.return_value = 3.0
+    with patch("homeassistant.helpers.frame.report_usage"):
+        coordinator = WattboxDataUpdateCoordinator(
+            hass, mock_config_entry, mock_telnet_client, scheduler=scheduler
+        )
+    mock_telnet_client.async_get_device_info.return_value = _device()
+    mock_telnet_client.async_poll.return_value = _poll(power_lost=True)
+
+    await coordinator._async_update_data()
+
+    scheduler.next_delay.assert_not_called()
+    assert coordinator.update_interval == timedelta(seconds=2)
+
+
+@pytest.mark.asyncio
+async def test_load_shed_in_the_triggering_poll(
+    hass: HomeAssistant,
+    mock_config_entry: ConfigEntry,
+    mock_telnet_client: WattboxTelnetClient,
+) -> None:
+    """Test the shedding plan is sent in one batch from the poll that triggers it."""
+    mock_config_entry.data = {
+        **mock_config_entry.data,
+        "shed_priorities": "2:2, 3:1, 20:1",
+        "shed_on_battery": True,
+    }
+    with patch("homeassistant.helpers.frame.report_usage"):
+        coordinator = WattboxDataUpdateCoordinator(
+            hass, mock_config_entry, mock_telnet_client
+        )
+    mock_telnet_client.async_get_device_info.return_value = _device(outlet_count=3)
+    mock_telnet_client.async_poll.return_value = _poll(
+        _outlets(1, 1, 1), power_lost=True
+    )
+    mock_telnet_client.async_set_outlet_states = AsyncMock(
+        return_value=_outlets(1, 0, 0)
+    )
+
+    async def poll(now: float) -> WattboxSnapshot:
+        with patch(
+            "custom_components.wattbox.coordinator.time.monotonic", return_value=now
+        ):
+            coordinator.data = await coordinator._async_update_data()
+        mock_telnet_client.is_connected = True
+        return coordinator.data
+
+    data = await poll(1000.0)
+
+    # Outlets the device does not have are dropped from the plan
+    assert [outlet.state for outlet in data.outlets] == [1, 0, 0]
+    mock_telnet_client.async_set_outlet_states.assert_called_once_with(
+        {3: "off", 2: "off"}
+    )
+    assert list(mock_telnet_client.async_set_outlet_states.call_args[0][0]) == [3, 2]
+    assert coordinator.load_shedder.active is True
+    assert coordinator.load_shedder.shed == (3, 2)
+
+    # Shed once per episode, re-armed when mains returns
+    await poll(1003.0)
+    assert mock_telnet_client.async_set_outlet_states.call_count == 1
+    mock_telnet_client.async_poll.return_value = _poll(
+        _outlets(1, 0, 0), power_lost=False
+    )
+    await poll(1006.0)
+    assert mock_telnet_client.async_poll.call_count == 3
+    assert coordinator.load_shedder.active is False
+
+
+@pytest.mark.asyncio
+async def test_load_shed_rejected_still_publishes(
+    hass: HomeAssistant,
+    mock_config_entry: ConfigEntry,
+    mock_telnet_client: WattboxTelnetClient,
+) -> None:
+    """Test a rejected shed is sent once and publishes what was actually shed."""
+    mock_config_entry.data = {
+        **mock_config_entry.data,
+        "shed_priorities": "2, 3",
+        "shed_on_battery": True,
+    }
+    with patch("homeassistant.helpers.frame.report_usage"):
+        coordinator = WattboxDataUpdateCoordinator(
+            hass, mock_config_entry, mock_telnet_client
+        )
+    mock_telnet_client.async_get_device_info.return_value = _device(outlet_count=3)
+    mock_telnet_client.async_poll.return_value = _poll(
+        _outlets(1, 1, 1), power_lost=True
+    )
+    mock_telnet_client.async_set_outlet_states = AsyncMock(
+        side_effect=WattboxTelnetError("Device rejected command: !OutletSet=3,OFF")
+    )
+    mock_telnet_client.snapshot = evolve(
+        WattboxSnapshot.empty(), outlets=_outlets(1, 0, 1)
+    )
+
+    data = await coordinator._async_update_data()
+    coordinator.data = data
+    mock_telnet_client.is_connected = True
+    await coordinator._async_update_data()
+
+    assert data.connected is True
+    # Outlet 2 went off before outlet 3 was rejected
+    assert [outlet.state for outlet in data.outlets] == [1, 0, 1]
+    mock_telnet_client.async_set_outlet_states.assert_called_once()
+    assert coordinator.load_shedder.active is True
+    assert coordinator.load_shedder.shed == (2,)
+
+
+@pytest.mark.asyncio
+async def test_voltage_event_polls_status_faster(
+    coordinator: WattboxDataUpdateCoordinator,
+    mock_telnet_client: WattboxTelnetClient,
+) -> None:
+    """Test status is sampled faster only while voltage is out of band."""
+    mock_telnet_client.async_get_device_info.return_value = _device()
+    mock_telnet_client.async_poll.return_value = _poll(voltage=120.0, safe_voltage=1)
+
+    with patch(
+        "custom_components.wattbox.coordinator.time.monotonic", return_value=970.0
+    ):
+        coordinator.data = await coordinator._async_update_data()
+    assert coordinator.update_interval == timedelta(seconds=30)
+
+    mock_telnet_client.is_connected = True
+    mock_telnet_client.async_poll.return_value = _poll(voltage=95.0, safe_voltage=0)
+    with patch(
+        "custom_components.wattbox.coordinator.time.monotonic", return_value=1000.0
+    ):
+        coordinator.data = await coordinator._async_update_data()
+
+    assert coordinator.data.quality.sag is True
+    assert coordinator.data.quality.sags == 1
+    assert coordinator.update_interval == timedelta(seconds=3)
+
+    mock_telnet_client.async_poll.reset_mock()
+    mock_telnet_client.async_poll.return_value = _poll(voltage=120.0, safe_voltage=0)
+    with patch(
+        "custom_components.wattbox.coordinator.time.monotonic", return_value=1003.0
+    ):
+        coordinator.data = await coordinator._async_update_data()
+
+    mock_telnet_client.async_poll.assert_called_once_with(
+        18,
+        include_states=True,
+        include_names=False,
+        include_power=True,
+        include_ups=False,
+        power_outlets=list(range(1, 19)),
+    )
+    # The device still flags the voltage as unsafe
+    assert coordinator.data.quality.sag is False
+    assert coordinator.update_interval == timedelta(seconds=3)
+
+    mock_telnet_client.async_poll.return_value = _poll(voltage=120.0, safe_voltage=1)
+    with patch(
+        "custom_components.wattbox.coordinator.time.monotonic", return_value=1006.0
+    ):
+        coordinator.data = await coordinator._async_update_data()
+
+    assert coordinator.update_interval == timedelta(seconds=30)
+
+
+@pytest.mark.asyncio
+async def test_safe_voltage_ignored_until_reported(
+    coordinator: WattboxDataUpdateCoordinator,
+    mock_telnet_client: WattboxTelnetClient,
+) -> None:
+    """Test a model that always reports unsafe voltage keeps the normal cadence."""
+    mock_telnet_client.async_get_device_info.return_value = _device()
+    mock_telnet_client.async_poll.return_value = _poll(voltage=120.0, safe_voltage=0)
+
+    for now in (1000.0, 1030.0):
+        with patch(
+            "custom_components.wattbox.coordinator.time.monotonic", return_value=now
+        ):
+            coordinator.data = await coordinator._async_update_data()
+        mock_telnet_client.is_connected = True
+
+    assert coordinator.update_interval == timedelta(seconds=30)
+
+
+@pytest.mark.asyncio
+async def test_async_update_data_uses_fleet_scheduler(
+    hass: HomeAssistant,
+    mock_config_entry: ConfigEntry,
+    mock_telnet_client: WattboxTelnetClient,
+) -> None:
+    """Test that a scheduled coordinator polls in a slot and realigns."""
+    scheduler = MagicMock(spec=WattboxPollScheduler)
+    scheduler.async_poll.return_value.__aenter__ = AsyncMock()
+    scheduler.async_poll.return_value.__aexit__ = AsyncMock(return_value=False)
+    scheduler.next_delay.return_value = 42.0
+    with patch("homeassistant.helpers.frame.report_usage"):
+        coordinator = WattboxDataUpdateCoordinator(
+            hass, mock_config_entry, mock_telnet_client, scheduler=scheduler
+        )
+    mock_telnet_client.async_get_device_info.return_value = _device()
+    mock_telnet_client.async_poll.return_value = _poll()
+
+    data = await coordinator._async_update_data()
+
+    assert data.connected is True
+    scheduler.async_poll.assert_called_once_with("test_entry_id")
+    scheduler.next_delay.assert_called_once_with("test_entry_id", 30)
+    assert coordinator.update_interval == timedelta(seconds=42)
+
+
+@pytest.mark.asyncio
+async def test_outlet_power_polls_only_enabled_entities(
+    hass: HomeAssistant,
+    mock_config_entry: ConfigEntry,
+    mock_telnet_client: WattboxTelnetClient,
+) -> None:
+    """Test that outlet power can be limited to outlets with enabled entities."""
+    mock_config_entry.data = {
+        **mock_config_entry.data,
+        "outlet_power_enabled_only": True,
+    }
+    with patch("homeassistant.helpers.frame.report_usage"):
+        coordinator = WattboxDataUpdateCoordinator(
+            hass, mock_config_entry, mock_telnet_client
+        )
+    remove_power = coordinator.async_add_outlet_power_entity(3)
+    remove_current = coordinator.async_add_outlet_power_entity(3)
+    coordinator.async_add_outlet_power_entity(1)
+    coordinator.async_add_outlet_power_entity(20)
+
+    assert coordinator._outlet_power_targets(18) == [1, 3]
+
+    remove_power()
+    assert coordinator._outlet_power_targets(18) == [1, 3]
+    remove_current()
+    assert coordinator._outlet_power_targets(18) == [1]
+
+
+@pytest.mark.asyncio
+async def test_adaptive_polling_interval(
+    hass: HomeAssistant,
+    mock_config_entry: ConfigEntry,
+    mock_telnet_client: WattboxTelnetClient,
+) -> None:
+    """Test that adaptive mode backs off when steady and speeds up on change."""
+    mock_config_entry.data = {
+        **mock_config_entry.data,
+        "adaptive_polling": True,
+        "min_polling_interval": 3,
+        "max_polling_interval": 60,
+    }
+    with patch("homeassistant.helpers.frame.report_usage"):
+        coordinator = WattboxDataUpdateCoordinator(
+            hass, mock_config_entry, mock_telnet_client
+        )
+    mock_telnet_client.async_get_device_info.return_value = _device()
+    mock_telnet_client.async_poll.return_value = _poll(
+        _outlets(1), voltage=120.0, power=100.0
+    )
+
+    async def poll() -> float:
+        coordinator._last_fetch.pop("status", None)
+        await coordinator._async_update_data()
+        return coordinator._tier_intervals["status"]
+
+    assert await poll() == 30
+    assert await poll() == 45
+    assert await poll() == 60  # capped at the maximum
+
+    # Small fluctuations count as steady
+    mock_telnet_client.async_poll.return_value = _poll(
+        _outlets(1), voltage=120.0, power=102.0
+    )
+    assert await poll() == 60
+
+    # A load jump drops straight to the minimum
+    mock_telnet_client.async_poll.return_value = _poll(
+        _outlets(1), voltage=120.0, power=150.0
+    )
+    assert await poll() == 3
+    assert coordinator.update_interval == timedelta(seconds=3)
+    assert await poll() == 4.5
+
+    # So does an outlet switching
+    mock_telnet_client.async_poll.return_value = _poll(
+        _outlets(0), voltage=120.0, power=150.0
+    )
+    assert await poll() == 3
+    assert await poll() == 4.5
+
+    # And UPS power loss, for as long as it lasts
+    mock_telnet_client.async_poll.return_value = _poll(
+        _outlets(0), power_lost=True, voltage=120.0, power=150.0
+    )
+    assert await poll() == 3
+    assert await poll() == 3
+
+
+def test_changed_keys(coordinator: WattboxDataUpdateCoordinator) -> None:
+    """Test that updates report which data keys changed."""
+    data = _snapshot(_outlets(1, 0, names=("A", "B")), voltage=120.0, power=50.0)
+    coordinator.async_set_updated_data(data)
+    # The first update notifies everyone
+    assert coordinator.changed_keys is None
+
+    coordinator.async_set_updated_data(
+        _snapshot(_outlets(1, 1, names=("A", "B")), voltage=121.0, power=50.0)
+    )
+    assert coordinator.changed_keys == {
+        "outlets",
+        "outlets.2",
+        "outlets.2.state",
+        "power",
+        "power.voltage",
+    }
+
+    # Equal but rebuilt records are compared field by field
+    coordinator.async_set_updated_data(
+        _snapshot(_outlets(1, 1, names=("A", "B")), voltage=121.0, power=50.0)
+    )
+    assert coordinator.changed_keys == frozenset()
+
+    # Outlets appearing or disappearing are reported too
+    coordinator.async_set_updated_data(
+        evolve(coordinator.data, outlets=coordinator.data.outlets[:1])
+    )
+    assert coordinator.changed_keys == {"outlets", "outlets.2"}
+
+    coordinator.async_set_updated_data(
+        evolve(coordinator.data, energy=EnergyTotals(1.5, (0.5,)))
+    )
+    assert coordinator.changed_keys == {
+        "energy",
+        "energy.total",
+        "energy.outlets",
+        "energy.outlets.1",
+    }
+
+    # New telemetry samples notify entities showing rolling statistics
+    coordinator.telemetry.record(0.0, coordinator.data.power)
+    coordinator.async_set_updated_data(coordinator.data)
+    assert coordinator.changed_keys == {"telemetry"}
+    coordinator.async_set_updated_data(coordinator.data)
+    assert coordinator.changed_keys == frozenset()
+
+    # Availability changes notify everyone
+    coordinator.last_update_success = False
+    coordinator.async_update_listeners()
+    assert coordinator.changed_keys is None
 
 
 @pytest.mark.asyncio
@@ -176,13 +675,123 @@ async def test_async_set_outlet_state(
     mock_telnet_client: WattboxTelnetClient,
 ) -> None:
     """Test setting outlet state."""
-    mock_telnet_client.async_set_outlet_state = AsyncMock()
+    mock_telnet_client.async_set_outlet_state = AsyncMock(return_value=_outlets(1, 1))
     coordinator.async_request_refresh = AsyncMock()
+    coordinator.data = _snapshot(_outlets(0, 0))
+    previous = coordinator.data
+    published = []
+    coordinator.async_add_listener(lambda: published.append(coordinator.data))
+
+    with patch.object(coordinator, "_schedule_refresh") as schedule_refresh:
+        await coordinator.async_set_outlet_state(1, True)
 
-    await coordinator.async_set_outlet_state(1, True)
+    # Publishing between polls leaves the next poll where it was
+    schedule_refresh.assert_not_called()
 
     mock_telnet_client.async_set_outlet_state.assert_called_once_with(1, True)
-    coordinator.async_request_refresh.assert_called_once()
+    # No full refresh: optimistic single-outlet update, then the confirmed states
+    coordinator.async_request_refresh.assert_not_called()
+    assert [o.state for o in published[0].outlets] == [1, 0]
+    assert [o.state for o in published[1].outlets] == [1, 1]
+    # The untouched outlet is shared with the previous snapshot
+    assert published[0].outlets[1] is previous.outlets[1]
+    assert published[0].power is previous.power
+
+
+@pytest.mark.asyncio
+async def test_async_set_outlet_state_failure_rolls_back(
+    coordinator: WattboxDataUpdateCoordinator,
+    mock_telnet_client: WattboxTelnetClient,
+) -> None:
+    """Test that the optimistic state is rolled back when the command fails."""
+    mock_telnet_client.async_set_outlet_state = AsyncMock(
+        side_effect=WattboxConnectionError("Not connected")
+    )
+    coordinator.data = _snapshot(_outlets(0))
+
+    with pytest.raises(WattboxConnectionError):
+        await coordinator.async_set_outlet_state(1, True)
+
+    assert coordinator.data.outlet(1).state == 0
+
+
+@pytest.mark.asyncio
+async def test_async_set_outlet_states(
+    coordinator: WattboxDataUpdateCoordinator,
+    mock_telnet_client: WattboxTelnetClient,
+) -> None:
+    """Test several outlets are set optimistically and confirmed in one update."""
+    seen = []
+
+    async def set_outlet_states(actions):
+        seen.append([outlet.state for outlet in coordinator.data.outlets])
+        return _outlets(1, 0, 1)
+
+    mock_telnet_client.async_set_outlet_states = AsyncMock(
+        side_effect=set_outlet_states
+    )
+    coordinator.data = _snapshot(_outlets(0, 1, 0))
+
+    await coordinator.async_set_outlet_states({1: "on", 2: "off", 3: "reset"})
+
+    mock_telnet_client.async_set_outlet_states.assert_called_once_with(
+        {1: "on", 2: "off", 3: "reset"}
+    )
+    # Reset is left to the confirmation
+    assert seen == [[1, 0, 0]]
+    assert [outlet.state for outlet in coordinator.data.outlets] == [1, 0, 1]
+
+
+@pytest.mark.asyncio
+async def test_async_set_outlet_states_failure_rolls_back(
+    coordinator: WattboxDataUpdateCoordinator,
+    mock_telnet_client: WattboxTelnetClient,
+) -> None:
+    """Test that optimistic states are rolled back when the batch fails."""
+    mock_telnet_client.async_set_outlet_states = AsyncMock(
+        side_effect=WattboxTelnetError("Device rejected command: !OutletSet=2,ON")
+    )
+    coordinator.data = _snapshot(_outlets(0, 0))
+
+    with pytest.raises(WattboxTelnetError):
+        await coordinator.async_set_outlet_states({1: "on", 2: "on"})
+
+    assert [outlet.state for outlet in coordinator.data.outlets] == [0, 0]
+
+
+def test_outlet_status_push_updates_data(
+    coordinator: WattboxDataUpdateCoordinator,
+    mock_telnet_client: WattboxTelnetClient,
+) -> None:
+    """Test that outlet pushes from the client are published as coordinator data."""
+    mock_telnet_client.add_outlet_status_listener.assert_called_once_with(
+        coordinator._publish_outlet_info
+    )
+    coordinator.data = _snapshot(_outlets(0), voltage=120.0)
+    previous = coordinator.data
+    pushed = _outlets(1)
+    updates = []
+    coordinator.async_add_listener(lambda: updates.append(coordinator.changed_keys))
+
+    with patch.object(coordinator, "_schedule_refresh") as schedule_refresh:
+        coordinator._publish_outlet_info(pushed)
+
+    # The push does not restart the refresh timer
+    schedule_refresh.assert_not_called()
+    assert len(updates) == 1
+    assert coordinator.data.outlets is pushed
+    assert coordinator.data.power is previous.power
+
+
+def test_outlet_status_push_before_first_refresh(
+    coordinator: WattboxDataUpdateCoordinator,
+) -> None:
+    """Test that pushes received before the first poll are ignored."""
+    coordinator.data = None
+
+    coordinator._publish_outlet_info(_outlets(1))
+
+    assert coordinator.data is None
 
 
 @pytest.mark.asyncio
@@ -206,25 +815,18 @@ async def test_async_update_data_already_connected(
     mock_telnet_client.is_connected = True
 
     # Mock successful data retrieval
-    mock_telnet_client.async_get_device_info.return_value = {
-        "hardware_version": "1.0.0",
-        "model": "WB-800VPS-IPVM-18",
-        "serial_number": "TEST123",
-        "hostname": "test-wattbox",
-    }
+    mock_telnet_client.async_get_device_info.return_value = _device(
+        hardware_version="1.0.0",
+        model="WB-800VPS-IPVM-18",
+        serial_number="TEST123",
+        hostname="test-wattbox",
+    )
 
-    mock_telnet_client.async_get_outlet_status.return_value = []
-    mock_telnet_client.async_get_status_info.return_value = {
-        "power_status": {
-            "voltage": None,
-            "current": None,
-            "power": None,
-        }
-    }
+    mock_telnet_client.async_poll.return_value = _poll()
 
     data = await coordinator._async_update_data()
 
-    assert data["connected"] is True
+    assert data.connected is True
     # Should not call async_connect since already connected
     mock_telnet_client.async_connect.assert_not_called()
 
@@ -236,23 +838,15 @@ async def test_async_update_data_outlet_info_error(
 ) -> None:
     """Test data update with outlet info error."""
     # Mock successful connection and device info
-    mock_telnet_client.async_get_device_info.return_value = {
-        "hardware_version": "1.0.0",
-        "model": "WB-800VPS-IPVM-18",
-        "serial_number": "TEST123",
-        "hostname": "test-wattbox",
-    }
+    mock_telnet_client.async_get_device_info.return_value = _device(
+        hardware_version="1.0.0",
+        model="WB-800VPS-IPVM-18",
+        serial_number="TEST123",
+        hostname="test-wattbox",
+    )
 
     # Mock outlet status error
-    mock_telnet_client.async_get_outlet_status.side_effect = Exception("Outlet error")
-
-    mock_telnet_client.async_get_status_info.return_value = {
-        "power_status": {
-            "voltage": None,
-            "current": None,
-            "power": None,
-        }
-    }
+    mock_telnet_client.async_poll.side_effect = Exception("Outlet error")
 
     with pytest.raises(UpdateFailed, match="Unexpected error: Outlet error"):
         await coordinator._async_update_data()
@@ -265,17 +859,306 @@ async def test_async_update_data_power_metrics_error(
 ) -> None:
     """Test data update with power metrics error."""
     # Mock successful connection, device info, and outlet status
-    mock_telnet_client.async_get_device_info.return_value = {
-        "hardware_version": "1.0.0",
-        "model": "WB-800VPS-IPVM-18",
-        "serial_number": "TEST123",
-        "hostname": "test-wattbox",
-    }
-
-    mock_telnet_client.async_get_outlet_status.return_value = []
+    mock_telnet_client.async_get_device_info.return_value = _device(
+        hardware_version="1.0.0",
+        model="WB-800VPS-IPVM-18",
+        serial_number="TEST123",
+        hostname="test-wattbox",
+    )
 
     # Mock status info error
-    mock_telnet_client.async_get_status_info.side_effect = Exception("Power error")
+    mock_telnet_client.async_poll.side_effect = Exception("Power error")
 
     with pytest.raises(UpdateFailed, match="Unexpected error: Power error"):
         await coordinator._async_update_data()
+
+
+@pytest.mark.asyncio
+async def test_timed_out_poll_fails_refresh(
+    hass: HomeAssistant, mock_config_entry: ConfigEntry
+) -> None:
+    """Test a poll whose batch times out fails instead of reusing old readings."""
+    async with WattboxEmulator(outlet_count=2) as device:
+        client = WattboxTelnetClient(
+            device.host, device.username, device.password, port=device.port, timeout=0.2
+        )
+        with patch("homeassistant.helpers.frame.report_usage"):
+            coordinator = WattboxDataUpdateCoordinator(hass, mock_config_entry, client)
+        try:
+            coordinator.data = await coordinator._async_update_data()
+            assert coordinator.telemetry.recorded == 1
+
+            device.latency = 1.0
+            coordinator._last_fetch.pop(TIER_STATUS)
+            with pytest.raises(UpdateFailed, match="Timeout waiting"):
+                await coordinator._async_update_data()
+        finally:
+            await client.async_disconnect()
+
+    # Nothing downstream ran on the stale readings
+    assert coordinator.telemetry.recorded == 1
+    assert TIER_STATUS not in coordinator._last_fetch
+    assert client.is_connected is False
+
+
+@pytest.mark.asyncio
+async def test_profile_saved_and_loaded(
+    hass: HomeAssistant,
+    coordinator: WattboxDataUpdateCoordinator,
+    mock_config_entry: ConfigEntry,
+    mock_telnet_client: WattboxTelnetClient,
+) -> None:
+    """Test that the device profile is stored and seeds a new coordinator."""
+    mock_telnet_client.async_get_device_info.return_value = _device(
+        hardware_version="2.8.0.0",
+        model="WB-800-IPVM-12",
+        serial_number="ST123",
+        hostname="rack-1",
+        outlet_count=2,
+    )
+    mock_telnet_client.async_poll.return_value = _poll(
+        _outlets(1, 0, names=("Amp", "TV"))
+    )
+
+    await coordinator._async_update_data()
+
+    mock_telnet_client.async_poll.assert_called_once_with(
+        2,
+        include_states=True,
+        include_names=True,
+        include_power=True,
+        include_ups=True,
+        power_outlets=[1, 2],
+    )
+    stored = coordinator._profile_store.data
+    assert stored["device_info"]["serial_number"] == "ST123"
+    assert stored["outlet_names"] == ["Amp", "TV"]
+
+    with patch("homeassistant.helpers.frame.report_usage"):
+        restarted = WattboxDataUpdateCoordinator(
+            hass, mock_config_entry, mock_telnet_client
+        )
+    restarted._profile_store.data = stored
+
+    assert await restarted.async_load_profile() is True
+    assert restarted.data.device.hostname == "rack-1"
+    assert [(o.state, o.name) for o in restarted.data.outlets] == [
+        (None, "Amp"),
+        (None, "TV"),
+    ]
+    assert restarted.data.connected is False
+
+
+@pytest.mark.asyncio
+async def test_profile_not_resaved_when_unchanged(
+    coordinator: WattboxDataUpdateCoordinator,
+    mock_telnet_client: WattboxTelnetClient,
+) -> None:
+    """Test that an unchanged profile is not written again."""
+    mock_telnet_client.async_get_device_info.return_value = _device(model="WB-800")
+    mock_telnet_client.async_poll.return_value = _poll()
+    coordinator._profile_store.async_save = AsyncMock()
+
+    await coordinator._async_update_data()
+    await coordinator._async_update_data()
+
+    coordinator._profile_store.async_save.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_load_profile_missing(coordinator: WattboxDataUpdateCoordinator) -> None:
+    """Test that no profile means a regular first refresh is needed."""
+    assert await coordinator.async_load_profile() is False
+
+
+@pytest.mark.asyncio
+async def test_energy_integrated_and_restored(
+    hass: HomeAssistant,
+    coordinator: WattboxDataUpdateCoordinator,
+    mock_config_entry: ConfigEntry,
+    mock_telnet_client: WattboxTelnetClient,
+) -> None:
+    """Test power polls accumulate energy that survives a restart."""
+    mock_telnet_client.async_get_device_info.return_value = _device(outlet_count=1)
+    mock_telnet_client.async_poll.return_value = _poll(
+        (OutletState(1, "Amp", 1, 360.0, 3.0, 120.0),), power=720.0
+    )
+
+    for now in (1000.0, 1030.0):
+        with patch(
+            "custom_components.wattbox.coordinator.time.monotonic", return_value=now
+        ):
+            coordinator.data = await coordinator._async_update_data()
+        mock_telnet_client.is_connected = True
+
+    assert coordinator.data.energy.total == pytest.approx(0.006)
+    assert coordinator.data.energy.outlet(1) == pytest.approx(0.003)
+
+    # A reconnect does not integrate across the outage
+    mock_telnet_client.is_connected = False
+    with patch(
+        "custom_components.wattbox.coordinator.time.monotonic", return_value=1060.0
+    ):
+        coordinator.data = await coordinator._async_update_data()
+    assert coordinator.data.energy.total == pytest.approx(0.006)
+
+    # The same polls fill the telemetry buffer
+    assert len(coordinator.telemetry) == 3
+    assert coordinator.telemetry.stats("power", 300).mean == 720.0
+
+    await coordinator.async_disconnect()
+    stored = coordinator._energy_store.data
+    assert stored["total"] == pytest.approx(0.006)
+
+    with patch("homeassistant.helpers.frame.report_usage"):
+        restarted = WattboxDataUpdateCoordinator(
+            hass, mock_config_entry, mock_telnet_client
+        )
+    restarted._energy_store.data = stored
+    restarted._profile_store.data = coordinator._profile_store.data
+    await restarted.async_load_energy()
+    assert await restarted.async_load_profile() is True
+    assert restarted.data.energy.total == pytest.approx(0.006)
+    assert restarted.data.energy.outlet(1) == pytest.approx(0.003)
+
+
+@pytest.mark.asyncio
+async def test_energy_gap_follows_polling_interval(
+    hass: HomeAssistant,
+    mock_config_entry: ConfigEntry,
+    mock_telnet_client: WattboxTelnetClient,
+) -> None:
+    """Test slow adaptive polls still integrate and failed polls do not."""
+    mock_config_entry.data = {
+        **mock_config_entry.data,
+        "adaptive_polling": True,
+        "max_polling_interval": 1800,
+    }
+    with patch("homeassistant.helpers.frame.report_usage"):
+        coordinator = WattboxDataUpdateCoordinator(
+            hass, mock_config_entry, mock_telnet_client
+        )
+    mock_telnet_client.async_get_device_info.return_value = _device(outlet_count=1)
+    mock_telnet_client.async_poll.return_value = _poll(_outlets(1), power=720.0)
+
+    async def poll(now: float) -> None:
+        coordinator._last_fetch.pop(TIER_STATUS, None)
+        with patch(
+            "custom_components.wattbox.coordinator.time.monotonic", return_value=now
+        ):
+            coordinator.data = await coordinator._async_update_data()
+        mock_telnet_client.is_connected = True
+
+    await poll(1000.0)
+    # A backed-off interval longer than ENERGY_MAX_GAP is still integrated
+    await poll(2500.0)
+    assert coordinator.data.energy.total == pytest.approx(0.3)
+
+    # A failed poll is not bridged by the next successful one
+    mock_telnet_client.async_poll.side_effect = WattboxConnectionError("Timeout")
+    with pytest.raises(UpdateFailed):
+        await poll(2530.0)
+    mock_telnet_client.async_poll.side_effect = None
+    await poll(2560.0)
+    assert coordinator.data.energy.total == pytest.approx(0.3)
+
+
+@pytest.mark.asyncio
+async def test_capabilities_probed_once_per_firmware(
+    hass: HomeAssistant,
+    coordinator: WattboxDataUpdateCoordinator,
+    mock_config_entry: ConfigEntry,
+    mock_telnet_client: WattboxTelnetClient,
+) -> None:
+    """Test probe results are stored and reused until the firmware changes."""
+    mock_telnet_client.async_get_device_info.return_value = _device(
+        hardware_version="2.2.0.0", serial_number="ST150"
+    )
+    mock_telnet_client.async_poll.return_value = _poll(_outlets(1, 0))
+    mock_telnet_client.async_probe_capabilities.return_value = frozenset(
+        {"?PowerStatus", "?OutletPowerStatus"}
+    )
+
+    await coordinator._async_update_data()
+
+    stored = coordinator._profile_store.data
+    assert stored["capabilities"] == {
+        "serial_number": "ST150",
+        "hardware_version": "2.2.0.0",
+        "unsupported": ["?OutletPowerStatus", "?PowerStatus"],
+    }
+
+    with patch("homeassistant.helpers.frame.report_usage"):
+        restarted = WattboxDataUpdateCoordinator(
+            hass, mock_config_entry, mock_telnet_client
+        )
+    restarted._profile_store.data = stored
+    await restarted.async_load_profile()
+    mock_telnet_client.async_probe_capabilities.reset_mock()
+
+    await restarted._async_update_data()
+
+    mock_telnet_client.async_probe_capabilities.assert_not_called()
+    mock_telnet_client.set_unsupported_commands.assert_called_once_with(
+        ["?OutletPowerStatus", "?PowerStatus"]
+    )
+
+    # A firmware update may add commands, so the device is probed again
+    mock_telnet_client.async_get_device_info.return_value = _device(
+        hardware_version="2.8.0.0", serial_number="ST150"
+    )
+    restarted._device_info = None
+    await restarted._async_update_data()
+
+    mock_telnet_client.async_probe_capabilities.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_stored_ups_capabilities_probed_again(
+    coordinator: WattboxDataUpdateCoordinator,
+    mock_telnet_client: WattboxTelnetClient,
+) -> None:
+    """Test a stored result marking UPS queries unsupported is not reused."""
+    device = _device(hardware_version="2.8.0.0", serial_number="ST150")
+    mock_telnet_client.async_get_device_info.return_value = device
+    mock_telnet_client.async_poll.return_value = _poll()
+    coordinator._capabilities = {
+        "serial_number": "ST150",
+        "hardware_version": "2.8.0.0",
+        "unsupported": ["?UPSConnection", "?UPSStatus"],
+    }
+
+    await coordinator._async_update_data()
+
+    # A UPS may have been attached since, so only firmware-level queries count
+    mock_telnet_client.async_probe_capabilities.assert_called_once_with()
+    mock_telnet_client.set_unsupported_commands.assert_not_called()
+    assert coordinator._capabilities["unsupported"] == []
+    assert coordinator.is_supported("?UPSStatus")
+
+
+@pytest.mark.asyncio
+async def test_concurrent_refreshes_share_one_update(
+    coordinator: WattboxDataUpdateCoordinator,
+    mock_telnet_client: WattboxTelnetClient,
+) -> None:
+    """Test overlapping refreshes fetch from the device once."""
+    release = asyncio.Event()
+
+    async def poll(*args, **kwargs):
+        await release.wait()
+        return _poll(_outlets(1))
+
+    mock_telnet_client.async_get_device_info.return_value = _device(outlet_count=1)
+    mock_telnet_client.async_poll.side_effect = poll
+
+    updates = [
+        asyncio.ensure_future(coordinator._async_update_data()) for _ in range(3)
+    ]
+    await asyncio.sleep(0)
+    release.set()
+    first, second, third = await asyncio.gather(*updates)
+
+    assert first is second is third
+    mock_telnet_client.async_poll.assert_called_once()
+    mock_telnet_client.async_get_device_info.assert_called_once()
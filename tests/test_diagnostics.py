@@ -0,0 +1,89 @@
+"""Test Wattbox diagnostics."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+from homeassistant.core import HomeAssistant
+
+from custom_components.wattbox.const import DATA_SCHEDULER, DOMAIN
+from custom_components.wattbox.coordinator import WattboxDataUpdateCoordinator
+from custom_components.wattbox.diagnostics import async_get_config_entry_diagnostics
+from custom_components.wattbox.load_shedding import LoadShedder
+from custom_components.wattbox.models import PowerStatus, WattboxSnapshot, evolve
+from custom_components.wattbox.scheduler import WattboxPollScheduler
+from custom_components.wattbox.telemetry import TelemetryBuffer
+
+
+@pytest.mark.asyncio
+async def test_config_entry_diagnostics(hass: HomeAssistant) -> None:
+    """Test diagnostics redact credentials and include downsampled telemetry."""
+    entry = MagicMock()
+    entry.entry_id = "entry"
+    entry.data = {"host": "192.168.1.100", "username": "admin", "password": "pw"}
+    coordinator = MagicMock(spec=WattboxDataUpdateCoordinator)
+    coordinator.data = WattboxSnapshot.empty()
+    coordinator.telnet_client = MagicMock(
+        unsupported_commands=frozenset({"?PowerStatus"})
+    )
+    coordinator.load_shedder = LoadShedder({8: 2, 7: 1}, on_battery=True)
+    coordinator.telemetry = TelemetryBuffer(capacity=4)
+    for now, voltage in ((100.0, 120.0), (130.0, 121.0), (160.0, 122.0)):
+        coordinator.telemetry.record(
+            now, evolve(PowerStatus.unknown(), voltage=voltage)
+        )
+    scheduler = WattboxPollScheduler()
+    scheduler.register("entry")
+    hass.data[DOMAIN] = {DATA_SCHEDULER: scheduler, "entry": coordinator}
+
+    diagnostics = await async_get_config_entry_diagnostics(hass, entry)
+
+    assert diagnostics["entry"] == {
+        "host": "192.168.1.100",
+        "username": "**REDACTED**",
+        "password": "**REDACTED**",
+    }
+    assert diagnostics["data"]["connected"] is False
+    assert diagnostics["unsupported_commands"] == ["?PowerStatus"]
+    assert diagnostics["load_shedding"] == {
+        "enabled": True,
+        "plan": [7, 8],
+        "active": False,
+        "shed": [],
+    }
+    assert diagnostics["scheduler"] == {
+        "entries": 1,
+        "in_flight": 0,
+        "max_concurrent": 4,
+        "skew": {},
+        "max_skew": 0.0,
+    }
+    telemetry = diagnostics["telemetry"]
+    assert telemetry["samples"] == 3
+    assert telemetry["capacity"] == 4
+    assert telemetry["history"]["60s"]["voltage"] == [
+        {
+            "start": 60.0,
+            "end": 60.0,
+            "count": 1,
+            "minimum": 120.0,
+            "mean": 120.0,
+            "maximum": 120.0,
+        },
+        {
+            "start": 30.0,
+            "end": 0.0,
+            "count": 2,
+            "minimum": 121.0,
+            "mean": 121.5,
+            "maximum": 122.0,
+        },
+    ]
+    assert telemetry["history"]["300s"]["power"] == []
+
+    coordinator.data = None
+    del hass.data[DOMAIN][DATA_SCHEDULER]
+    diagnostics = await async_get_config_entry_diagnostics(hass, entry)
+    assert diagnostics["data"] is None
+    assert diagnostics["scheduler"] is None
@@ -0,0 +1,221 @@
+"""Test the Wattbox device emulator against the real telnet client."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from custom_components.wattbox.telnet_client import (
+    WattboxConnectionError,
+    WattboxTelnetClient,
+    WattboxTelnetError,
+)
+
+from .emulator import WattboxEmulator
+
+pytestmark = pytest.mark.telnet
+
+
+@pytest.mark.asyncio
+async def test_emulator_serves_device_info_and_status() -> None:
+    """Test the client logs in and reads every tier from the emulator."""
+    async with WattboxEmulator(outlet_count=12) as device:
+        client = WattboxTelnetClient(
+            device.host, "wattbox", "wattbox", port=device.port
+        )
+        await client.async_connect()
+        try:
+            info = await client.async_get_device_info()
+            outlets = await client.async_get_outlet_status(12)
+            power, ups = await client.async_get_status_info()
+        finally:
+            await client.async_disconnect()
+
+    assert info.hardware_version == "2.8.0.0"
+    assert info.outlet_count == 12
+    assert len(outlets) == 12
+    assert (outlets[0].state, outlets[0].name) == (1, "Outlet1")
+    assert power.voltage == 120.0
+    assert ups.connected is True
+    assert device.stats.connections == 1
+
+
+@pytest.mark.asyncio
+async def test_emulator_rejects_bad_login() -> None:
+    """Test a wrong password is re-prompted and never logs in."""
+    async with WattboxEmulator() as device:
+        client = WattboxTelnetClient(
+            device.host, "wattbox", "wrong", port=device.port, timeout=1
+        )
+        with pytest.raises(WattboxConnectionError):
+            await client.async_connect()
+        await client.async_disconnect()
+
+
+@pytest.mark.asyncio
+async def test_emulator_outlet_set_pushes_status() -> None:
+    """Test !OutletSet replies OK and only changed pushes reach listeners."""
+    async with WattboxEmulator(outlet_count=4, split_size=5) as device:
+        client = WattboxTelnetClient(
+            device.host, "wattbox", "wattbox", port=device.port
+        )
+        pushed = asyncio.Event()
+        updates = []
+
+        def listener(outlets):
+            updates.append([outlet.state for outlet in outlets])
+            pushed.set()
+
+        client.add_outlet_status_listener(listener)
+        await client.async_connect()
+        try:
+            await client.async_get_outlet_status(4)
+            outlets = await client.async_set_outlet_state(2, False)
+            # The push after the set repeats the confirmed states
+            await asyncio.sleep(0.05)
+            assert updates == []
+
+            # A change made elsewhere reaches listeners
+            device.outlet_states[3] = 0
+            await device.push_outlet_status()
+            await asyncio.wait_for(pushed.wait(), 1)
+        finally:
+            await client.async_disconnect()
+
+    assert outlets[1].state == 0
+    assert updates == [[1, 0, 1, 0]]
+
+
+@pytest.mark.asyncio
+async def test_emulator_long_outlet_names() -> None:
+    """Test 18 outlets with 31-character names survive split segments."""
+    names = [f"Rack {n:02d} ".ljust(31, "-") for n in range(1, 19)]
+    async with WattboxEmulator(
+        outlet_count=18, outlet_names=names, split_size=100
+    ) as device:
+        client = WattboxTelnetClient(
+            device.host, "wattbox", "wattbox", port=device.port
+        )
+        await client.async_connect()
+        try:
+            outlets = await client.async_get_outlet_status(18)
+            # The client stays in step with the stream after the long reply
+            power, _ups = await client.async_get_status_info()
+        finally:
+            await client.async_disconnect()
+
+    assert [outlet.name for outlet in outlets] == names
+    assert power.voltage == 120.0
+
+
+@pytest.mark.asyncio
+async def test_emulator_protocol_replies() -> None:
+    """Test outlet 0, per-outlet power and unsupported commands."""
+    device = WattboxEmulator(outlet_count=2, unsupported={"?UPSStatus"})
+    device.outlet_states = [0, 0]
+
+    assert device._respond("!OutletSet=0,OFF") == "#Error"
+    assert device._respond("!OutletSet=0,RESET") == "OK"
+    assert device.outlet_states == [1, 1]
+    assert device._respond("!OutletSet=1,TOGGLE") == "OK"
+    assert device._respond("!OutletSet=3,ON") == "#Error"
+    assert device._respond("?OutletPowerStatus=2") == (
+        "?OutletPowerStatus=2,20.00,0.17,120.00"
+    )
+    assert device._respond("?UPSStatus") == "#Error"
+    assert device._respond("?Bogus") == "#Error"
+
+
+@pytest.mark.asyncio
+async def test_emulator_unsupported_command_raises() -> None:
+    """Test an unsupported command surfaces as a rejected control command."""
+    async with WattboxEmulator(unsupported={"!OutletSet"}) as device:
+        client = WattboxTelnetClient(
+            device.host, "wattbox", "wattbox", port=device.port
+        )
+        await client.async_connect()
+        try:
+            with pytest.raises(WattboxTelnetError):
+                await client.async_set_outlet_state(1, False)
+        finally:
+            await client.async_disconnect()
+
+
+@pytest.mark.asyncio
+async def test_emulator_probe_skips_unsupported_commands() -> None:
+    """Test a WB150-like device's rejected queries are not sent again."""
+    async with WattboxEmulator(
+        outlet_count=2, unsupported={"?PowerStatus", "?OutletPowerStatus"}
+    ) as device:
+        client = WattboxTelnetClient(
+            device.host, "wattbox", "wattbox", port=device.port
+        )
+        await client.async_connect()
+        try:
+            unsupported = await client.async_probe_capabilities()
+            device.stats.reset()
+            power, ups = await client.async_get_status_info()
+            await client.async_get_outlet_status(2, power_outlets=[1, 2])
+        finally:
+            await client.async_disconnect()
+
+    assert unsupported == {"?PowerStatus", "?OutletPowerStatus"}
+    assert power.voltage is None
+    assert ups.connected is True
+    # ?UPSConnection, ?UPSStatus, ?OutletStatus and ?OutletName only
+    assert device.stats.commands == 4
+
+
+@pytest.mark.asyncio
+async def test_emulator_concurrent_fetches_share_one_batch() -> None:
+    """Test simultaneous identical fetches send their queries only once."""
+    async with WattboxEmulator(outlet_count=2, latency=0.01) as device:
+        client = WattboxTelnetClient(
+            device.host, "wattbox", "wattbox", port=device.port
+        )
+        await client.async_connect()
+        try:
+            device.stats.reset()
+            results = await asyncio.gather(
+                *(client.async_get_status_info() for _ in range(3)),
+                *(client.async_get_outlet_status(2) for _ in range(3)),
+            )
+        finally:
+            await client.async_disconnect()
+
+    assert results[0] == results[1] == results[2]
+    assert results[3] is results[5]
+    # ?PowerStatus, ?UPSConnection, ?UPSStatus, ?OutletStatus and ?OutletName
+    assert device.stats.commands == 5
+
+
+@pytest.mark.asyncio
+async def test_emulator_set_outlets_in_one_write() -> None:
+    """Test many outlet actions go out as one batch and reset-all uses outlet 0."""
+    async with WattboxEmulator(outlet_count=4) as device:
+        client = WattboxTelnetClient(
+            device.host, "wattbox", "wattbox", port=device.port
+        )
+        await client.async_connect()
+        try:
+            await client.async_get_outlet_status(4)
+            device.stats.reset()
+            outlets = await client.async_set_outlet_states(
+                {1: "off", 2: "off", 3: "toggle", 4: "on"}
+            )
+            first = (device.stats.reads, device.stats.commands)
+            device.stats.reset()
+            await client.async_set_outlet_states({n: "reset" for n in range(1, 5)})
+            second = (device.stats.reads, device.stats.commands)
+            with pytest.raises(ValueError):
+                await client.async_set_outlet_states({0: "off"})
+        finally:
+            await client.async_disconnect()
+
+    assert [outlet.state for outlet in outlets] == [0, 0, 0, 1]
+    # Four !OutletSet commands and one ?OutletStatus, in one round trip
+    assert first == (1, 5)
+    # !OutletSet=0,RESET and ?OutletStatus
+    assert second == (1, 2)
+    assert device.outlet_states == [1, 1, 1, 1]
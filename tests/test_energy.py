@@ -0,0 +1,73 @@
+"""Test energy integration from power readings."""
+
+from __future__ import annotations
+
+import pytest
+
+from custom_components.wattbox.energy import EnergyIntegrator, WattboxEnergyMeter
+from custom_components.wattbox.models import EnergyTotals
+
+
+def test_integrator_trapezoid() -> None:
+    """Test energy is the area under the power readings."""
+    integrator = EnergyIntegrator(max_gap=3600.0)
+    integrator.add(1000.0, 0.0)
+    assert integrator.energy == 0.0
+
+    # One hour ramping from 1 kW to 3 kW is 2 kWh
+    integrator.add(3000.0, 3600.0)
+    assert integrator.energy == pytest.approx(2.0)
+
+
+def test_integrator_gaps_and_interruptions() -> None:
+    """Test gaps, missing readings and interruptions add no energy."""
+    integrator = EnergyIntegrator(1.0, max_gap=60.0)
+    integrator.add(3600.0, 0.0)
+    integrator.add(3600.0, 30.0)
+    assert integrator.energy == pytest.approx(1.03)
+
+    # Too long since the last sample
+    integrator.add(3600.0, 120.0)
+    assert integrator.energy == pytest.approx(1.03)
+
+    # A missing reading breaks the run
+    integrator.add(None, 130.0)
+    integrator.add(3600.0, 140.0)
+    assert integrator.energy == pytest.approx(1.03)
+
+    integrator.interrupt()
+    integrator.add(3600.0, 150.0)
+    assert integrator.energy == pytest.approx(1.03)
+
+    # Time going backwards and negative readings never decrease the total
+    integrator.add(3600.0, 140.0)
+    integrator.add(-500.0, 150.0)
+    assert integrator.energy == pytest.approx(1.035)
+
+
+def test_meter_totals_and_restore() -> None:
+    """Test the meter tracks the device and outlets and survives a restart."""
+    meter = WattboxEnergyMeter()
+    assert meter.totals(2) == EnergyTotals(None, (None, None))
+
+    meter.sample(None, [(1, None), (2, 360.0)], 0.0)
+    meter.sample(720.0, [(1, None), (2, 360.0)], 10.0)
+    meter.sample(720.0, [(2, 360.0)], 20.0)
+
+    totals = meter.totals(2)
+    assert totals.total == pytest.approx(0.002)
+    assert totals.outlets[0] is None
+    assert totals.outlet(2) == pytest.approx(0.002)
+
+    stored = meter.as_dict()
+    assert stored == {"total": totals.total, "outlets": {"2": totals.outlets[1]}}
+
+    restarted = WattboxEnergyMeter()
+    restarted.restore(stored)
+    # Integration restarts with the next sample instead of spanning the restart
+    restarted.sample(720.0, [(2, 360.0)], 5000.0)
+    assert restarted.totals(2) == totals
+
+    restarted.interrupt()
+    restarted.restore({})
+    assert restarted.totals(1) == EnergyTotals(None, (None,))
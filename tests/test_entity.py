@@ -13,20 +13,22 @@ from custom_components.wattbox.entity import (
     WattboxEntity,
     WattboxOutletEntity,
 )
+from custom_components.wattbox.models import DeviceIdentity, WattboxSnapshot, evolve
+
+TEST_DEVICE = evolve(
+    DeviceIdentity.unknown(),
+    serial_number="test_device",
+    hostname="Test Wattbox",
+    model="WB-800VPS-IPVM-18",
+    hardware_version="1.0.0",
+)
 
 
 @pytest.fixture
 def mock_coordinator() -> DataUpdateCoordinator:
     """Mock coordinator for testing."""
     coordinator = MagicMock(spec=DataUpdateCoordinator)
-    coordinator.data = {
-        "device_info": {
-            "serial_number": "test_device",
-            "hostname": "Test Wattbox",
-            "model": "WB-800VPS-IPVM-18",
-            "hardware_version": "1.0.0",
-        }
-    }
+    coordinator.data = evolve(WattboxSnapshot.empty(), device=TEST_DEVICE)
     return coordinator
 
 
@@ -191,12 +193,32 @@ def test_wattbox_entity_coordinator_data(
     )
 
     # Should be able to access coordinator data
-    expected_data = {
-        "device_info": {
-            "serial_number": "test_device",
-            "hostname": "Test Wattbox",
-            "model": "WB-800VPS-IPVM-18",
-            "hardware_version": "1.0.0",
-        }
-    }
-    assert entity.coordinator.data == expected_data
+    assert entity.coordinator.data.device == TEST_DEVICE
+
+
+def test_wattbox_entity_writes_state_only_for_changed_keys(
+    mock_coordinator: DataUpdateCoordinator,
+) -> None:
+    """Test entities skip coordinator updates that do not touch their keys."""
+    entity = WattboxOutletEntity(mock_coordinator, {}, "test_outlet_7", 7)
+    entity._coordinator_keys = ("outlets.7.state",)
+    entity.async_write_ha_state = MagicMock()
+
+    mock_coordinator.changed_keys = frozenset({"outlets", "outlets.3"})
+    entity._handle_coordinator_update()
+    entity.async_write_ha_state.assert_not_called()
+
+    mock_coordinator.changed_keys = frozenset({"outlets.7.state"})
+    entity._handle_coordinator_update()
+    entity.async_write_ha_state.assert_called_once()
+
+    # Unknown changes update everything
+    mock_coordinator.changed_keys = None
+    entity._handle_coordinator_update()
+    assert entity.async_write_ha_state.call_count == 2
+
+    # Entities without keys always update
+    entity._coordinator_keys = None
+    mock_coordinator.changed_keys = frozenset()
+    entity._handle_coordinator_update()
+    assert entity.async_write_ha_state.call_count == 3
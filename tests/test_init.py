@@ -8,8 +8,12 @@ import pytest
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 
-from custom_components.wattbox import async_setup_entry, async_unload_entry
-from custom_components.wattbox.const import DOMAIN
+from custom_components.wattbox import (
+    async_remove_entry,
+    async_setup_entry,
+    async_unload_entry,
+)
+from custom_components.wattbox.const import DATA_SCHEDULER, DOMAIN
 
 
 @pytest.fixture
@@ -47,6 +51,7 @@ async def test_async_setup_entry(
 
     assert result is True
     assert DOMAIN in hass.data
+    assert hass.data[DOMAIN][DATA_SCHEDULER].report()["entries"] == 1
 
 
 @pytest.mark.asyncio
@@ -68,6 +73,8 @@ async def test_async_unload_entry(
     result = await async_unload_entry(hass, mock_config_entry)
 
     assert result is True
+    assert mock_config_entry.entry_id not in hass.data[DOMAIN]
+    assert hass.data[DOMAIN][DATA_SCHEDULER].report()["entries"] == 0
 
 
 @pytest.mark.asyncio
@@ -127,3 +134,45 @@ async def test_async_unload_entry_platforms_disabled(
     result = await async_unload_entry(hass, mock_config_entry)
 
     assert result is True
+
+
+@pytest.mark.asyncio
+async def test_async_setup_entry_with_stored_profile(
+    hass: HomeAssistant, mock_config_entry: ConfigEntry
+) -> None:
+    """Test that a stored profile skips the blocking first refresh."""
+    with (
+        patch(
+            "custom_components.wattbox.coordinator.WattboxDataUpdateCoordinator.async_load_profile",
+            new_callable=AsyncMock,
+            return_value=True,
+        ),
+        patch(
+            "custom_components.wattbox.coordinator.WattboxDataUpdateCoordinator.async_config_entry_first_refresh",
+            new_callable=AsyncMock,
+        ) as mock_first_refresh,
+        patch(
+            "custom_components.wattbox.coordinator.WattboxDataUpdateCoordinator.async_refresh",
+            new_callable=MagicMock,
+        ),
+        patch("homeassistant.helpers.frame.report_usage"),
+    ):
+        result = await async_setup_entry(hass, mock_config_entry)
+
+    assert result is True
+    mock_first_refresh.assert_not_called()
+    mock_config_entry.async_create_background_task.assert_called_once()
+    hass.config_entries.async_forward_entry_setups.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_async_remove_entry(
+    hass: HomeAssistant, mock_config_entry: ConfigEntry
+) -> None:
+    """Test that removing an entry removes its stored profile and energy."""
+    with patch(
+        "custom_components.wattbox.Store.async_remove", new_callable=AsyncMock
+    ) as mock_remove:
+        await async_remove_entry(hass, mock_config_entry)
+
+    assert mock_remove.call_count == 2
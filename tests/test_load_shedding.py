@@ -0,0 +1,80 @@
+"""Test priority-based load shedding."""
+
+from __future__ import annotations
+
+import pytest
+
+from custom_components.wattbox.load_shedding import LoadShedder, parse_priorities
+from custom_components.wattbox.models import PowerStatus, UPSStatus, evolve
+
+MAINS = evolve(UPSStatus.unknown(), power_lost=False, battery_runtime=40)
+NORMAL = evolve(PowerStatus.unknown(), current=4.0)
+
+
+def _battery(runtime: int | None = 40) -> UPSStatus:
+    return evolve(UPSStatus.unknown(), power_lost=True, battery_runtime=runtime)
+
+
+def test_parse_priorities() -> None:
+    """Test the outlet priority map syntax."""
+    assert parse_priorities("") == {}
+    assert parse_priorities("7:1, 8:1; 3:2, 5") == {7: 1, 8: 1, 3: 2, 5: 1}
+    for text in ("a:1", "3:x", "0:1", "3:0", "3:-1"):
+        with pytest.raises(ValueError, match="Invalid outlet priority"):
+            parse_priorities(text)
+    assert parse_priorities("12:1", outlet_count=12) == {12: 1}
+    with pytest.raises(ValueError, match="Outlet 13 does not exist"):
+        parse_priorities("13:1", outlet_count=12)
+
+
+def test_plan_and_rules() -> None:
+    """Test the plan is ordered by priority and each rule triggers it."""
+    shedder = LoadShedder.from_config(
+        {
+            "shed_priorities": "3:2, 8:1, 7:1",
+            "shed_min_runtime": 10,
+            "shed_max_current": 12.0,
+        }
+    )
+    assert shedder.enabled is True
+    assert list(shedder.plan.items()) == [(7, "off"), (8, "off"), (3, "off")]
+
+    assert shedder.trigger(NORMAL, MAINS) is None
+    # On battery alone is not a rule here, but low runtime is
+    assert shedder.trigger(NORMAL, _battery()) is None
+    assert shedder.trigger(NORMAL, _battery(None)) is None
+    assert shedder.trigger(NORMAL, _battery(9)) == "low_runtime"
+    # Low runtime reported on mains does not count
+    assert shedder.trigger(NORMAL, evolve(MAINS, battery_runtime=5)) is None
+    assert shedder.trigger(evolve(NORMAL, current=12.5), MAINS) == "overcurrent"
+    assert shedder.trigger(PowerStatus.unknown(), UPSStatus.unknown()) is None
+
+    shedder.limit_to(7)
+    assert list(shedder.plan) == [7, 3]
+
+    on_battery = LoadShedder({1: 1}, on_battery=True)
+    assert on_battery.trigger(NORMAL, _battery()) == "on_battery"
+
+
+def test_sheds_once_per_episode() -> None:
+    """Test load is shed once until the trigger clears."""
+    shedder = LoadShedder({4: 1}, on_battery=True)
+    assert shedder.check(NORMAL, MAINS) is None
+    assert shedder.check(NORMAL, _battery()) == "on_battery"
+    # Not yet confirmed as shed, so the next poll tries again
+    assert shedder.check(NORMAL, _battery()) == "on_battery"
+    shedder.active = True
+    assert shedder.check(NORMAL, _battery()) is None
+
+    assert shedder.check(NORMAL, MAINS) is None
+    assert shedder.active is False
+    assert shedder.check(NORMAL, _battery()) == "on_battery"
+
+
+def test_disabled() -> None:
+    """Test nothing is shed without outlets or rules."""
+    assert LoadShedder.from_config({}).enabled is False
+    assert LoadShedder({}, on_battery=True).check(NORMAL, _battery()) is None
+    no_rules = LoadShedder({1: 1})
+    assert no_rules.enabled is False
+    assert no_rules.check(evolve(NORMAL, current=99.0), _battery(1)) is None
@@ -0,0 +1,77 @@
+"""Test the Wattbox snapshot model."""
+
+from __future__ import annotations
+
+import dataclasses
+
+import pytest
+
+from custom_components.wattbox.models import (
+    OutletState,
+    PowerStatus,
+    WattboxSnapshot,
+    evolve,
+    mask_outlets,
+    parse_state_mask,
+    replace_outlet,
+)
+
+
+def test_snapshot_empty() -> None:
+    """Test that an empty snapshot knows nothing yet."""
+    snapshot = WattboxSnapshot.empty()
+
+    assert snapshot.outlets == ()
+    assert snapshot.connected is False
+    assert snapshot.power.voltage is None
+    assert snapshot.outlet(1) is None
+
+
+def test_snapshot_is_immutable() -> None:
+    """Test that records cannot be changed in place."""
+    snapshot = WattboxSnapshot.empty()
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        snapshot.connected = True
+    with pytest.raises(AttributeError):
+        snapshot.extra = 1
+
+
+def test_evolve_returns_same_record_when_unchanged() -> None:
+    """Test that evolve only copies a record when a field changes."""
+    power = evolve(PowerStatus.unknown(), voltage=120.0)
+
+    assert evolve(power, voltage=120.0) is power
+    changed = evolve(power, voltage=121.0)
+    assert changed is not power
+    assert changed.voltage == 121.0
+    assert power.voltage == 120.0
+
+
+def test_replace_outlet_shares_other_outlets() -> None:
+    """Test that changing one outlet keeps every other outlet object."""
+    outlets = (OutletState.default(1), OutletState.default(2, "Amp"))
+
+    updated = replace_outlet(outlets, 2, state=1)
+
+    assert updated[0] is outlets[0]
+    assert updated[1] == OutletState(2, "Amp", 1, None, None, None)
+    assert replace_outlet(updated, 2, state=1) is updated
+    assert replace_outlet(updated, 3, state=1) is updated
+
+    snapshot = evolve(WattboxSnapshot.empty(), outlets=updated)
+    assert snapshot.outlet(2).name == "Amp"
+
+
+def test_outlet_state_mask() -> None:
+    """Test outlet states round-trip through a bitmask."""
+    mask = parse_state_mask(["1", "0", "1", "1"])
+
+    assert mask == 0b1101
+    assert list(mask_outlets(mask)) == [1, 3, 4]
+    assert list(mask_outlets(mask ^ parse_state_mask(["1", "1", "1", "1"]))) == [2]
+    assert parse_state_mask([]) == 0
+    assert parse_state_mask([" 1", "0 "]) == 0b01
+    for values in (["1", "on"], ["10", "1"], ["1", ""], ["1", "_", "1"]):
+        with pytest.raises(ValueError):
+            parse_state_mask(values)
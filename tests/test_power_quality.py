@@ -0,0 +1,40 @@
+"""Test voltage sag, swell and brownout detection."""
+
+from __future__ import annotations
+
+from custom_components.wattbox.models import PowerQuality
+from custom_components.wattbox.power_quality import PowerQualityMonitor
+
+
+def test_sag_becomes_brownout() -> None:
+    """Test a dip is a sag at first and a brownout once it lasts."""
+    monitor = PowerQualityMonitor(120.0, brownout_duration=60.0)
+    assert monitor.sample(None, 0.0) == PowerQuality.unknown()
+
+    steady = monitor.sample(120.0, 0.0)
+    assert steady == PowerQuality(False, False, False, 0, 0, 0)
+    # Unchanged readings keep the same record
+    assert monitor.sample(119.0, 5.0) is steady
+
+    assert monitor.sample(100.0, 10.0) == PowerQuality(True, False, False, 1, 0, 0)
+    assert monitor.sample(105.0, 40.0) == PowerQuality(True, False, False, 1, 0, 0)
+    # A missing reading does not end the event
+    assert monitor.sample(None, 50.0).sag is True
+    assert monitor.sample(104.0, 70.0) == PowerQuality(False, False, True, 1, 0, 1)
+    assert monitor.sample(104.0, 90.0) == PowerQuality(False, False, True, 1, 0, 1)
+    assert monitor.sample(118.0, 100.0) == PowerQuality(False, False, False, 1, 0, 1)
+
+    # A short dip is counted as a new sag only
+    monitor.sample(107.0, 110.0)
+    assert monitor.sample(121.0, 115.0) == PowerQuality(False, False, False, 2, 0, 1)
+    assert monitor.quality.out_of_band is False
+
+
+def test_swell() -> None:
+    """Test readings above the band are counted once per swell."""
+    monitor = PowerQualityMonitor(230.0)
+    assert monitor.sample(260.0, 0.0) == PowerQuality(False, True, False, 0, 1, 0)
+    assert monitor.sample(255.0, 5.0).swells == 1
+    assert monitor.quality.out_of_band is True
+    monitor.sample(230.0, 10.0)
+    assert monitor.sample(256.0, 15.0).swells == 2
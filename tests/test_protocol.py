@@ -0,0 +1,92 @@
+"""Test the Wattbox telnet stream parser."""
+
+from __future__ import annotations
+
+import pytest
+
+from custom_components.wattbox.protocol import (
+    FRAME_ERROR,
+    FRAME_OK,
+    FRAME_OTHER,
+    FRAME_PUSH,
+    FRAME_RESPONSE,
+    Frame,
+    WattboxFrameParser,
+)
+
+STREAM = (
+    b"?OutletStatus=1,0,1\r\n"
+    b"~OutletStatus=1,1,1\r\n"
+    b"\r\n"
+    b"#Error\r\n"
+    b"OK\r\n"
+    b"Successfully Logged In!\r\n"
+)
+
+FRAMES = [
+    Frame(FRAME_RESPONSE, "?OutletStatus=", "?OutletStatus=1,0,1"),
+    Frame(FRAME_PUSH, "~OutletStatus=", "~OutletStatus=1,1,1"),
+    Frame(FRAME_ERROR, None, "#Error"),
+    Frame(FRAME_OK, None, "OK"),
+    Frame(FRAME_OTHER, None, "Successfully Logged In!"),
+]
+
+
+def test_parser_frame_kinds() -> None:
+    """Test every frame kind is recognised and blank lines are skipped."""
+    parser = WattboxFrameParser()
+
+    assert parser.feed(STREAM) == FRAMES
+    assert parser.pending == b""
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 64])
+def test_parser_reassembles_split_frames(size: int) -> None:
+    """Test frames split at any byte boundary come out whole and in order."""
+    parser = WattboxFrameParser()
+    frames = []
+
+    for start in range(0, len(STREAM), size):
+        frames.extend(parser.feed(STREAM[start : start + size]))
+
+    assert frames == FRAMES
+
+
+def test_parser_keeps_partial_record() -> None:
+    """Test a trailing partial record waits for the rest of its bytes."""
+    parser = WattboxFrameParser()
+
+    assert parser.feed(b"?Model=WB-800\n?Power") == [
+        Frame(FRAME_RESPONSE, "?Model=", "?Model=WB-800")
+    ]
+    assert parser.pending == b"?Power"
+    assert parser.feed(b"Status=1.00,120.00,120.00,1\n")[0].key == "?PowerStatus="
+
+    with pytest.raises(TypeError):
+        parser.feed("?Model=WB-800\n")
+
+
+def test_parser_long_frame() -> None:
+    """Test an 18-outlet ?OutletName reply split over reads stays whole."""
+    names = ",".join("{" + f"{n:02d}".ljust(31, "x") + "}" for n in range(1, 19))
+    parser = WattboxFrameParser()
+    data = f"?OutletName={names}\n".encode()
+
+    assert parser.feed(data[:512]) == []
+    (frame,) = parser.feed(data[512:])
+
+    assert frame.line == f"?OutletName={names}"
+
+
+def test_parser_drops_oversized_frame() -> None:
+    """Test a record past the size limit is dropped and parsing resumes."""
+    parser = WattboxFrameParser(max_frame_size=16)
+
+    assert parser.feed(b"?OutletName=" + b"x" * 20) == []
+    assert parser.pending == b""
+    assert parser.feed(b"y" * 20) == []
+    assert parser.feed(b"zz\nOK\n") == [Frame(FRAME_OK, None, "OK")]
+
+    parser.feed(b"?Model")
+    parser.reset()
+    assert parser.pending == b""
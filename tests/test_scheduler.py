@@ -0,0 +1,97 @@
+"""Test the fleet poll scheduler for Wattbox integration."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+from homeassistant.core import HomeAssistant
+
+from custom_components.wattbox.const import DATA_SCHEDULER, DOMAIN
+from custom_components.wattbox.scheduler import (
+    WattboxPollScheduler,
+    async_get_scheduler,
+)
+
+
+def test_single_entry_keeps_interval() -> None:
+    """Test a lone entry polls at its plain interval."""
+    scheduler = WattboxPollScheduler()
+    scheduler.register("a")
+
+    assert scheduler.next_delay("a", 30) == 30
+    assert scheduler.next_delay("unknown", 30) == 30
+
+
+def test_entries_spread_evenly_across_interval() -> None:
+    """Test aligned entries are moved into evenly spaced slots."""
+    with patch("custom_components.wattbox.scheduler.time.monotonic", return_value=0):
+        scheduler = WattboxPollScheduler()
+        for entry_id in "abcd":
+            scheduler.register(entry_id)
+
+        # All four finished a poll at the same moment after a restart
+        with patch(
+            "custom_components.wattbox.scheduler.time.monotonic", return_value=100.0
+        ):
+            starts = sorted(100.0 + scheduler.next_delay(e, 40) for e in "abcd")
+
+    assert [b - a for a, b in zip(starts, starts[1:])] == [10.0, 10.0, 10.0]
+    assert all(120.0 <= start <= 160.0 for start in starts)
+
+
+def test_unregister_frees_slot() -> None:
+    """Test unregistering removes the entry and its statistics."""
+    scheduler = WattboxPollScheduler()
+    scheduler.register("a")
+    scheduler.register("a")
+    scheduler.register("b")
+    scheduler.unregister("a")
+    scheduler.unregister("missing")
+
+    assert scheduler.report()["entries"] == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_polls_are_capped() -> None:
+    """Test no more than max_concurrent polls run at once."""
+    scheduler = WattboxPollScheduler(max_concurrent=2)
+    peak = 0
+
+    async def poll(entry_id: str) -> None:
+        nonlocal peak
+        async with scheduler.async_poll(entry_id):
+            peak = max(peak, scheduler.in_flight)
+            await asyncio.sleep(0.01)
+
+    await asyncio.gather(*(poll(str(i)) for i in range(6)))
+
+    assert peak == 2
+    assert scheduler.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_skew_is_reported() -> None:
+    """Test skew is measured against the scheduled start time."""
+    scheduler = WattboxPollScheduler()
+    scheduler.register("a")
+    with patch(
+        "custom_components.wattbox.scheduler.time.monotonic", side_effect=[0.0, 31.5]
+    ):
+        scheduler.next_delay("a", 30)
+        async with scheduler.async_poll("a"):
+            pass
+
+    report = scheduler.report()
+    assert report["skew"] == {"a": 1.5}
+    assert report["max_skew"] == 1.5
+    assert report["max_concurrent"] == 4
+
+
+def test_scheduler_is_shared_in_hass_data(hass: HomeAssistant) -> None:
+    """Test every entry gets the same domain-level scheduler."""
+    scheduler = async_get_scheduler(hass)
+
+    assert async_get_scheduler(hass) is scheduler
+    assert hass.data[DOMAIN][DATA_SCHEDULER] is scheduler
@@ -0,0 +1,133 @@
+"""Test the Wattbox response schemas."""
+
+from __future__ import annotations
+
+import pytest
+
+from custom_components.wattbox.schema import (
+    PARSE_ARITY,
+    PARSE_DEVICE_ERROR,
+    PARSE_UNEXPECTED,
+    PARSE_VALUE,
+    AdapterSensor,
+    CommandSchema,
+    ParseError,
+    compile_schema,
+    field,
+    parse_reply,
+    rest,
+)
+
+
+def test_parse_fixed_fields() -> None:
+    """Test a reply is converted into a typed record."""
+    record = parse_reply("?UPSStatus", "?UPSStatus=50,0,Good,False,25,True,False")
+
+    assert type(record).__name__ == "UPSStatus"
+    assert record._asdict() == {
+        "battery_charge": 50,
+        "battery_load": 0,
+        "battery_health": "Good",
+        "power_lost": False,
+        "battery_runtime": 25,
+        "alarm_enabled": True,
+        "alarm_muted": False,
+    }
+    power = parse_reply("?OutletPowerStatus=3", "?OutletPowerStatus=3,1.01,0.02,116.50")
+    assert (power.outlet, power.power, power.voltage) == (3, 1.01, 116.5)
+
+
+def test_parse_rest_fields() -> None:
+    """Test per-outlet values and pushes."""
+    states = parse_reply("?OutletStatus", "~OutletStatus=1,0,1,1")
+    names = parse_reply("?OutletName", "?OutletName={Router},{NAS}")
+
+    assert (states.mask, states.count) == (0b1101, 4)
+    assert names.names == ("Router", "NAS")
+
+
+def test_parse_single_field_keeps_whole_value() -> None:
+    """Test single-field replies keep commas and are stripped."""
+    assert parse_reply("?Firmware", "?Firmware=1,2,Good ").firmware == "1,2,Good"
+    assert parse_reply("?Model", "?Model=WB-800-IPVM-6").model == "WB-800-IPVM-6"
+    assert parse_reply("?UPSConnection", "?UPSConnection=0").connected is False
+
+
+@pytest.mark.parametrize(
+    ("command", "line", "reason"),
+    [
+        ("?OutletPowerStatus", "#Error", PARSE_DEVICE_ERROR),
+        ("?PowerStatus", "?Model=WB-800", PARSE_UNEXPECTED),
+        ("?OutletStatus", "InvalidResponse", PARSE_UNEXPECTED),
+        ("?PowerStatus", "?PowerStatus=1.0,120.0", PARSE_ARITY),
+        ("?PowerStatus", "?PowerStatus=1.0,x,120.0,1", PARSE_VALUE),
+        ("?OutletStatus", "?OutletStatus=1,on", PARSE_VALUE),
+        ("?OutletCount", "?OutletCount=0", PARSE_VALUE),
+        ("?Hostname", "?Hostname= ", PARSE_VALUE),
+        ("?UPSStatus", "?UPSStatus=50,0,Good,Maybe,25,True,False", PARSE_VALUE),
+    ],
+)
+def test_parse_errors(command: str, line: str, reason: str) -> None:
+    """Test unreadable replies give a structured error."""
+    error = parse_reply(command, line)
+
+    assert isinstance(error, ParseError)
+    assert (error.command, error.reason, error.line) == (command, reason, line)
+
+
+def test_compile_new_schema() -> None:
+    """Test a new command needs only its schema."""
+    parse = compile_schema(
+        CommandSchema(
+            "?Example",
+            "Example",
+            (field("enabled", int), rest("readings", lambda v: tuple(map(float, v)))),
+        )
+    )
+
+    assert parse("?Example=1,2.5,3").readings == (2.5, 3.0)
+    assert parse("?Example=").reason == PARSE_VALUE
+
+    with pytest.raises(ValueError):
+        compile_schema(
+            CommandSchema("?Bad", "Bad", (rest("all", list), field("one", int)))
+        )
+
+
+def test_parse_network_settings() -> None:
+    """Test the network settings reply."""
+    network = parse_reply(
+        "?NetworkGet",
+        "?NetworkGet=1,0,wattbox,192.168.1.10,255.255.255.0,192.168.1.1,"
+        "8.8.8.8,8.8.4.4",
+    )
+
+    assert (network.dhcp, network.static_dns, network.hostname) == (
+        True,
+        False,
+        "wattbox",
+    )
+    assert (network.ip, network.dns2) == ("192.168.1.10", "8.8.4.4")
+
+
+def test_parse_repeated_records() -> None:
+    """Test replies holding one record per adapter."""
+    adapters = parse_reply(
+        "?AdapterSensorData",
+        "?AdapterSensorData=ST1,0,True,0,215,False,0,0;ST2,1,True,0,-5,True,0,30",
+    )
+
+    assert [adapter.service_tag for adapter in adapters] == ["ST1", "ST2"]
+    assert adapters[0].sensors == (
+        AdapterSensor(True, 0, 215),
+        AdapterSensor(False, 0, None),
+    )
+    assert adapters[1].port == 1
+    assert parse_reply("?AdapterSensorData", "?AdapterSensorData=None") == ()
+
+    error = parse_reply("?AdapterSensorData", "?AdapterSensorData=ST1,0,True,0,215;ST2")
+    assert isinstance(error, ParseError)
+    assert error.reason == PARSE_ARITY
+
+    error = parse_reply("?AdapterSensorData", "?AdapterSensorData=ST1,0,True,0")
+    assert error.reason == PARSE_VALUE
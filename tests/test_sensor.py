@@ -10,16 +10,48 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
+from custom_components.wattbox.models import (
+    DeviceIdentity,
+    EnergyTotals,
+    OutletState,
+    PowerQuality,
+    PowerStatus,
+    UPSStatus,
+    WattboxSnapshot,
+    evolve,
+)
 from custom_components.wattbox.sensor import (
+    UPS_SENSORS,
     WattboxCurrentSensor,
+    WattboxEnergySensor,
     WattboxFirmwareSensor,
     WattboxHostnameSensor,
     WattboxModelSensor,
+    WattboxOutletCurrentSensor,
+    WattboxOutletEnergySensor,
+    WattboxOutletPowerSensor,
+    WattboxOutletVoltageSensor,
     WattboxPowerSensor,
     WattboxSerialSensor,
+    WattboxUPSSensor,
+    WattboxVoltageEventCountSensor,
     WattboxVoltageSensor,
     async_setup_entry,
 )
+from custom_components.wattbox.telemetry import TelemetryBuffer
+
+TEST_SNAPSHOT = evolve(
+    WattboxSnapshot.empty(),
+    device=evolve(
+        DeviceIdentity.unknown(),
+        hardware_version="1.0.0",
+        model="WB-800VPS-IPVM-18",
+        serial_number="TEST123",
+        hostname="test-wattbox",
+    ),
+    power=evolve(PowerStatus.unknown(), voltage=120.5, current=1.2, power=144.6),
+    connected=True,
+)
 
 
 @pytest.fixture
@@ -40,17 +72,8 @@ def mock_config_entry() -> ConfigEntry:
 def mock_coordinator() -> DataUpdateCoordinator:
     """Mock coordinator for testing."""
     coordinator = MagicMock(spec=DataUpdateCoordinator)
-    coordinator.data = {
-        "device_info": {
-            "hardware_version": "1.0.0",
-            "model": "WB-800VPS-IPVM-18",
-            "serial_number": "TEST123",
-            "hostname": "test-wattbox",
-        },
-        "voltage": 120.5,
-        "current": 1.2,
-        "power": 144.6,
-    }
+    coordinator.data = TEST_SNAPSHOT
+    coordinator.is_supported = MagicMock(return_value=True)
     return coordinator
 
 
@@ -62,17 +85,7 @@ async def test_async_setup_entry(
 ) -> None:
     """Test async_setup_entry for sensor platform."""
     # Ensure coordinator has proper data structure
-    mock_coordinator.data = {
-        "device_info": {
-            "hardware_version": "1.0.0",
-            "model": "WB-800VPS-IPVM-18",
-            "serial_number": "TEST123",
-            "hostname": "test-wattbox",
-        },
-        "voltage": 120.5,
-        "current": 1.2,
-        "power": 144.6,
-    }
+    mock_coordinator.data = TEST_SNAPSHOT
 
     # Mock the coordinator in hass.data
     hass.data["wattbox"] = {mock_config_entry.entry_id: mock_coordinator}
@@ -88,8 +101,18 @@ async def test_async_setup_entry(
     # Should return None (no return value)
     assert result is None
 
-    # Should have created 7 sensors (4 device info + 3 power monitoring)
-    assert len(entities_added) == 7
+    # Should have created 11 sensors (4 device info + 3 power monitoring +
+    # energy + 3 voltage event counts) plus power, current, voltage and
+    # energy for each of the default 18 outlets
+    # plus 4 UPS sensors
+    assert len(entities_added) == 11 + 4 + 4 * 18
+
+    # Outlet sensors need per-outlet power; UPS sensors wait for a UPS
+    mock_coordinator.is_supported.return_value = False
+    entities_added.clear()
+    await async_setup_entry(hass, mock_config_entry, mock_add_entities)
+    assert len(entities_added) == 11 + 4
+    mock_coordinator.is_supported.assert_any_call("?OutletPowerStatus")
 
 
 def test_wattbox_firmware_sensor_init(
@@ -120,7 +143,7 @@ def test_wattbox_firmware_sensor_native_value(
     assert sensor.native_value == "1.0.0"
 
     # Test without data
-    mock_coordinator.data = {}
+    mock_coordinator.data = None
     assert sensor.native_value is None
 
 
@@ -152,7 +175,7 @@ def test_wattbox_model_sensor_native_value(
     assert sensor.native_value == "WB-800VPS-IPVM-18"
 
     # Test without data
-    mock_coordinator.data = {}
+    mock_coordinator.data = None
     assert sensor.native_value is None
 
 
@@ -184,7 +207,7 @@ def test_wattbox_serial_sensor_native_value(
     assert sensor.native_value == "TEST123"
 
     # Test without data
-    mock_coordinator.data = {}
+    mock_coordinator.data = None
     assert sensor.native_value is None
 
 
@@ -216,7 +239,7 @@ def test_wattbox_hostname_sensor_native_value(
     assert sensor.native_value == "test-wattbox"
 
     # Test without data
-    mock_coordinator.data = {}
+    mock_coordinator.data = None
     assert sensor.native_value is None
 
 
@@ -249,7 +272,7 @@ def test_wattbox_voltage_sensor_native_value(
     assert sensor.native_value == 120.5
 
     # Test without data
-    mock_coordinator.data = {}
+    mock_coordinator.data = None
     assert sensor.native_value is None
 
 
@@ -282,7 +305,7 @@ def test_wattbox_current_sensor_native_value(
     assert sensor.native_value == 1.2
 
     # Test without data
-    mock_coordinator.data = {}
+    mock_coordinator.data = None
     assert sensor.native_value is None
 
 
@@ -315,10 +338,108 @@ def test_wattbox_power_sensor_native_value(
     assert sensor.native_value == 144.6
 
     # Test without data
-    mock_coordinator.data = {}
+    mock_coordinator.data = None
+    assert sensor.native_value is None
+
+
+def test_wattbox_energy_sensors(
+    mock_coordinator: DataUpdateCoordinator,
+) -> None:
+    """Test device and outlet energy sensors read the energy totals."""
+    mock_coordinator.data = evolve(
+        TEST_SNAPSHOT, energy=EnergyTotals(12.5, (0.25, None))
+    )
+    energy = WattboxEnergySensor(mock_coordinator, "test_entry_id")
+    outlet = WattboxOutletEnergySensor(mock_coordinator, "test_entry_id", 1)
+
+    assert energy.unique_id == "test_entry_id_energy"
+    assert energy.device_class == "energy"
+    assert energy._attr_state_class == "total_increasing"
+    assert energy.native_unit_of_measurement == "kWh"
+    assert energy.native_value == 12.5
+    assert outlet.unique_id == "test_entry_id_outlet_1_energy"
+    assert outlet._coordinator_keys == ("energy.outlets.1",)
+    assert outlet.native_value == 0.25
+    assert WattboxOutletEnergySensor(mock_coordinator, "id", 2).native_value is None
+    assert WattboxOutletEnergySensor(mock_coordinator, "id", 5).native_value is None
+
+    mock_coordinator.data = None
+    assert energy.native_value is None
+    assert outlet.native_value is None
+
+
+def test_statistics_attributes(
+    mock_coordinator: DataUpdateCoordinator,
+) -> None:
+    """Test voltage, current and power sensors expose rolling statistics."""
+    mock_coordinator.statistics_window = 300
+    mock_coordinator.telemetry = TelemetryBuffer()
+    voltage = WattboxVoltageSensor(mock_coordinator, "test_entry_id")
+    power = WattboxPowerSensor(mock_coordinator, "test_entry_id")
+    assert "telemetry" in voltage._coordinator_keys
+    assert voltage.extra_state_attributes is None
+
+    for now, reading in ((0.0, 118.0), (200.0, 120.0), (400.0, 124.0)):
+        mock_coordinator.telemetry.record(
+            now, evolve(PowerStatus.unknown(), voltage=reading)
+        )
+
+    assert voltage.extra_state_attributes == {
+        "window": 300,
+        "samples": 2,
+        "minimum": 120.0,
+        "mean": 122.0,
+        "maximum": 124.0,
+    }
+    assert power.extra_state_attributes is None
+
+
+def test_wattbox_voltage_event_count_sensor(
+    mock_coordinator: DataUpdateCoordinator,
+) -> None:
+    """Test the voltage event counters."""
+    sensor = WattboxVoltageEventCountSensor(
+        mock_coordinator, "test_entry_id", "brownouts", "Brownouts"
+    )
+    assert sensor.unique_id == "test_entry_id_voltage_brownouts"
+    assert sensor._attr_state_class == "total_increasing"
+    assert sensor.native_value == 0
+
+    mock_coordinator.data = evolve(
+        TEST_SNAPSHOT, quality=PowerQuality(False, False, True, 2, 0, 1)
+    )
+    assert sensor.native_value == 1
+    mock_coordinator.data = None
     assert sensor.native_value is None
 
 
+def test_wattbox_ups_sensors(
+    mock_coordinator: DataUpdateCoordinator,
+) -> None:
+    """Test UPS sensors read the UPS status."""
+    mock_coordinator.data = evolve(
+        TEST_SNAPSHOT,
+        ups=evolve(UPSStatus.unknown(), battery_runtime=25, battery_health="Good"),
+    )
+    runtime = WattboxUPSSensor(mock_coordinator, "test_entry_id", *UPS_SENSORS[2])
+    health = WattboxUPSSensor(mock_coordinator, "test_entry_id", *UPS_SENSORS[3])
+
+    assert runtime.unique_id == "test_entry_id_ups_battery_runtime"
+    assert runtime.name == "Battery Runtime"
+    assert runtime.native_unit_of_measurement == "min"
+    assert runtime.device_class == "duration"
+    assert runtime._attr_state_class == "measurement"
+    assert runtime._coordinator_keys == ("connected", "ups.battery_runtime")
+    assert runtime.native_value == 25
+    assert health.native_value == "Good"
+    assert getattr(health, "_attr_state_class", None) is None
+
+    mock_coordinator.data = evolve(mock_coordinator.data, connected=False)
+    assert runtime.native_value is None
+    mock_coordinator.data = None
+    assert runtime.native_value is None
+
+
 def test_sensor_inheritance(
     mock_coordinator: DataUpdateCoordinator,
 ) -> None:
@@ -341,3 +462,47 @@ def test_sensor_inheritance(
     assert isinstance(voltage_sensor, SensorEntity)
     assert isinstance(current_sensor, SensorEntity)
     assert isinstance(power_sensor, SensorEntity)
+
+
+def test_wattbox_outlet_power_sensors(
+    mock_coordinator: DataUpdateCoordinator,
+) -> None:
+    """Test per-outlet power, current and voltage sensors."""
+    mock_coordinator.data = evolve(
+        TEST_SNAPSHOT,
+        outlets=(
+            OutletState(1, "Outlet 1", 1, None, None, None),
+            OutletState(2, "Outlet 2", 1, 10.5, 0.09, None),
+        ),
+    )
+    power = WattboxOutletPowerSensor(mock_coordinator, "test_entry_id", 2)
+    current = WattboxOutletCurrentSensor(mock_coordinator, "test_entry_id", 2)
+    voltage = WattboxOutletVoltageSensor(mock_coordinator, "test_entry_id", 2)
+
+    assert power.unique_id == "test_entry_id_outlet_2_power"
+    assert power.name == "Outlet 2 Power"
+    assert power.native_unit_of_measurement == "W"
+    assert power.native_value == 10.5
+    assert current.native_value == 0.09
+    assert current._attr_entity_registry_enabled_default is False
+    assert voltage.native_value is None
+    assert WattboxOutletPowerSensor(mock_coordinator, "id", 3).native_value is None
+
+    mock_coordinator.data = None
+    assert power.native_value is None
+
+
+@pytest.mark.asyncio
+async def test_wattbox_outlet_sensor_registers_with_coordinator(
+    mock_coordinator: DataUpdateCoordinator,
+) -> None:
+    """Test enabled outlet sensors ask the coordinator to poll their outlet."""
+    remove = MagicMock()
+    mock_coordinator.async_add_outlet_power_entity = MagicMock(return_value=remove)
+    sensor = WattboxOutletPowerSensor(mock_coordinator, "test_entry_id", 4)
+
+    await sensor.async_added_to_hass()
+    mock_coordinator.async_add_outlet_power_entity.assert_called_once_with(4)
+
+    await sensor.async_remove()
+    remove.assert_called_once()
@@ -0,0 +1,94 @@
+"""Test the Wattbox services."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+
+from custom_components.wattbox.const import DATA_SCHEDULER, DOMAIN, SERVICE_SET_OUTLETS
+from custom_components.wattbox.coordinator import WattboxDataUpdateCoordinator
+from custom_components.wattbox.services import (
+    async_setup_services,
+    async_unload_services,
+)
+from custom_components.wattbox.telnet_client import (
+    WattboxConnectionError,
+    WattboxTelnetError,
+)
+
+
+def _coordinator() -> WattboxDataUpdateCoordinator:
+    """Return a mock coordinator."""
+    coordinator = MagicMock(spec=WattboxDataUpdateCoordinator)
+    coordinator.async_set_outlet_states = AsyncMock()
+    return coordinator
+
+
+@pytest.mark.asyncio
+async def test_set_outlets_single_entry(hass: HomeAssistant) -> None:
+    """Test outlet actions go to the only Wattbox in one call."""
+    coordinator = _coordinator()
+    hass.data[DOMAIN] = {DATA_SCHEDULER: object(), "entry": coordinator}
+    async_setup_services(hass)
+    async_setup_services(hass)
+
+    await hass.services.async_call(
+        DOMAIN, SERVICE_SET_OUTLETS, {"outlets": {"1": "on", 2: "off", 0: "reset"}}
+    )
+
+    coordinator.async_set_outlet_states.assert_called_once_with(
+        {1: "on", 2: "off", 0: "reset"}
+    )
+
+    # The service stays while an entry is loaded
+    async_unload_services(hass)
+    assert hass.services.has_service(DOMAIN, SERVICE_SET_OUTLETS)
+    del hass.data[DOMAIN]["entry"]
+    async_unload_services(hass)
+    assert not hass.services.has_service(DOMAIN, SERVICE_SET_OUTLETS)
+
+
+@pytest.mark.asyncio
+async def test_set_outlets_entry_selection(hass: HomeAssistant) -> None:
+    """Test the entry is required with several Wattboxes and must exist."""
+    first, second = _coordinator(), _coordinator()
+    hass.data[DOMAIN] = {"first": first, "second": second}
+    async_setup_services(hass)
+
+    with pytest.raises(HomeAssistantError, match="entry_id is required"):
+        await hass.services.async_call(
+            DOMAIN, SERVICE_SET_OUTLETS, {"outlets": {1: "on"}}
+        )
+    with pytest.raises(HomeAssistantError, match="Unknown Wattbox entry"):
+        await hass.services.async_call(
+            DOMAIN, SERVICE_SET_OUTLETS, {"entry_id": "third", "outlets": {1: "on"}}
+        )
+
+    second.async_set_outlet_states.side_effect = ValueError("Outlet 0 only")
+    with pytest.raises(HomeAssistantError, match="Outlet 0 only"):
+        await hass.services.async_call(
+            DOMAIN, SERVICE_SET_OUTLETS, {"entry_id": "second", "outlets": {0: "on"}}
+        )
+    first.async_set_outlet_states.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_set_outlets_device_errors(hass: HomeAssistant) -> None:
+    """Test device and connection errors surface as HomeAssistantError."""
+    coordinator = _coordinator()
+    hass.data[DOMAIN] = {"entry": coordinator}
+    async_setup_services(hass)
+
+    for err in (
+        WattboxTelnetError("Device rejected command: !OutletSet=1,ON"),
+        WattboxConnectionError("Not connected"),
+    ):
+        coordinator.async_set_outlet_states.side_effect = err
+        with pytest.raises(HomeAssistantError, match=str(err)) as exc_info:
+            await hass.services.async_call(
+                DOMAIN, SERVICE_SET_OUTLETS, {"outlets": {1: "on"}}
+            )
+        assert exc_info.value.__cause__ is err
@@ -0,0 +1,61 @@
+"""Test single-flight coalescing of concurrent fetches."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from custom_components.wattbox.singleflight import SingleFlight
+
+
+@pytest.mark.asyncio
+async def test_concurrent_callers_share_one_call() -> None:
+    """Test callers with the same key share a call; other keys run apart."""
+    group = SingleFlight()
+    calls: list[str] = []
+    release = asyncio.Event()
+
+    async def fetch(key: str) -> str:
+        calls.append(key)
+        await release.wait()
+        return key.upper()
+
+    tasks = [
+        asyncio.ensure_future(group.async_do(key, lambda key=key: fetch(key)))
+        for key in ("a", "a", "b", "a")
+    ]
+    await asyncio.sleep(0)
+    assert group.in_flight == 2
+    release.set()
+
+    assert await asyncio.gather(*tasks) == ["A", "A", "B", "A"]
+    assert calls == ["a", "b"]
+    assert group.in_flight == 0
+
+    # A finished call is not reused
+    assert await group.async_do("a", lambda: fetch("a")) == "A"
+    assert calls == ["a", "b", "a"]
+
+
+@pytest.mark.asyncio
+async def test_errors_and_cancellation() -> None:
+    """Test errors reach every caller and a cancelled caller leaves the call."""
+    group = SingleFlight()
+    release = asyncio.Event()
+
+    async def fail() -> None:
+        await release.wait()
+        raise ValueError("boom")
+
+    first = asyncio.ensure_future(group.async_do("k", fail))
+    second = asyncio.ensure_future(group.async_do("k", fail))
+    await asyncio.sleep(0)
+    first.cancel()
+    await asyncio.sleep(0)
+    release.set()
+
+    with pytest.raises(ValueError, match="boom"):
+        await second
+    assert first.cancelled()
+    assert group.in_flight == 0
@@ -10,11 +10,33 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
+from custom_components.wattbox.models import (
+    DeviceIdentity,
+    OutletState,
+    WattboxSnapshot,
+    evolve,
+)
 from custom_components.wattbox.switch import (
     WattboxSwitch,
     async_setup_entry,
 )
 
+TEST_SNAPSHOT = evolve(
+    WattboxSnapshot.empty(),
+    device=evolve(
+        DeviceIdentity.unknown(),
+        hardware_version="1.0.0",
+        model="WB-800VPS-IPVM-18",
+        serial_number="TEST123",
+        hostname="test-wattbox",
+    ),
+    outlets=tuple(
+        evolve(OutletState.default(number), state=state)
+        for number, state in enumerate((1, 0, 1), start=1)
+    ),
+    connected=True,
+)
+
 
 @pytest.fixture
 def mock_config_entry() -> ConfigEntry:
@@ -34,19 +56,7 @@ def mock_config_entry() -> ConfigEntry:
 def mock_coordinator() -> DataUpdateCoordinator:
     """Mock coordinator for testing."""
     coordinator = MagicMock(spec=DataUpdateCoordinator)
-    coordinator.data = {
-        "device_info": {
-            "hardware_version": "1.0.0",
-            "model": "WB-800VPS-IPVM-18",
-            "serial_number": "TEST123",
-            "hostname": "test-wattbox",
-        },
-        "outlet_info": [
-            {"state": 1, "name": "Outlet 1"},
-            {"state": 0, "name": "Outlet 2"},
-            {"state": 1, "name": "Outlet 3"},
-        ],
-    }
+    coordinator.data = TEST_SNAPSHOT
     coordinator.async_set_outlet_state = AsyncMock()
     return coordinator
 
@@ -58,20 +68,8 @@ async def test_async_setup_entry(
     mock_coordinator: DataUpdateCoordinator,
 ) -> None:
     """Test async_setup_entry for switch platform."""
-    # Ensure coordinator has outlet_info data
-    mock_coordinator.data = {
-        "device_info": {
-            "hardware_version": "1.0.0",
-            "model": "WB-800VPS-IPVM-18",
-            "serial_number": "TEST123",
-            "hostname": "test-wattbox",
-        },
-        "outlet_info": [
-            {"state": 1, "name": "Outlet 1"},
-            {"state": 0, "name": "Outlet 2"},
-            {"state": 1, "name": "Outlet 3"},
-        ],
-    }
+    # Ensure coordinator has outlet data
+    mock_coordinator.data = TEST_SNAPSHOT
 
     # Mock the coordinator in hass.data
     hass.data["wattbox"] = {mock_config_entry.entry_id: mock_coordinator}
@@ -136,8 +134,15 @@ def test_wattbox_switch_is_on(
     switch._outlet_number = 3
     assert switch.is_on is True
 
+    # Test with state unknown (seeded from the stored profile)
+    mock_coordinator.data = evolve(
+        TEST_SNAPSHOT, outlets=(evolve(OutletState.default(1), state=None),)
+    )
+    switch._outlet_number = 1
+    assert switch.is_on is None
+
     # Test with no outlet data
-    mock_coordinator.data = {"outlet_info": []}
+    mock_coordinator.data = evolve(TEST_SNAPSHOT, outlets=())
     assert switch.is_on is None
 
 
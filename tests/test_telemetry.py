@@ -0,0 +1,65 @@
+"""Test the telemetry ring buffer."""
+
+from __future__ import annotations
+
+import pytest
+
+from custom_components.wattbox.models import PowerStatus, WindowStats, evolve
+from custom_components.wattbox.telemetry import TelemetryBuffer
+
+
+def _power(voltage: float | None, power: float | None = None) -> PowerStatus:
+    return evolve(PowerStatus.unknown(), voltage=voltage, power=power)
+
+
+def test_stats_and_downsample() -> None:
+    """Test statistics over a window and downsampled history."""
+    buffer = TelemetryBuffer(capacity=10)
+    assert len(buffer) == 0
+    assert buffer.latest_time is None
+    assert buffer.stats("voltage", 60) is None
+    assert buffer.downsample("voltage", 60) == []
+
+    for now, voltage in ((0, 118.0), (30, 120.0), (60, 121.5), (90, 122.5)):
+        buffer.record(now, _power(voltage))
+
+    assert len(buffer) == 4
+    assert buffer.latest_time == 90
+    assert buffer.stats("voltage", 60) == WindowStats(60, 90, 2, 121.5, 122.0, 122.5)
+    assert buffer.downsample("voltage", 60) == [
+        WindowStats(0, 30, 2, 118.0, 119.0, 120.0),
+        WindowStats(60, 90, 2, 121.5, 122.0, 122.5),
+    ]
+    assert buffer.downsample("voltage", 100)[0].mean == 120.5
+    assert buffer.downsample("voltage", 20, span=60) == [
+        WindowStats(60, 60, 1, 121.5, 121.5, 121.5),
+        WindowStats(90, 90, 1, 122.5, 122.5, 122.5),
+    ]
+    # Readings that were never reported are left out
+    assert buffer.stats("power", 60) is None
+    assert buffer.stats("current", 600) is None
+
+
+def test_ring_overwrites_oldest() -> None:
+    """Test a full buffer keeps only the newest samples."""
+    buffer = TelemetryBuffer(capacity=3)
+    for now in range(5):
+        buffer.record(now, _power(100.0 + now, None if now == 3 else 10.0))
+
+    assert len(buffer) == 3
+    assert buffer.recorded == 5
+    assert buffer.stats("voltage", 100) == WindowStats(2, 4, 3, 102.0, 103.0, 104.0)
+    assert buffer.stats("power", 100) == WindowStats(2, 4, 2, 10.0, 10.0, 10.0)
+
+
+def test_stats_rounded() -> None:
+    """Test statistics hide the noise of 32-bit storage."""
+    buffer = TelemetryBuffer()
+    buffer.record(0, evolve(PowerStatus.unknown(), current=1.2))
+    assert buffer.stats("current", 60).mean == 1.2
+
+
+def test_invalid_capacity() -> None:
+    """Test a buffer needs room for at least one sample."""
+    with pytest.raises(ValueError):
+        TelemetryBuffer(capacity=0)
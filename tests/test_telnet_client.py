@@ -7,19 +7,52 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from custom_components.wattbox.models import (
+    DeviceIdentity,
+    OutletState,
+    PowerStatus,
+    UPSStatus,
+    WattboxSnapshot,
+)
 from custom_components.wattbox.telnet_client import (
     WattboxAuthenticationError,
     WattboxConnectionError,
     WattboxTelnetClient,
+    WattboxTelnetError,
 )
 
 
+class FakeTelnetReader:
+    """Telnet reader stand-in that serves fed chunks, then waits for more."""
+
+    def __init__(self) -> None:
+        """Initialize the fake reader."""
+        self.readuntil = AsyncMock()
+        self.read_calls: list[int] = []
+        self._chunks: list[bytes] = []
+        self._available: asyncio.Event | None = None
+
+    def feed(self, *chunks: bytes) -> None:
+        """Queue chunks to be returned by read(); an empty chunk means EOF."""
+        self._chunks.extend(chunks)
+        if self._available is not None:
+            self._available.set()
+
+    async def read(self, size: int) -> bytes:
+        """Return the next fed chunk, waiting until one is available."""
+        self.read_calls.append(size)
+        if self._available is None:
+            self._available = asyncio.Event()
+        while not self._chunks:
+            self._available.clear()
+            await self._available.wait()
+        return self._chunks.pop(0)
+
+
 @pytest.fixture
 def mock_reader():
     """Mock telnet reader."""
-    reader = MagicMock()
-    reader.readuntil = AsyncMock()
-    return reader
+    return FakeTelnetReader()
 
 
 @pytest.fixture
@@ -59,14 +92,16 @@ def test_telnet_client_is_connected_property(
     assert telnet_client.is_connected is True
 
 
-def test_telnet_client_device_data_property(telnet_client: WattboxTelnetClient) -> None:
-    """Test device_data property."""
-    data = telnet_client.device_data
-    assert isinstance(data, dict)
-    assert "device_info" in data
-    assert "outlet_info" in data
-    # Note: voltage, current, power are not in the initial device_data structure
-    # They are added by the coordinator when calling async_get_power_metrics
+def test_telnet_client_snapshot_property(telnet_client: WattboxTelnetClient) -> None:
+    """Test snapshot property."""
+    snapshot = telnet_client.snapshot
+    assert isinstance(snapshot, WattboxSnapshot)
+    assert snapshot.device == DeviceIdentity.unknown()
+    assert snapshot.outlets == ()
+    assert snapshot.connected is False
+
+    telnet_client._connected = True
+    assert telnet_client.snapshot.connected is True
 
 
 @pytest.mark.asyncio
@@ -91,7 +126,8 @@ async def test_async_connect_success(
         assert telnet_client._connected is True
         assert telnet_client._reader == mock_reader
         assert telnet_client._writer == mock_writer
-        mock_open.assert_called_once()
+        mock_open.assert_called_once_with("192.168.1.100", 23, encoding=False)
+        mock_writer.write.assert_any_call(b"test_user\r\n")
 
 
 @pytest.mark.asyncio
@@ -183,16 +219,94 @@ async def test_async_send_command_success(
     telnet_client._reader = mock_reader
     telnet_client._writer = mock_writer
 
-    mock_reader.read = AsyncMock(return_value=b"?Firmware=1.0.0\n")
+    mock_reader.feed(b"?Firmware=1.0.0\n")
 
     response = await telnet_client.async_send_command("?Firmware")
 
     assert response == "?Firmware=1.0.0"
-    mock_writer.write.assert_called_once_with("?Firmware\r\n")
+    mock_writer.write.assert_called_once_with(b"?Firmware\r\n")
     mock_writer.drain.assert_called_once()
-    # read is called twice: once for buffer flush, once for actual response
-    assert mock_reader.read.call_count == 2
-    mock_reader.read.assert_any_call(1024)
+    # Answered by the first framed read, without a separate flush read
+    assert mock_reader.read_calls[0] == 1024
+
+
+@pytest.mark.asyncio
+async def test_async_send_command_skips_unmatched_lines(
+    telnet_client: WattboxTelnetClient,
+    mock_reader,
+    mock_writer,
+) -> None:
+    """Test that stale and unsolicited lines are skipped by prefix matching."""
+    telnet_client._connected = True
+    telnet_client._reader = mock_reader
+    telnet_client._writer = mock_writer
+
+    mock_reader.feed(b"?Model=WB-800\r\n~OutletStatus=1,0\r\n?Firmware=2.8.0.0\r\n")
+
+    response = await telnet_client.async_send_command("?Firmware")
+
+    assert response == "?Firmware=2.8.0.0"
+    assert telnet_client._parser.pending == b""
+
+
+@pytest.mark.asyncio
+async def test_async_send_command_split_frames(
+    telnet_client: WattboxTelnetClient,
+    mock_reader,
+    mock_writer,
+) -> None:
+    """Test that a response split across reads is reassembled."""
+    telnet_client._connected = True
+    telnet_client._reader = mock_reader
+    telnet_client._writer = mock_writer
+
+    mock_reader.feed(b"?OutletStatus=1,0,", b"1,0\n?Power")
+
+    response = await telnet_client.async_send_command("?OutletStatus")
+
+    assert response == "?OutletStatus=1,0,1,0"
+    assert telnet_client._parser.pending == b"?Power"
+
+
+@pytest.mark.asyncio
+async def test_async_send_command_control_and_error(
+    telnet_client: WattboxTelnetClient,
+    mock_reader,
+    mock_writer,
+) -> None:
+    """Test that control commands match OK and any command matches #Error."""
+    telnet_client._connected = True
+    telnet_client._reader = mock_reader
+    telnet_client._writer = mock_writer
+
+    send = asyncio.ensure_future(telnet_client.async_send_command("!OutletSet=1,ON"))
+    await asyncio.sleep(0)
+    mock_reader.feed(b"?Firmware=1.0\nOK\n")
+    assert await send == "OK"
+
+    send = asyncio.ensure_future(telnet_client.async_send_command("?PowerStatus"))
+    await asyncio.sleep(0)
+    mock_reader.feed(b"#Error\n")
+    assert await send == "#Error"
+
+
+@pytest.mark.asyncio
+async def test_async_send_command_connection_closed(
+    telnet_client: WattboxTelnetClient,
+    mock_reader,
+    mock_writer,
+) -> None:
+    """Test that EOF while waiting for a response raises a connection error."""
+    telnet_client._connected = True
+    telnet_client._reader = mock_reader
+    telnet_client._writer = mock_writer
+
+    mock_reader.feed(b"")
+
+    with pytest.raises(WattboxConnectionError, match="Connection closed"):
+        await telnet_client.async_send_command("?Firmware")
+
+    assert telnet_client.is_connected is False
 
 
 @pytest.mark.asyncio
@@ -212,23 +326,83 @@ async def test_async_get_device_info(telnet_client: WattboxTelnetClient) -> None
     """Test getting device info."""
     with (
         patch.object(telnet_client, "async_connect"),
-        patch.object(telnet_client, "async_send_command") as mock_send,
+        patch.object(telnet_client, "async_send_batch") as mock_batch,
     ):
-        mock_send.side_effect = [
+        mock_batch.return_value = [
             "?Firmware=1.0.0",
             "?Model=WB-800VPS",
             "?ServiceTag=TEST123",
             "?Hostname=test-box",
             "?AutoReboot=1",
+            "?OutletCount=12",
         ]
 
         info = await telnet_client.async_get_device_info()
 
-        assert info["hardware_version"] == "1.0.0"
-        assert info["model"] == "WB-800VPS"
-        assert info["serial_number"] == "TEST123"
-        assert info["hostname"] == "test-box"
-        assert info["auto_reboot"] == "1"
+        # All device info queries go out in a single pipelined batch
+        mock_batch.assert_called_once_with(
+            [
+                "?Firmware",
+                "?Model",
+                "?ServiceTag",
+                "?Hostname",
+                "?AutoReboot",
+                "?OutletCount",
+            ]
+        )
+        assert info.outlet_count == 12
+
+        assert info.hardware_version == "1.0.0"
+        assert info.model == "WB-800VPS"
+        assert info.serial_number == "TEST123"
+        assert info.hostname == "test-box"
+        assert info.auto_reboot == "1"
+
+
+@pytest.mark.asyncio
+async def test_async_get_device_info_firmware_upgrade(
+    telnet_client: WattboxTelnetClient,
+) -> None:
+    """Test a reconnect re-reads firmware and re-reads identity if it changed."""
+    telnet_client._connected = True
+    telnet_client._update_device(
+        hardware_version="2.2.0",
+        model="WB-150",
+        serial_number="ST150",
+        hostname="box",
+        auto_reboot="1",
+        outlet_count=2,
+    )
+    telnet_client.set_unsupported_commands(["?OutletPowerStatus"])
+
+    with patch.object(telnet_client, "async_send_batch") as mock_batch:
+        mock_batch.return_value = ["?Firmware=2.2.0"]
+        await telnet_client.async_get_device_info()
+        mock_batch.assert_called_once_with(["?Firmware"])
+
+        # Later calls on the same connection send nothing
+        mock_batch.reset_mock()
+        await telnet_client.async_get_device_info()
+        mock_batch.assert_not_called()
+
+        # As after async_connect, with the device upgraded meanwhile
+        telnet_client._firmware_checked = False
+        mock_batch.side_effect = [
+            ["?Firmware=2.8.0"],
+            [
+                "?Model=WB-150",
+                "?ServiceTag=ST150",
+                "?Hostname=box",
+                "?AutoReboot=0",
+                "?OutletCount=2",
+            ],
+        ]
+        info = await telnet_client.async_get_device_info()
+
+    assert mock_batch.call_count == 2
+    assert info.hardware_version == "2.8.0"
+    assert info.auto_reboot == "0"
+    assert telnet_client.unsupported_commands == frozenset()
 
 
 @pytest.mark.asyncio
@@ -237,17 +411,13 @@ async def test_async_get_outlet_status(telnet_client: WattboxTelnetClient) -> No
     with (
         patch.object(telnet_client, "async_connect"),
         patch.object(telnet_client, "async_send_command") as mock_send,
+        patch.object(telnet_client, "async_send_batch") as mock_batch,
     ):
-        # Mock responses for the simplified sequencing:
         # 1. Get outlet count: ?OutletCount -> ?OutletCount=12
-        # 2. Get outlet status: ?OutletStatus -> ?OutletStatus=1,0,1,0,1,0,1,0,1,0,1,0
-        # 3. Get outlet names: ?OutletName -> ?OutletName={Outlet 1},{Outlet 2},...
-        mock_send.side_effect = [
-            # Outlet count
-            "?OutletCount=12",
-            # Outlet status
+        # 2. Get status and names in one batch: ?OutletStatus, ?OutletName
+        mock_send.return_value = "?OutletCount=12"
+        mock_batch.return_value = [
             "?OutletStatus=1,0,1,0,1,0,1,0,1,0,1,0",
-            # Outlet names
             "?OutletName={Outlet 1},{Outlet 2},{Outlet 3},{Outlet 4},"
             "{Outlet 5},{Outlet 6},{Outlet 7},{Outlet 8},{Outlet 9},"
             "{Outlet 10},{Outlet 11},{Outlet 12}",
@@ -255,11 +425,41 @@ async def test_async_get_outlet_status(telnet_client: WattboxTelnetClient) -> No
 
         outlets = await telnet_client.async_get_outlet_status()
 
+        mock_send.assert_called_once_with("?OutletCount")
+        mock_batch.assert_called_once_with(["?OutletStatus", "?OutletName"])
+
         assert len(outlets) == 12
-        assert outlets[0]["state"] == 1
-        assert outlets[0]["name"] == "Outlet 1"
-        assert outlets[1]["state"] == 0
-        assert outlets[1]["name"] == "Outlet 2"
+        assert outlets[0].state == 1
+        assert outlets[0].name == "Outlet 1"
+        assert outlets[1].state == 0
+        assert outlets[1].name == "Outlet 2"
+
+
+@pytest.mark.asyncio
+async def test_async_get_outlet_status_power(
+    telnet_client: WattboxTelnetClient,
+) -> None:
+    """Test per-outlet power queries are pipelined with the status query."""
+    telnet_client._connected = True
+    with patch.object(telnet_client, "async_send_batch") as mock_batch:
+        mock_batch.return_value = [
+            "?OutletStatus=1,0,1",
+            "?OutletPowerStatus=1,1.01,0.02,116.50",
+            "#Error",
+        ]
+
+        outlets = await telnet_client.async_get_outlet_status(
+            3, include_names=False, power_outlets=[1, 3]
+        )
+
+    mock_batch.assert_called_once_with(
+        ["?OutletStatus", "?OutletPowerStatus=1", "?OutletPowerStatus=3"]
+    )
+    assert outlets[0] == OutletState(1, "Outlet 1", 1, 1.01, 0.02, 116.5)
+    # Unsupported replies leave the outlet without readings
+    assert outlets[2].power is None
+    # Outlets without new readings are shared with the previous snapshot
+    assert outlets[1] is telnet_client.snapshot.outlets[1]
 
 
 @pytest.mark.asyncio
@@ -267,19 +467,54 @@ async def test_async_set_outlet_state(telnet_client: WattboxTelnetClient) -> Non
     """Test setting outlet state."""
     with (
         patch.object(telnet_client, "async_connect"),
-        patch.object(telnet_client, "async_send_command") as mock_send,
+        patch.object(telnet_client, "async_send_batch") as mock_batch,
     ):
         # Initialize outlet info
-        telnet_client._device_data["outlet_info"] = [
-            {"state": 0, "name": "Outlet 1"},
-            {"state": 0, "name": "Outlet 2"},
-        ]
+        telnet_client._set_outlets((OutletState.default(1), OutletState.default(2)))
+        mock_batch.return_value = ["OK", "?OutletStatus=1,1"]
+
+        outlets = await telnet_client.async_set_outlet_state(1, True)
+
+        # Set and confirm are pipelined in one round trip
+        mock_batch.assert_called_once_with(["!OutletSet=1,ON", "?OutletStatus"])
+        # Check that internal state was updated and confirmed from the device
+        assert [outlet.state for outlet in outlets] == [1, 1]
+
 
-        await telnet_client.async_set_outlet_state(1, True)
+@pytest.mark.asyncio
+async def test_async_set_outlet_state_rejected(
+    telnet_client: WattboxTelnetClient,
+) -> None:
+    """Test that a #Error reply to !OutletSet is raised."""
+    telnet_client._connected = True
+    with patch.object(telnet_client, "async_send_batch") as mock_batch:
+        mock_batch.return_value = ["#Error", "?OutletStatus=0"]
 
-        mock_send.assert_called_once_with("!OutletSet=1,ON")
-        # Check that internal state was updated
-        assert telnet_client._device_data["outlet_info"][0]["state"] == 1
+        with pytest.raises(WattboxTelnetError, match="rejected"):
+            await telnet_client.async_set_outlet_state(1, True)
+
+
+@pytest.mark.asyncio
+async def test_async_set_outlet_states_rejected(
+    telnet_client: WattboxTelnetClient,
+) -> None:
+    """Test a rejected command in a batch is raised after confirming states."""
+    telnet_client._connected = True
+    telnet_client._set_outlets((OutletState.default(1), OutletState.default(2)))
+    with patch.object(telnet_client, "async_send_batch") as mock_batch:
+        mock_batch.return_value = ["OK", "#Error", "?OutletStatus=1,0"]
+
+        with pytest.raises(WattboxTelnetError, match="!OutletSet=1,ON"):
+            await telnet_client.async_set_outlet_states({2: "on", 1: "ON"})
+
+        # Commands keep the order they were given in
+        mock_batch.assert_called_once_with(
+            ["!OutletSet=2,ON", "!OutletSet=1,ON", "?OutletStatus"]
+        )
+        assert [outlet.state for outlet in telnet_client.snapshot.outlets] == [1, 0]
+        assert await telnet_client.async_set_outlet_states({}) == (
+            telnet_client.snapshot.outlets
+        )
 
 
 @pytest.mark.asyncio
@@ -317,27 +552,277 @@ async def test_async_get_status_info(telnet_client: WattboxTelnetClient) -> None
             telnet_client, "async_connect", new_callable=AsyncMock
         ) as mock_connect,
         patch.object(
-            telnet_client, "_get_power_status", new_callable=AsyncMock
-        ) as mock_power,
-        patch.object(
-            telnet_client, "_get_ups_connection", new_callable=AsyncMock
-        ) as mock_ups_conn,
-        patch.object(
-            telnet_client, "_get_ups_status", new_callable=AsyncMock
-        ) as mock_ups_status,
+            telnet_client, "async_send_batch", new_callable=AsyncMock
+        ) as mock_batch,
     ):
+        mock_batch.return_value = [
+            "?PowerStatus=60.00,600.00,110.00,1",
+            "?UPSConnection=1",
+            "?UPSStatus=50,0,Good,False,25,True,False",
+        ]
 
         result = await telnet_client.async_get_status_info()
 
         mock_connect.assert_called_once()
-        mock_power.assert_called_once()
-        mock_ups_conn.assert_called_once()
-        mock_ups_status.assert_called_once()
+        mock_batch.assert_called_once_with(
+            ["?PowerStatus", "?UPSConnection", "?UPSStatus"]
+        )
+
+        power, ups = result
+        assert power.power == 600.0
+        assert ups.connected is True
+        assert ups.battery_runtime == 25
+
+
+@pytest.mark.asyncio
+async def test_async_get_status_info_partial_failure(
+    telnet_client: WattboxTelnetClient,
+) -> None:
+    """Test that one bad response in a batch does not drop the others."""
+    telnet_client._connected = True
+    with patch.object(
+        telnet_client, "async_send_batch", new_callable=AsyncMock
+    ) as mock_batch:
+        mock_batch.return_value = [
+            "#Error",
+            "?UPSConnection=garbage",
+            "?UPSStatus=50,0,Good,True,25,True,False",
+        ]
+
+        result = await telnet_client.async_get_status_info()
+
+        power, ups = result
+        assert power.power is None
+        assert ups.connected is None
+        assert ups.power_lost is True
+
+
+@pytest.mark.asyncio
+async def test_async_send_batch_single_write(
+    telnet_client: WattboxTelnetClient,
+    mock_reader,
+    mock_writer,
+) -> None:
+    """Test that a batch is written once and responses are sorted by key."""
+    telnet_client._connected = True
+    telnet_client._reader = mock_reader
+    telnet_client._writer = mock_writer
 
-        assert isinstance(result, dict)
-        assert "power_status" in result
-        assert "ups_status" in result
-        assert "ups_connected" in result
+    mock_reader.feed(
+        b"?OutletStatus=1,0\n~OutletStatus=1,1\n?Power",
+        b"Status=1.00,120.00,120.00,1\n#Error\n",
+    )
+
+    responses = await telnet_client.async_send_batch(
+        ["?OutletStatus", "?PowerStatus", "?UPSStatus"]
+    )
+
+    assert responses == [
+        "?OutletStatus=1,0",
+        "?PowerStatus=1.00,120.00,120.00,1",
+        "#Error",
+    ]
+    mock_writer.write.assert_called_once_with(
+        b"?OutletStatus\r\n?PowerStatus\r\n?UPSStatus\r\n"
+    )
+    mock_writer.drain.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_async_poll_single_batch(
+    telnet_client: WattboxTelnetClient,
+    mock_reader,
+    mock_writer,
+) -> None:
+    """Test that outlet, power and UPS queries share one pipelined write."""
+    telnet_client._connected = True
+    telnet_client._reader = mock_reader
+    telnet_client._writer = mock_writer
+
+    mock_reader.feed(
+        b"?OutletStatus=1,0\n?PowerStatus=1.00,120.00,120.00,1\n?UPSConnection=0\n",
+        b"?UPSStatus=50,0,Good,False,25,True,False\n",
+    )
+
+    outlets, power, ups = await telnet_client.async_poll(
+        2, include_names=False, include_ups=True
+    )
+
+    assert [outlet.state for outlet in outlets] == [1, 0]
+    assert power.voltage == 120.0
+    assert ups.battery_charge == 50
+    mock_writer.write.assert_called_once_with(
+        b"?OutletStatus\r\n?PowerStatus\r\n?UPSConnection\r\n?UPSStatus\r\n"
+    )
+    await telnet_client.async_disconnect()
+
+
+@pytest.mark.asyncio
+async def test_outlet_status_push_notifies_listeners(
+    telnet_client: WattboxTelnetClient,
+    mock_reader,
+    mock_writer,
+) -> None:
+    """Test that unsolicited ~OutletStatus messages reach registered listeners."""
+    telnet_client._connected = True
+    telnet_client._reader = mock_reader
+    telnet_client._writer = mock_writer
+    telnet_client._set_outlets((OutletState.default(1), OutletState.default(2)))
+
+    received = asyncio.Event()
+    updates = []
+
+    def listener(outlets):
+        updates.append([outlet.state for outlet in outlets])
+        received.set()
+
+    remove_listener = telnet_client.add_outlet_status_listener(listener)
+    telnet_client._start_read_loop()
+    mock_reader.feed(b"~OutletStatus=1,0\n")
+
+    await asyncio.wait_for(received.wait(), timeout=1)
+    assert updates == [[1, 0]]
+
+    remove_listener()
+    assert telnet_client._outlet_status_listeners == []
+    await telnet_client.async_disconnect()
+
+
+def test_outlet_status_diffed_as_bitmask(telnet_client: WattboxTelnetClient) -> None:
+    """Test outlet states are diffed with one XOR and unchanged pushes dropped."""
+    telnet_client._set_outlets(tuple(OutletState.default(i) for i in range(1, 4)))
+    before = telnet_client.snapshot.outlets
+    updates = []
+    telnet_client.add_outlet_status_listener(updates.append)
+
+    assert telnet_client._parse_outlet_states("?OutletStatus=0,1,1") == 0b110
+    assert telnet_client._outlet_mask == 0b110
+    outlets = telnet_client.snapshot.outlets
+    assert [outlet.state for outlet in outlets] == [0, 1, 1]
+    # Unchanged outlets keep their records
+    assert outlets[0] is before[0]
+
+    # A push repeating the known states notifies nobody
+    telnet_client._handle_unsolicited("~OutletStatus=0,1,1")
+    assert updates == []
+    assert telnet_client.snapshot.outlets is outlets
+
+    telnet_client._handle_unsolicited("~OutletStatus=1,1,1")
+    assert [[outlet.state for outlet in pushed] for pushed in updates] == [[1, 1, 1]]
+
+
+@pytest.mark.asyncio
+async def test_read_loop_eof_fails_pending(
+    telnet_client: WattboxTelnetClient,
+    mock_reader,
+    mock_writer,
+) -> None:
+    """Test that losing the connection fails commands still in flight."""
+    telnet_client._connected = True
+    telnet_client._reader = mock_reader
+    telnet_client._writer = mock_writer
+
+    send = asyncio.ensure_future(
+        telnet_client.async_send_batch(["?OutletStatus", "?PowerStatus"])
+    )
+    mock_reader.feed(b"?OutletStatus=1,0\n", b"")
+
+    with pytest.raises(WattboxConnectionError, match="Connection closed"):
+        await send
+
+    assert telnet_client.is_connected is False
+    assert telnet_client._pending == []
+
+
+@pytest.mark.asyncio
+async def test_timeout_drops_connection(mock_reader, mock_writer) -> None:
+    """Test that a timed-out exchange cannot leak its reply to a later command."""
+    telnet_client = WattboxTelnetClient(
+        "192.168.1.100", "test_user", "test_password", timeout=0.05
+    )
+    telnet_client._connected = True
+    telnet_client._reader = mock_reader
+    telnet_client._writer = mock_writer
+
+    with pytest.raises(WattboxConnectionError, match="Timeout waiting"):
+        await telnet_client.async_send_command("?PowerStatus")
+
+    assert telnet_client.is_connected is False
+    assert telnet_client._read_task is None
+    mock_writer.close.assert_called_once()
+
+    # The late reply has nowhere to go and the next command must reconnect
+    mock_reader.feed(b"?PowerStatus=60.00,600.00,110.00,1\n")
+    with pytest.raises(WattboxConnectionError, match="Not connected"):
+        await telnet_client.async_send_command("?PowerStatus")
+    await telnet_client.async_disconnect()
+
+
+@pytest.mark.asyncio
+async def test_control_commands_jump_queued_telemetry(
+    telnet_client: WattboxTelnetClient,
+    mock_reader,
+    mock_writer,
+) -> None:
+    """Test that one exchange is on the wire at a time and control goes first."""
+    telnet_client._connected = True
+    telnet_client._reader = mock_reader
+    telnet_client._writer = mock_writer
+
+    poll = asyncio.ensure_future(telnet_client.async_send_command("?OutletStatus"))
+    await asyncio.sleep(0.01)
+    names = asyncio.ensure_future(telnet_client.async_send_command("?OutletName"))
+    toggle = asyncio.ensure_future(telnet_client.async_send_command("!OutletSet=3,OFF"))
+    await asyncio.sleep(0.01)
+
+    # Nothing else is written while the first exchange is in flight
+    assert mock_writer.write.call_count == 1
+
+    mock_reader.feed(b"?OutletStatus=1,1,1\n")
+    assert await poll == "?OutletStatus=1,1,1"
+    await asyncio.sleep(0.01)
+    mock_reader.feed(b"OK\n")
+    assert await toggle == "OK"
+    await asyncio.sleep(0.01)
+    mock_reader.feed(b"?OutletName={A},{B},{C}\n")
+    assert await names == "?OutletName={A},{B},{C}"
+
+    assert [call.args[0] for call in mock_writer.write.call_args_list] == [
+        b"?OutletStatus\r\n",
+        b"!OutletSet=3,OFF\r\n",
+        b"?OutletName\r\n",
+    ]
+    await telnet_client.async_disconnect()
+
+
+@pytest.mark.asyncio
+async def test_disconnect_fails_queued_commands(
+    telnet_client: WattboxTelnetClient,
+    mock_reader,
+    mock_writer,
+) -> None:
+    """Test that batches still queued fail when the client disconnects."""
+    telnet_client._connected = True
+    telnet_client._reader = mock_reader
+    telnet_client._writer = mock_writer
+
+    first = asyncio.ensure_future(telnet_client.async_send_command("?OutletStatus"))
+    queued = asyncio.ensure_future(telnet_client.async_send_command("?PowerStatus"))
+    await asyncio.sleep(0.01)
+
+    await telnet_client.async_disconnect()
+
+    for send in (first, queued):
+        with pytest.raises(WattboxConnectionError):
+            await send
+
+
+@pytest.mark.asyncio
+async def test_async_send_batch_empty(telnet_client: WattboxTelnetClient) -> None:
+    """Test that an empty batch sends nothing."""
+    telnet_client._connected = True
+
+    assert await telnet_client.async_send_batch([]) == []
 
 
 @pytest.mark.asyncio
@@ -352,11 +837,11 @@ async def test_get_power_status_success(telnet_client: WattboxTelnetClient) -> N
 
         mock_send.assert_called_once_with("?PowerStatus")
 
-        power_status = telnet_client._device_data["status_info"]["power_status"]
-        assert power_status["current"] == 60.0
-        assert power_status["power"] == 600.0
-        assert power_status["voltage"] == 110.0
-        assert power_status["safe_voltage"] == 1
+        power_status = telnet_client.snapshot.power
+        assert power_status.current == 60.0
+        assert power_status.power == 600.0
+        assert power_status.voltage == 110.0
+        assert power_status.safe_voltage == 1
 
 
 @pytest.mark.asyncio
@@ -370,11 +855,11 @@ async def test_get_power_status_failure(telnet_client: WattboxTelnetClient) -> N
         await telnet_client._get_power_status()
 
         # Should not raise exception, just log warning
-        power_status = telnet_client._device_data["status_info"]["power_status"]
-        assert power_status["current"] is None
-        assert power_status["power"] is None
-        assert power_status["voltage"] is None
-        assert power_status["safe_voltage"] is None
+        power_status = telnet_client.snapshot.power
+        assert power_status.current is None
+        assert power_status.power is None
+        assert power_status.voltage is None
+        assert power_status.safe_voltage is None
 
 
 @pytest.mark.asyncio
@@ -389,7 +874,7 @@ async def test_get_ups_connection_success(telnet_client: WattboxTelnetClient) ->
 
         mock_send.assert_called_once_with("?UPSConnection")
 
-        assert telnet_client._device_data["status_info"]["ups_connected"] is True
+        assert telnet_client.snapshot.ups.connected is True
 
 
 @pytest.mark.asyncio
@@ -404,7 +889,7 @@ async def test_get_ups_connection_disconnected(
 
         await telnet_client._get_ups_connection()
 
-        assert telnet_client._device_data["status_info"]["ups_connected"] is False
+        assert telnet_client.snapshot.ups.connected is False
 
 
 @pytest.mark.asyncio
@@ -418,7 +903,7 @@ async def test_get_ups_connection_failure(telnet_client: WattboxTelnetClient) ->
         await telnet_client._get_ups_connection()
 
         # Should not raise exception, just log warning
-        assert telnet_client._device_data["status_info"]["ups_connected"] is None
+        assert telnet_client.snapshot.ups.connected is None
 
 
 @pytest.mark.asyncio
@@ -433,14 +918,14 @@ async def test_get_ups_status_success(telnet_client: WattboxTelnetClient) -> Non
 
         mock_send.assert_called_once_with("?UPSStatus")
 
-        ups_status = telnet_client._device_data["status_info"]["ups_status"]
-        assert ups_status["battery_charge"] == 50
-        assert ups_status["battery_load"] == 0
-        assert ups_status["battery_health"] == "Good"
-        assert ups_status["power_lost"] is False
-        assert ups_status["battery_runtime"] == 25
-        assert ups_status["alarm_enabled"] is True
-        assert ups_status["alarm_muted"] is False
+        ups_status = telnet_client.snapshot.ups
+        assert ups_status.battery_charge == 50
+        assert ups_status.battery_load == 0
+        assert ups_status.battery_health == "Good"
+        assert ups_status.power_lost is False
+        assert ups_status.battery_runtime == 25
+        assert ups_status.alarm_enabled is True
+        assert ups_status.alarm_muted is False
 
 
 @pytest.mark.asyncio
@@ -453,14 +938,14 @@ async def test_get_ups_status_power_lost(telnet_client: WattboxTelnetClient) ->
 
         await telnet_client._get_ups_status()
 
-        ups_status = telnet_client._device_data["status_info"]["ups_status"]
-        assert ups_status["battery_charge"] == 30
-        assert ups_status["battery_load"] == 80
-        assert ups_status["battery_health"] == "Bad"
-        assert ups_status["power_lost"] is True
-        assert ups_status["battery_runtime"] == 10
-        assert ups_status["alarm_enabled"] is True
-        assert ups_status["alarm_muted"] is False
+        ups_status = telnet_client.snapshot.ups
+        assert ups_status.battery_charge == 30
+        assert ups_status.battery_load == 80
+        assert ups_status.battery_health == "Bad"
+        assert ups_status.power_lost is True
+        assert ups_status.battery_runtime == 10
+        assert ups_status.alarm_enabled is True
+        assert ups_status.alarm_muted is False
 
 
 @pytest.mark.asyncio
@@ -474,14 +959,14 @@ async def test_get_ups_status_failure(telnet_client: WattboxTelnetClient) -> Non
         await telnet_client._get_ups_status()
 
         # Should not raise exception, just log warning
-        ups_status = telnet_client._device_data["status_info"]["ups_status"]
-        assert ups_status["battery_charge"] is None
-        assert ups_status["battery_load"] is None
-        assert ups_status["battery_health"] is None
-        assert ups_status["power_lost"] is None
-        assert ups_status["battery_runtime"] is None
-        assert ups_status["alarm_enabled"] is None
-        assert ups_status["alarm_muted"] is None
+        ups_status = telnet_client.snapshot.ups
+        assert ups_status.battery_charge is None
+        assert ups_status.battery_load is None
+        assert ups_status.battery_health is None
+        assert ups_status.power_lost is None
+        assert ups_status.battery_runtime is None
+        assert ups_status.alarm_enabled is None
+        assert ups_status.alarm_muted is None
 
 
 @pytest.mark.asyncio
@@ -518,28 +1003,11 @@ async def test_get_outlet_names_invalid_response(
         assert mock_send.call_count == 1
 
 
-def test_device_data_structure(telnet_client: WattboxTelnetClient) -> None:
-    """Test that device_data has the correct structure for status monitoring."""
-    device_data = telnet_client.device_data
-
-    assert "status_info" in device_data
-    assert "power_status" in device_data["status_info"]
-    assert "ups_status" in device_data["status_info"]
-    assert "ups_connected" in device_data["status_info"]
-
-    # Check power_status structure
-    power_status = device_data["status_info"]["power_status"]
-    assert "current" in power_status
-    assert "power" in power_status
-    assert "voltage" in power_status
-    assert "safe_voltage" in power_status
-
-    # Check ups_status structure
-    ups_status = device_data["status_info"]["ups_status"]
-    assert "battery_charge" in ups_status
-    assert "battery_load" in ups_status
-    assert "battery_health" in ups_status
-    assert "power_lost" in ups_status
-    assert "battery_runtime" in ups_status
-    assert "alarm_enabled" in ups_status
-    assert "alarm_muted" in ups_status
+def test_snapshot_structure(telnet_client: WattboxTelnetClient) -> None:
+    """Test that the snapshot starts with empty status monitoring records."""
+    snapshot = telnet_client.snapshot
+
+    assert snapshot.power == PowerStatus.unknown()
+    assert snapshot.ups == UPSStatus.unknown()
+    assert snapshot.power.safe_voltage is None
+    assert snapshot.ups.battery_runtime is None